@@ -3,7 +3,8 @@
 Orchestrates the full build pipeline:
   1. Build the React frontend (``npm run build`` in ``ui/``).
   2. Verify the UI distribution output exists in ``src/cecil/ui_dist/``.
-  3. Invoke PyInstaller with ``cecil.spec`` to produce the signed binary.
+  3. Write precompressed ``.br``/``.gz`` siblings for the UI assets.
+  4. Invoke PyInstaller with ``cecil.spec`` to produce the signed binary.
 
 Usage:
     python scripts/build.py [--skip-frontend] [--skip-pyinstaller]
@@ -154,6 +155,28 @@ def build_frontend() -> None:
     logger.info("Frontend build complete: %d files in %s", file_count, UI_DIST_DIR)
 
 
+def precompress_ui_assets() -> None:
+    """Write compressed siblings for the bundled UI assets.
+
+    The server only serves siblings that already exist, so they are
+    generated here, once per build, and bundled with the binary.
+    Brotli siblings require the optional ``brotli`` package in the build
+    environment; gzip siblings are always written.
+    """
+    assets_dir = UI_DIST_DIR / "assets"
+    if not assets_dir.is_dir():
+        logger.info("No UI assets at %s; skipping precompression.", assets_dir)
+        return
+
+    from cecil.api.static import precompress_assets
+
+    precompress_assets(assets_dir)
+    sibling_count = sum(1 for _ in assets_dir.rglob("*.gz")) + sum(
+        1 for _ in assets_dir.rglob("*.br")
+    )
+    logger.info("Precompressed UI assets: %d siblings in %s", sibling_count, assets_dir)
+
+
 def build_pyinstaller() -> None:
     """Invoke PyInstaller using the spec file to produce the binary.
 
@@ -237,6 +260,8 @@ def main(argv: list[str] | None = None) -> None:
     else:
         logger.info("Skipping frontend build (--skip-frontend)")
 
+    precompress_ui_assets()
+
     if not args.skip_pyinstaller:
         build_pyinstaller()
     else:
@@ -0,0 +1,33 @@
+"""Shared HTTP client for CLI-to-server IPC calls.
+
+The IPC server only ever listens on loopback, so a single process-wide
+``httpx.Client`` is kept and reused for every internal request.  Its
+connection pool keeps HTTP/1.1 connections alive across calls, which
+saves a ``socket()``/``connect()``/``close()`` per request.
+"""
+
+from __future__ import annotations
+
+import atexit
+import functools
+
+import httpx
+
+
+# Loopback connects either succeed or are refused almost immediately.
+_IPC_TIMEOUT = httpx.Timeout(1.0, connect=0.25)
+_IPC_LIMITS = httpx.Limits(max_keepalive_connections=4, max_connections=8)
+
+
+@functools.lru_cache(maxsize=1)
+def get_ipc_client() -> httpx.Client:
+    """Return the process-wide IPC client, creating it on first use.
+
+    The client is closed automatically at interpreter exit.
+
+    Returns:
+        The shared ``httpx.Client``.
+    """
+    client = httpx.Client(timeout=_IPC_TIMEOUT, limits=_IPC_LIMITS)
+    atexit.register(client.close)
+    return client
@@ -0,0 +1,108 @@
+"""ASGI middleware for the Cecil IPC server.
+
+Provides ``ETagMiddleware``, which tags successful ``GET`` responses
+under ``/api/`` with a content-hash ``ETag`` and answers matching
+``If-None-Match`` requests with ``304 Not Modified`` so the UI's
+repeated polls of unchanged resources do not re-transfer the body.
+"""
+
+from __future__ import annotations
+
+import hashlib
+
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+
+def _compute_etag(body: bytes) -> str:
+    """Return a strong ETag value for a response body.
+
+    Args:
+        body: The complete response body.
+
+    Returns:
+        A quoted 16-hex-digit BLAKE2b digest of the body.
+    """
+    return f'"{hashlib.blake2b(body, digest_size=8).hexdigest()}"'
+
+
+def _etag_matches(etag: str, if_none_match: str) -> bool:
+    """Check an ``If-None-Match`` header value against an ETag.
+
+    Args:
+        etag: The ETag computed for the current response.
+        if_none_match: The raw ``If-None-Match`` request header.
+
+    Returns:
+        ``True`` if the header lists the ETag (weak comparison) or ``*``.
+    """
+    for candidate in if_none_match.split(","):
+        candidate = candidate.strip().removeprefix("W/")
+        if candidate in (etag, "*"):
+            return True
+    return False
+
+
+class ETagMiddleware:
+    """Add content-hash ETags and conditional ``304`` responses to API GETs.
+
+    Only ``GET`` requests whose path starts with ``path_prefix`` and whose
+    response status is ``200`` are buffered and tagged; everything else
+    (WebSockets, static assets, errors, non-GET methods) passes through
+    untouched.
+
+    Args:
+        app: The wrapped ASGI application.
+        path_prefix: URL path prefix of the responses to tag.
+    """
+
+    def __init__(self, app: ASGIApp, path_prefix: str = "/api/") -> None:
+        self.app = app
+        self._path_prefix = path_prefix
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """Handle an ASGI connection, tagging eligible responses."""
+        if (
+            scope["type"] != "http"
+            or scope["method"] != "GET"
+            or not scope["path"].startswith(self._path_prefix)
+        ):
+            await self.app(scope, receive, send)
+            return
+
+        if_none_match = Headers(scope=scope).get("if-none-match")
+        start_message: Message | None = None
+        body_parts: list[bytes] = []
+
+        async def send_with_etag(message: Message) -> None:
+            nonlocal start_message
+            if message["type"] == "http.response.start":
+                if message["status"] != 200:
+                    await send(message)
+                    return
+                start_message = message
+                return
+
+            if start_message is None or message["type"] != "http.response.body":
+                await send(message)
+                return
+
+            body_parts.append(message.get("body", b""))
+            if message.get("more_body", False):
+                return
+
+            body = b"".join(body_parts)
+            etag = _compute_etag(body)
+            headers = MutableHeaders(scope=start_message)
+            headers["etag"] = etag
+
+            if if_none_match is not None and _etag_matches(etag, if_none_match):
+                del headers["content-length"]
+                del headers["content-type"]
+                start_message["status"] = 304
+                body = b""
+
+            await send(start_message)
+            await send({"type": "http.response.body", "body": body})
+
+        await self.app(scope, receive, send_with_etag)
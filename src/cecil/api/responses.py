@@ -0,0 +1,83 @@
+"""Content-negotiated API responses.
+
+Provides ``MsgpackResponse`` and the ``accepts_msgpack`` dependency used
+by endpoints that return large lists (directory listings, mapping
+previews) to serve binary msgpack bodies to clients that ask for them
+via ``Accept: application/x-msgpack``.  JSON remains the default, and
+msgpack is only offered when the optional ``msgpack`` package is
+installed.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Sequence
+from typing import Any, TypeVar
+
+from fastapi import Request, Response
+from pydantic import BaseModel
+
+
+try:
+    import msgpack
+except ImportError:  # pragma: no cover - optional dependency
+    msgpack = None
+
+
+MSGPACK_MEDIA_TYPE = "application/x-msgpack"
+
+_ContentT = TypeVar("_ContentT", bound=BaseModel | Sequence[BaseModel])
+
+
+class MsgpackResponse(Response):
+    """Response whose body is the msgpack encoding of its content."""
+
+    media_type = MSGPACK_MEDIA_TYPE
+
+    def render(self, content: Any) -> bytes:
+        """Encode the response content as msgpack.
+
+        Args:
+            content: JSON-compatible Python data to encode.
+
+        Returns:
+            The msgpack-encoded body.
+        """
+        packed: bytes = msgpack.packb(content, use_bin_type=True)
+        return packed
+
+
+def accepts_msgpack(request: Request) -> bool:
+    """Report whether the client asked for a msgpack response body.
+
+    Intended for use as a FastAPI dependency.
+
+    Args:
+        request: The incoming HTTP request.
+
+    Returns:
+        ``True`` if ``msgpack`` is installed and the ``Accept`` header
+        lists ``application/x-msgpack``, otherwise ``False``.
+    """
+    return msgpack is not None and MSGPACK_MEDIA_TYPE in request.headers.get("accept", "")
+
+
+def negotiate_response(
+    content: _ContentT,
+    use_msgpack: bool,
+) -> _ContentT | MsgpackResponse:
+    """Return *content* unchanged or wrapped in a ``MsgpackResponse``.
+
+    Args:
+        content: A response model, or a sequence of them, produced by
+            the endpoint.
+        use_msgpack: Result of the ``accepts_msgpack`` dependency.
+
+    Returns:
+        The original content, left for FastAPI to serialise as JSON, or
+        a ``MsgpackResponse`` carrying the same JSON-mode payload.
+    """
+    if not use_msgpack:
+        return content
+    if isinstance(content, BaseModel):
+        return MsgpackResponse(content.model_dump(mode="json"))
+    return MsgpackResponse([item.model_dump(mode="json") for item in content])
@@ -17,13 +17,14 @@ import tempfile
 from datetime import UTC, datetime
 from pathlib import Path
 
-from fastapi import APIRouter, Query, UploadFile
+from fastapi import APIRouter, Depends, Query, Response, UploadFile
 from fastapi.responses import JSONResponse
 
+from cecil.api.responses import accepts_msgpack, negotiate_response
 from cecil.api.schemas import (
+    EXTENSION_FORMAT_MAP,
     BrowseResponse,
     ErrorResponse,
-    FileFormat,
     FilesystemEntry,
     OpenDirectoryRequest,
     OpenDirectoryResponse,
@@ -38,15 +39,8 @@ logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/api/v1/filesystem", tags=["filesystem"])
 
-# Mapping of file extensions to supported FileFormat values.
-_EXTENSION_FORMAT_MAP: dict[str, FileFormat] = {
-    ".jsonl": FileFormat.JSONL,
-    ".csv": FileFormat.CSV,
-    ".parquet": FileFormat.PARQUET,
-}
-
 # Supported file extensions for filtered mode (show_all=false).
-_SUPPORTED_EXTENSIONS: frozenset[str] = frozenset(_EXTENSION_FORMAT_MAP.keys())
+_SUPPORTED_EXTENSIONS: frozenset[str] = frozenset(EXTENSION_FORMAT_MAP.keys())
 
 
 def _get_default_path() -> str:
@@ -109,7 +103,7 @@ def _build_entry(entry_path: Path) -> FilesystemEntry | None:
 
     is_dir = entry_path.is_dir()
     suffix = entry_path.suffix.lower()
-    detected_format = _EXTENSION_FORMAT_MAP.get(suffix) if not is_dir else None
+    detected_format = EXTENSION_FORMAT_MAP.get(suffix) if not is_dir else None
 
     is_readable = os.access(entry_path, os.R_OK)
 
@@ -118,7 +112,9 @@ def _build_entry(entry_path: Path) -> FilesystemEntry | None:
     except (OSError, ValueError):
         modified = None
 
-    return FilesystemEntry(
+    # All fields are computed here from the path and its stat result, so
+    # skip validation; this runs once per directory entry during browse.
+    return FilesystemEntry.model_construct(
         name=entry_path.name,
         path=str(entry_path),
         size=stat.st_size if not is_dir else None,
@@ -129,46 +125,23 @@ def _build_entry(entry_path: Path) -> FilesystemEntry | None:
     )
 
 
-@router.get(
-    "/browse",
-    response_model=BrowseResponse,
-)
-async def browse_filesystem(
-    path: str | None = Query(
-        default=None,
-        description="Directory path to browse (defaults to home directory)",
-    ),
-    show_all: bool = Query(
-        default=False,
-        description="Show all files, not just supported formats",
-    ),
-) -> BrowseResponse:
-    """List contents of a directory for the file browser.
-
-    Returns directories and files separately, sorted alphabetically.
-    By default only shows files with supported extensions (.jsonl, .csv,
-    .parquet).  Hidden files (dotfiles) are excluded unless ``show_all``
-    is ``True``.
-
-    Security: Blocks path traversal (``..``), validates that resolved
-    paths are real directories, and excludes broken symlinks.
+def _list_directory(browse_path: str, show_all: bool) -> BrowseResponse:
+    """Build the browse listing for a single directory.
 
     Args:
-        path: Directory to browse.  Defaults to the user's home directory.
+        browse_path: Directory to list, as supplied by the client.
         show_all: If ``True``, include all files regardless of extension.
 
     Returns:
         A BrowseResponse with directories and files, or an error message.
     """
-    browse_path = path if path is not None else _get_default_path()
-
     # Security: block path traversal.
     if _is_path_traversal(browse_path):
         logger.warning(
             "Path traversal attempt blocked in filesystem browse",
             extra={"path_parts_count": len(Path(browse_path).parts)},
         )
-        return BrowseResponse(
+        return BrowseResponse.model_construct(
             current_path=browse_path,
             error="Path traversal is not allowed",
         )
@@ -179,20 +152,20 @@ async def browse_filesystem(
     try:
         resolved = target.resolve(strict=True)
     except OSError:
-        return BrowseResponse(
+        return BrowseResponse.model_construct(
             current_path=browse_path,
             error="Directory does not exist or is not accessible",
         )
 
     if not resolved.is_dir():
-        return BrowseResponse(
+        return BrowseResponse.model_construct(
             current_path=str(resolved),
             error="Path is not a directory",
         )
 
     # Check read permission.
     if not os.access(resolved, os.R_OK):
-        return BrowseResponse(
+        return BrowseResponse.model_construct(
             current_path=str(resolved),
             error="Permission denied",
         )
@@ -207,7 +180,7 @@ async def browse_filesystem(
     try:
         entries = sorted(resolved.iterdir(), key=lambda p: p.name.lower())
     except PermissionError:
-        return BrowseResponse(
+        return BrowseResponse.model_construct(
             current_path=str(resolved),
             parent_path=parent_path,
             error="Permission denied reading directory contents",
@@ -225,11 +198,10 @@ async def browse_filesystem(
         if entry.is_directory:
             directories.append(entry)
         else:
-            # In filtered mode, only include supported file types.
-            if not show_all:
-                suffix = entry_path.suffix.lower()
-                if suffix not in _SUPPORTED_EXTENSIONS:
-                    continue
+            # In filtered mode, only include supported file types.  The
+            # entry's format is already resolved from its extension.
+            if not show_all and entry.format is None:
+                continue
             files.append(entry)
 
     logger.info(
@@ -240,7 +212,7 @@ async def browse_filesystem(
         },
     )
 
-    return BrowseResponse(
+    return BrowseResponse.model_construct(
         current_path=str(resolved),
         parent_path=parent_path,
         directories=directories,
@@ -248,6 +220,44 @@ async def browse_filesystem(
     )
 
 
+@router.get(
+    "/browse",
+    response_model=BrowseResponse,
+)
+async def browse_filesystem(
+    path: str | None = Query(
+        default=None,
+        description="Directory path to browse (defaults to home directory)",
+    ),
+    show_all: bool = Query(
+        default=False,
+        description="Show all files, not just supported formats",
+    ),
+    use_msgpack: bool = Depends(accepts_msgpack),
+) -> BrowseResponse | Response:
+    """List contents of a directory for the file browser.
+
+    Returns directories and files separately, sorted alphabetically.
+    By default only shows files with supported extensions (.jsonl, .csv,
+    .parquet).  Hidden files (dotfiles) are excluded unless ``show_all``
+    is ``True``.
+
+    Security: Blocks path traversal (``..``), validates that resolved
+    paths are real directories, and excludes broken symlinks.
+
+    Args:
+        path: Directory to browse.  Defaults to the user's home directory.
+        show_all: If ``True``, include all files regardless of extension.
+        use_msgpack: Whether to encode the response as msgpack, resolved
+            from the ``Accept`` header.
+
+    Returns:
+        A BrowseResponse with directories and files, or an error message.
+    """
+    browse_path = path if path is not None else _get_default_path()
+    return negotiate_response(_list_directory(browse_path, show_all), use_msgpack)
+
+
 # Persistent upload directory for the current process.  Created once on
 # first upload and reused for all subsequent uploads.
 _upload_dir: Path | None = None
@@ -304,7 +314,7 @@ async def upload_files(
 
         # Validate extension.
         suffix = Path(safe_name).suffix.lower()
-        detected_format = _EXTENSION_FORMAT_MAP.get(suffix)
+        detected_format = EXTENSION_FORMAT_MAP.get(suffix)
         if detected_format is None:
             errors.append(
                 f"Unsupported file format for '{safe_name}'. "
@@ -16,9 +16,10 @@ from typing import Any
 from uuid import uuid4
 
 import yaml
-from fastapi import APIRouter, Response
+from fastapi import APIRouter, Depends, Response
 from fastapi.responses import JSONResponse
 
+from cecil.api.responses import accepts_msgpack, negotiate_response
 from cecil.api.schemas import (
     ErrorResponse,
     FieldMappingEntrySchema,
@@ -411,13 +412,19 @@ async def create_mapping(
     "/",
     response_model=list[MappingConfigResponse],
 )
-async def list_mappings() -> list[MappingConfigResponse]:
+async def list_mappings(
+    use_msgpack: bool = Depends(accepts_msgpack),
+) -> list[MappingConfigResponse] | Response:
     """List all saved mapping configurations.
 
+    Args:
+        use_msgpack: Whether to encode the response as msgpack, resolved
+            from the ``Accept`` header.
+
     Returns:
         A list of MappingConfigResponse objects for all stored mappings.
     """
-    return [
+    mappings = [
         _config_to_response(
             state.mapping_id,
             state.config,
@@ -429,6 +436,7 @@ async def list_mappings() -> list[MappingConfigResponse]:
         )
         for state in _mapping_store.values()
     ]
+    return negotiate_response(mappings, use_msgpack)
 
 
 @router.post(
@@ -603,11 +611,16 @@ async def load_mapping_yaml_content(
     response_model=MappingConfigResponse,
     responses={404: {"model": ErrorResponse}},
 )
-async def get_mapping(mapping_id: str) -> MappingConfigResponse | JSONResponse:
+async def get_mapping(
+    mapping_id: str,
+    use_msgpack: bool = Depends(accepts_msgpack),
+) -> MappingConfigResponse | Response:
     """Retrieve a mapping configuration by ID.
 
     Args:
         mapping_id: The unique mapping identifier.
+        use_msgpack: Whether to encode the response as msgpack, resolved
+            from the ``Accept`` header.
 
     Returns:
         A MappingConfigResponse, or 404 if not found.
@@ -621,14 +634,17 @@ async def get_mapping(mapping_id: str) -> MappingConfigResponse | JSONResponse:
                 message="No mapping found with the given ID",
             ).model_dump(),
         )
-    return _config_to_response(
-        state.mapping_id,
-        state.config,
-        state.created_at,
-        state.yaml_path,
-        state.name,
-        state.source_format,
-        state.source_path,
+    return negotiate_response(
+        _config_to_response(
+            state.mapping_id,
+            state.config,
+            state.created_at,
+            state.yaml_path,
+            state.name,
+            state.source_format,
+            state.source_path,
+        ),
+        use_msgpack,
     )
 
 
@@ -815,7 +831,10 @@ async def validate_mapping(
     "/preview",
     response_model=FieldPreviewResponse,
 )
-async def preview_mapping(request: FieldPreviewRequest) -> FieldPreviewResponse:
+async def preview_mapping(
+    request: FieldPreviewRequest,
+    use_msgpack: bool = Depends(accepts_msgpack),
+) -> FieldPreviewResponse | Response:
     """Preview redaction actions on sample data.
 
     For each field in the sample record that has a mapping entry,
@@ -824,6 +843,8 @@ async def preview_mapping(request: FieldPreviewRequest) -> FieldPreviewResponse:
 
     Args:
         request: The field mappings and sample record to preview.
+        use_msgpack: Whether to encode the response as msgpack, resolved
+            from the ``Accept`` header.
 
     Returns:
         A FieldPreviewResponse with preview entries.
@@ -845,7 +866,7 @@ async def preview_mapping(request: FieldPreviewRequest) -> FieldPreviewResponse:
         )
 
         entries.append(
-            FieldPreviewEntry(
+            FieldPreviewEntry.model_construct(
                 field_name=field_name,
                 original=truncated_value,
                 transformed=transformed,
@@ -853,7 +874,10 @@ async def preview_mapping(request: FieldPreviewRequest) -> FieldPreviewResponse:
             ),
         )
 
-    return FieldPreviewResponse(entries=entries)
+    return negotiate_response(
+        FieldPreviewResponse.model_construct(entries=entries),
+        use_msgpack,
+    )
 
 
 @router.post(
@@ -11,16 +11,19 @@ from __future__ import annotations
 import asyncio
 import logging
 import threading
+import time
 from dataclasses import dataclass, field
 from datetime import UTC, datetime
-from pathlib import Path
+from pathlib import Path, PurePath
 from uuid import uuid4
 
 from fastapi import APIRouter, BackgroundTasks, WebSocket, WebSocketDisconnect
 from fastapi.responses import JSONResponse
 
 from cecil.api.routes.jobs import _persist_job
+from cecil.api.routes.mappings import _mapping_store
 from cecil.api.schemas import (
+    EXTENSION_FORMAT_MAP,
     ErrorResponse,
     FileFormat,
     SanitizeRequest,
@@ -39,16 +42,24 @@ from cecil.core.sanitizer.strategies import StrictStrategy
 from cecil.utils.errors import CecilError
 
 
+try:
+    import msgpack
+except ImportError:  # pragma: no cover - optional dependency
+    msgpack = None
+
+
 logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/api/v1/scans", tags=["scans"])
 
-# Mapping of file extensions to supported FileFormat enum values.
-_EXTENSION_FORMAT_MAP: dict[str, FileFormat] = {
-    ".jsonl": FileFormat.JSONL,
-    ".csv": FileFormat.CSV,
-    ".parquet": FileFormat.PARQUET,
-}
+# Number of sanitized records between copies of the engine counters onto
+# the shared ``ScanState``.  Progress readers poll every 500ms, so syncing
+# on every record only adds attribute stores to the hot loop.
+_PROGRESS_SYNC_INTERVAL = 256
+
+# WebSocket subprotocol a client may offer to receive progress updates
+# as binary msgpack frames instead of JSON text frames.
+_MSGPACK_SUBPROTOCOL = "msgpack"
 
 
 @dataclass
@@ -70,6 +81,7 @@ class ScanState:
     output_path: str | None = None
     records_sanitized: int = 0
     records_failed: int = 0
+    start_monotonic: float = field(default_factory=time.monotonic)
     _cancel_event: threading.Event = field(default_factory=threading.Event)
 
 
@@ -80,13 +92,16 @@ _scan_store: dict[str, ScanState] = {}
 def _scan_state_to_response(state: ScanState) -> ScanResponse:
     """Convert a ScanState dataclass to a ScanResponse Pydantic model.
 
+    The state is built and owned by the server, so the response is
+    constructed without re-running field validation.
+
     Args:
         state: The internal scan state to convert.
 
     Returns:
         A ScanResponse suitable for API serialization.
     """
-    return ScanResponse(
+    return ScanResponse.model_construct(
         scan_id=state.scan_id,
         status=state.status,
         source=state.source,
@@ -94,7 +109,7 @@ def _scan_state_to_response(state: ScanState) -> ScanResponse:
         created_at=state.created_at,
         records_processed=state.records_processed,
         records_redacted=state.records_redacted,
-        errors=state.errors,
+        errors=list(state.errors),
     )
 
 
@@ -186,11 +201,12 @@ async def create_scan(
         A ScanResponse with the new scan's metadata, or a JSONResponse
         with an error payload for validation failures.
     """
-    # Path traversal check.
-    if ".." in Path(request.source).parts:
+    # Path traversal check (purely syntactic, so no filesystem access).
+    source_parts = PurePath(request.source).parts
+    if ".." in source_parts:
         logger.warning(
             "Path traversal attempt blocked",
-            extra={"source_parts_count": len(Path(request.source).parts)},
+            extra={"source_parts_count": len(source_parts)},
         )
         return JSONResponse(
             status_code=403,
@@ -216,7 +232,7 @@ async def create_scan(
         file_format = request.file_format
     else:
         suffix = resolved.suffix.lower()
-        detected = _EXTENSION_FORMAT_MAP.get(suffix)
+        detected = EXTENSION_FORMAT_MAP.get(suffix)
         if detected is None:
             return JSONResponse(
                 status_code=422,
@@ -228,7 +244,7 @@ async def create_scan(
         file_format = detected
 
     # Create scan state.
-    scan_id = str(uuid4())
+    scan_id = uuid4().hex
     state = ScanState(
         scan_id=scan_id,
         status=ScanStatus.PENDING,
@@ -258,6 +274,28 @@ async def create_scan(
     return _scan_state_to_response(state)
 
 
+def _sync_sanitize_counters(
+    state: ScanState,
+    engine: SanitizationEngine,
+    records_written: int,
+) -> None:
+    """Copy the record counters onto the scan state.
+
+    The sanitized count is the number of records written to the output
+    file rather than the engine's own counter, which already includes a
+    record the loop stopped before writing (on cancellation or a write
+    error).
+
+    Args:
+        state: The scan state exposed to progress readers.
+        engine: The sanitization engine owning the failure counter.
+        records_written: Sanitized records written to the output file.
+    """
+    state.records_sanitized = records_written
+    state.records_failed = engine.records_failed
+    state.records_processed = records_written + engine.records_failed
+
+
 def _execute_sanitize(
     scan_id: str,
     source: str,
@@ -288,6 +326,8 @@ def _execute_sanitize(
 
     writer: JsonlWriter | None = None
     provider = None
+    engine: SanitizationEngine | None = None
+    records_written = 0
 
     try:
         provider = get_provider("local_file", file_path=source, format_hint=file_format.value)
@@ -296,7 +336,9 @@ def _execute_sanitize(
         writer = JsonlWriter(Path(output_path))
 
         provider.connect()
-        for sanitized_record in engine.process_stream(provider.stream_records()):
+        for count, sanitized_record in enumerate(
+            engine.process_stream(provider.stream_records()), start=1
+        ):
             # Check for cancellation before processing each record.
             if state._cancel_event.is_set():
                 state.status = ScanStatus.CANCELLED
@@ -307,14 +349,12 @@ def _execute_sanitize(
                 return
 
             writer.write_record(sanitized_record.data)
-            state.records_processed = engine.records_processed
-            state.records_sanitized = engine.records_sanitized
-            state.records_failed = engine.records_failed
+            records_written = count
+            if count % _PROGRESS_SYNC_INTERVAL == 0:
+                _sync_sanitize_counters(state, engine, records_written)
 
+        _sync_sanitize_counters(state, engine, records_written)
         state.status = ScanStatus.COMPLETED
-        state.records_processed = engine.records_processed
-        state.records_sanitized = engine.records_sanitized
-        state.records_failed = engine.records_failed
         logger.info(
             "Sanitization completed",
             extra={
@@ -345,6 +385,8 @@ def _execute_sanitize(
             writer.close()
         if provider is not None:
             provider.close()
+        if engine is not None:
+            _sync_sanitize_counters(state, engine, records_written)
 
         # Persist the job record to disk.
         _persist_job(
@@ -394,7 +436,7 @@ async def sanitize(
         JSONResponse with an error payload for validation failures.
     """
     # Path traversal check.
-    if ".." in Path(request.source).parts:
+    if ".." in PurePath(request.source).parts:
         return JSONResponse(
             status_code=403,
             content=ErrorResponse(
@@ -419,8 +461,6 @@ async def sanitize(
     mapping_id: str | None = None
     mapping_name: str | None = None
     if request.mapping_id:
-        from cecil.api.routes.mappings import _mapping_store
-
         mapping_state = _mapping_store.get(request.mapping_id)
         if mapping_state is None:
             return JSONResponse(
@@ -456,7 +496,7 @@ async def sanitize(
 
     # Resolve file format.
     suffix = resolved.suffix.lower()
-    detected = _EXTENSION_FORMAT_MAP.get(suffix)
+    detected = EXTENSION_FORMAT_MAP.get(suffix)
     if detected is None:
         return JSONResponse(
             status_code=422,
@@ -469,7 +509,7 @@ async def sanitize(
     # Build output path (expand tilde).
     # Include the scan ID so each run gets its own unique file.
     output_dir = Path(request.output_dir).expanduser().resolve()
-    scan_id = str(uuid4())
+    scan_id = uuid4().hex
     output_path = output_dir / f"{resolved.stem}_sanitized_{scan_id[:8]}.jsonl"
 
     # Ensure output directory exists.
@@ -507,7 +547,7 @@ async def sanitize(
         mapping_name,
     )
 
-    return SanitizeResponse(
+    return SanitizeResponse.model_construct(
         scan_id=scan_id,
         status=state.status,
         source=str(resolved),
@@ -605,6 +645,10 @@ async def scan_progress_ws(websocket: WebSocket, scan_id: str) -> None:
     closes the connection.  If the scan ID is unknown the WebSocket
     is closed immediately with code 4004.
 
+    Clients that offer the ``msgpack`` subprotocol receive the same
+    payload as binary msgpack frames instead, provided the optional
+    ``msgpack`` package is installed.
+
     Args:
         websocket: The incoming WebSocket connection.
         scan_id: The unique scan identifier to monitor.
@@ -614,11 +658,14 @@ async def scan_progress_ws(websocket: WebSocket, scan_id: str) -> None:
         await websocket.close(code=4004, reason="Scan not found")
         return
 
-    await websocket.accept()
+    use_msgpack = msgpack is not None and _MSGPACK_SUBPROTOCOL in websocket.scope.get(
+        "subprotocols", []
+    )
+    await websocket.accept(subprotocol=_MSGPACK_SUBPROTOCOL if use_msgpack else None)
     try:
         while True:
-            elapsed = (datetime.now(tz=UTC) - state.created_at).total_seconds()
-            progress = ScanProgress(
+            elapsed = time.monotonic() - state.start_monotonic
+            progress = ScanProgress.model_construct(
                 scan_id=state.scan_id,
                 status=state.status,
                 records_processed=state.records_processed,
@@ -627,7 +674,14 @@ async def scan_progress_ws(websocket: WebSocket, scan_id: str) -> None:
                 elapsed_seconds=elapsed,
                 error_type=state.errors[0] if state.errors else None,
             )
-            await websocket.send_json(progress.model_dump())
+            if use_msgpack:
+                await websocket.send_bytes(
+                    msgpack.packb(progress.model_dump(mode="json"), use_bin_type=True)
+                )
+            else:
+                # Serialise in pydantic-core rather than via ``send_json``,
+                # which round-trips the dumped dict through stdlib ``json``.
+                await websocket.send_text(progress.model_dump_json())
 
             if state.status in (ScanStatus.COMPLETED, ScanStatus.FAILED, ScanStatus.CANCELLED):
                 break
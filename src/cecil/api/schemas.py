@@ -1,15 +1,20 @@
 """API request and response schemas.
 
 Defines Pydantic v2 models used by FastAPI endpoints for request
-validation and response serialization.
-"""
+validation and response serialization.  Models backing rarely used
+endpoints set ``defer_build=True`` so their validators are only built
+on first use rather than at import time.
 
-from __future__ import annotations
+Unlike the rest of the package this module does not use
+``from __future__ import annotations``: eagerly evaluated annotations let
+pydantic build schemas from the real types instead of resolving strings.
+"""
 
 from datetime import datetime
 from enum import StrEnum
+from typing import Literal
 
-from pydantic import BaseModel, Field, field_validator
+from pydantic import BaseModel, ConfigDict, Field, field_validator
 
 
 class HealthResponse(BaseModel):
@@ -38,6 +43,14 @@ class FileFormat(StrEnum):
     PARQUET = "parquet"
 
 
+# File extension -> supported format, shared by the filesystem and scan routes.
+EXTENSION_FORMAT_MAP: dict[str, FileFormat] = {
+    ".jsonl": FileFormat.JSONL,
+    ".csv": FileFormat.CSV,
+    ".parquet": FileFormat.PARQUET,
+}
+
+
 class ScanStatus(StrEnum):
     """Status values for scan operations."""
 
@@ -48,6 +61,14 @@ class ScanStatus(StrEnum):
     CANCELLED = "cancelled"
 
 
+# Literal counterparts of the enums above, used as field types on the
+# high-frequency scan response models.  pydantic validates and serialises
+# a ``Literal`` with a plain set lookup instead of enum coercion, and
+# ``StrEnum`` members still compare (and hash) equal to these strings.
+FileFormatValue = Literal["jsonl", "csv", "parquet"]
+ScanStatusValue = Literal["pending", "running", "completed", "failed", "cancelled"]
+
+
 class ScanRequest(BaseModel):
     """Request payload for initiating a new scan."""
 
@@ -81,10 +102,10 @@ class ScanRequest(BaseModel):
 class ScanResponse(BaseModel):
     """Response payload for scan operations."""
 
-    scan_id: str = Field(description="Unique scan identifier (UUID)")
-    status: ScanStatus = Field(description="Current scan status")
+    scan_id: str = Field(description="Unique scan identifier (UUID hex)")
+    status: ScanStatusValue = Field(description="Current scan status")
     source: str = Field(description="Source identifier used for this scan")
-    file_format: FileFormat = Field(description="File format used for this scan")
+    file_format: FileFormatValue = Field(description="File format used for this scan")
     created_at: datetime = Field(description="Timestamp when the scan was created")
     records_processed: int = Field(
         default=0,
@@ -174,6 +195,8 @@ class UploadResponse(BaseModel):
 class OpenDirectoryRequest(BaseModel):
     """Request payload for opening a directory in the system file manager."""
 
+    model_config = ConfigDict(defer_build=True)
+
     path: str = Field(description="Absolute path to the directory to open")
 
     @field_validator("path")
@@ -188,6 +211,8 @@ class OpenDirectoryRequest(BaseModel):
 class OpenDirectoryResponse(BaseModel):
     """Response from the open-directory endpoint."""
 
+    model_config = ConfigDict(defer_build=True)
+
     success: bool = Field(description="Whether the directory was opened successfully")
     message: str | None = Field(
         default=None,
@@ -198,8 +223,8 @@ class OpenDirectoryResponse(BaseModel):
 class ScanProgress(BaseModel):
     """Real-time progress information for an active scan."""
 
-    scan_id: str = Field(description="Unique scan identifier (UUID)")
-    status: ScanStatus = Field(description="Current scan status")
+    scan_id: str = Field(description="Unique scan identifier (UUID hex)")
+    status: ScanStatusValue = Field(description="Current scan status")
     records_processed: int = Field(
         default=0,
         description="Number of records processed so far",
@@ -296,6 +321,8 @@ class MappingConfigResponse(BaseModel):
 class MappingValidationRequest(BaseModel):
     """Request payload for validating a mapping against a sample record."""
 
+    model_config = ConfigDict(defer_build=True)
+
     mapping: MappingConfigRequest = Field(description="Mapping configuration to validate")
     sample_record: dict[str, str] = Field(
         description="Sample record to validate the mapping against",
@@ -305,6 +332,8 @@ class MappingValidationRequest(BaseModel):
 class MappingValidationResponse(BaseModel):
     """Response payload for mapping validation results."""
 
+    model_config = ConfigDict(defer_build=True)
+
     is_valid: bool = Field(description="Whether the mapping is valid against the sample record")
     matched_fields: list[str] = Field(
         description="Fields present in both mapping and record",
@@ -320,6 +349,8 @@ class MappingValidationResponse(BaseModel):
 class FieldPreviewRequest(BaseModel):
     """Request payload for previewing redaction actions on sample data."""
 
+    model_config = ConfigDict(defer_build=True)
+
     fields: dict[str, FieldMappingEntrySchema] = Field(
         description="Field-level redaction action assignments to preview",
     )
@@ -340,6 +371,8 @@ class FieldPreviewEntry(BaseModel):
 class FieldPreviewResponse(BaseModel):
     """Response payload for field preview results."""
 
+    model_config = ConfigDict(defer_build=True)
+
     entries: list[FieldPreviewEntry] = Field(
         description="Preview entries for each field in the sample record",
     )
@@ -348,6 +381,8 @@ class FieldPreviewResponse(BaseModel):
 class SampleRecordRequest(BaseModel):
     """Request payload for reading a sample record from a file."""
 
+    model_config = ConfigDict(defer_build=True)
+
     source: str = Field(description="Path to the source file")
     file_format: FileFormat | None = Field(
         default=None,
@@ -358,6 +393,8 @@ class SampleRecordRequest(BaseModel):
 class SampleRecordResponse(BaseModel):
     """Response payload containing a sample record from a file."""
 
+    model_config = ConfigDict(defer_build=True)
+
     record: dict[str, str] = Field(
         description="First record from the file (all values as strings, truncated to 200 chars)",
     )
@@ -395,8 +432,8 @@ class SanitizeRequest(BaseModel):
 class SanitizeResponse(BaseModel):
     """Response payload for a sanitization run."""
 
-    scan_id: str = Field(description="Unique scan identifier (UUID)")
-    status: ScanStatus = Field(description="Current scan status")
+    scan_id: str = Field(description="Unique scan identifier (UUID hex)")
+    status: ScanStatusValue = Field(description="Current scan status")
     source: str = Field(description="Source file path")
     output_path: str = Field(description="Path to the output file")
     records_processed: int = Field(default=0, description="Records processed")
@@ -417,6 +454,8 @@ class LoadMappingYamlRequest(BaseModel):
 class LoadMappingYamlContentRequest(BaseModel):
     """Request payload for loading a mapping from raw YAML content."""
 
+    model_config = ConfigDict(defer_build=True)
+
     content: str = Field(description="Raw YAML content of the mapping file")
     name: str | None = Field(
         default=None,
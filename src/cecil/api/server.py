@@ -7,24 +7,32 @@ server readiness before launching the browser.
 
 from __future__ import annotations
 
+import importlib.util
 import logging
+import mimetypes
+import os
 import signal
 import socket
+import sys
 import time
 import types
+from pathlib import Path
 
 import httpx
+import orjson
 import uvicorn
-from fastapi import FastAPI, Request
+from fastapi import FastAPI, Request, Response
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import FileResponse
-from fastapi.staticfiles import StaticFiles
+from fastapi.responses import ORJSONResponse
 
+from cecil.api._client import get_ipc_client
+from cecil.api.middleware import ETagMiddleware
 from cecil.api.routes.filesystem import router as filesystem_router
 from cecil.api.routes.jobs import router as jobs_router
 from cecil.api.routes.mappings import router as mappings_router
 from cecil.api.routes.scans import router as scans_router
 from cecil.api.schemas import ErrorResponse, HealthResponse
+from cecil.api.static import HashedAssetFiles
 from cecil.utils.errors import ServerStartupError
 from cecil.utils.paths import get_ui_dist_path
 
@@ -33,77 +41,98 @@ logger = logging.getLogger(__name__)
 
 _CECIL_VERSION = "0.1.0"
 
+# Seconds between readiness probes while waiting for the server to bind.
+# The interval starts short and doubles after each miss up to the cap.
+_PROBE_INTERVAL = 0.01
+_MAX_PROBE_INTERVAL = 0.1
+
+# uvloop and httptools ship with ``uvicorn[standard]`` on POSIX but are
+# absent on Windows, so fall back to the pure-Python implementations.
+_UVICORN_LOOP = "uvloop" if importlib.util.find_spec("uvloop") is not None else "asyncio"
+_UVICORN_HTTP = "httptools" if importlib.util.find_spec("httptools") is not None else "h11"
+
+# Origins allowed by CORS in development (``CECIL_DEV=1``): the Vite dev
+# server and ``vite preview`` on their default ports.  An explicit list
+# lets Starlette answer with a set lookup instead of a regex match.
+_DEV_CORS_ORIGINS: tuple[str, ...] = tuple(
+    f"http://{host}{port}"
+    for host in ("127.0.0.1", "localhost")
+    for port in ("", ":5173", ":4173")
+)
+
+# The health payload never changes for the lifetime of the process, so it
+# is encoded once and served as raw bytes on every readiness poll.
+_HEALTH_BYTES = orjson.dumps(
+    HealthResponse.model_construct(status="ok", version=_CECIL_VERSION).model_dump()
+)
+
 
 # ── FastAPI application factory ───────────────────────────────────────
 
 
-def create_app() -> FastAPI:
-    """Create and configure the FastAPI application.
+def _load_spa_files(ui_dist: Path) -> dict[str, tuple[bytes, str]]:
+    """Read the top-level UI files into memory for the SPA fallback route.
+
+    The Vite build is immutable for the lifetime of the process, so the
+    handful of files outside ``assets/`` (``index.html``, icons, etc.)
+    are loaded once instead of being stat'd and opened per request.
+    Hashed bundles under ``assets/`` are left to ``StaticFiles``.
+
+    Args:
+        ui_dist: Root directory of the built UI.
 
     Returns:
-        A configured FastAPI instance with CORS middleware and the
-        health endpoint registered.
+        A mapping of POSIX paths relative to *ui_dist* to
+        ``(body, media_type)`` pairs.
     """
-    application = FastAPI(
-        title="Cecil IPC Server",
-        version=_CECIL_VERSION,
-        docs_url=None,
-        redoc_url=None,
-    )
+    files: dict[str, tuple[bytes, str]] = {}
+    for path in ui_dist.rglob("*"):
+        relative = path.relative_to(ui_dist)
+        if relative.parts[0] == "assets" or not path.is_file():
+            continue
+        media_type = mimetypes.guess_type(path.name)[0] or "application/octet-stream"
+        files[relative.as_posix()] = (path.read_bytes(), media_type)
+    return files
 
-    application.add_middleware(
-        CORSMiddleware,
-        allow_origins=[
-            "http://127.0.0.1",
-            "http://localhost",
-        ],
-        allow_origin_regex=r"^https?://(127\.0\.0\.1|localhost)(:\d+)?$",
-        allow_methods=["GET", "POST", "PUT", "DELETE"],
-        allow_headers=["*"],
-        allow_credentials=False,
-    )
 
-    @application.get(
-        "/api/v1/health",
-        response_model=HealthResponse,
-        responses={500: {"model": ErrorResponse}},
-    )
-    async def health() -> HealthResponse:
-        """Return server health status."""
-        return HealthResponse(status="ok", version=_CECIL_VERSION)
+def _mount_ui(application: FastAPI) -> None:
+    """Register the built React UI on *application*.
 
-    application.include_router(filesystem_router)
-    application.include_router(jobs_router)
-    application.include_router(mappings_router)
-    application.include_router(scans_router)
+    Static assets (JS, CSS, images) are served from ``/assets/`` by the
+    ``HashedAssetFiles`` mount.  A catch-all route returns ``index.html``
+    for any other non-API path so that client-side routing (e.g.
+    /ingest, /audit) works correctly.  Logs a warning and leaves the app
+    API-only when the UI has not been built.
 
-    # Serve the built React UI.  Static assets (JS, CSS, images) are
-    # served from ``/assets/`` by the ``StaticFiles`` mount.  A catch-all
-    # route returns ``index.html`` for any other non-API path so that
-    # client-side routing (e.g. /ingest, /audit) works correctly.
+    Args:
+        application: The FastAPI instance to register the UI on.
+    """
     try:
         ui_dist = get_ui_dist_path()
-        index_html = ui_dist / "index.html"
+        index_bytes = (ui_dist / "index.html").read_bytes()
+        spa_files = _load_spa_files(ui_dist)
 
-        # Serve hashed asset bundles produced by Vite.
+        # Serve hashed asset bundles produced by Vite, along with the
+        # compressed siblings written by scripts/build.py.
         assets_dir = ui_dist / "assets"
         if assets_dir.is_dir():
             application.mount(
                 "/assets",
-                StaticFiles(directory=str(assets_dir)),
+                HashedAssetFiles(directory=str(assets_dir)),
                 name="ui-assets",
             )
 
         # SPA catch-all: any path not matched by API routes or /assets
         # returns index.html so React Router handles the route.
         @application.get("/{full_path:path}", include_in_schema=False)
-        async def spa_fallback(request: Request, full_path: str) -> FileResponse:
+        async def spa_fallback(request: Request, full_path: str) -> Response:
             """Serve index.html for all unmatched paths (SPA routing)."""
             # If a specific static file exists (e.g. vite.svg), serve it.
-            candidate = ui_dist / full_path
-            if full_path and candidate.is_file():
-                return FileResponse(str(candidate))
-            return FileResponse(str(index_html))
+            cached = spa_files.get(full_path)
+            if cached is not None:
+                body, media_type = cached
+                return Response(content=body, media_type=media_type)
+            return Response(content=index_bytes, media_type="text/html")
 
         logger.info("Serving UI from %s", ui_dist)
     except FileNotFoundError:
@@ -112,6 +141,62 @@ def create_app() -> FastAPI:
             "Run 'npm run build' in ui/ to build the frontend.",
         )
 
+
+def create_app(with_ui: bool = True) -> FastAPI:
+    """Create and configure the FastAPI application.
+
+    CORS middleware is only installed when ``CECIL_DEV=1`` is set, for
+    a Vite dev server running on its own port, and only allows the
+    origins in ``_DEV_CORS_ORIGINS``.  The shipped UI is served
+    from the same origin as the API and never makes cross-origin calls.
+
+    Args:
+        with_ui: Whether to serve the built React UI alongside the API.
+            Pass ``False`` for an API-only app, which skips locating,
+            and loading the UI files.
+
+    Returns:
+        A configured FastAPI instance with ETag middleware (plus CORS in
+        development) and the health endpoint registered.  Route responses
+        are encoded with ``orjson`` unless a handler returns its own
+        response object.
+    """
+    application = FastAPI(
+        title="Cecil IPC Server",
+        version=_CECIL_VERSION,
+        docs_url=None,
+        redoc_url=None,
+        default_response_class=ORJSONResponse,
+    )
+
+    # Registered before CORS so that CORS stays the outermost layer.
+    application.add_middleware(ETagMiddleware)
+    if os.environ.get("CECIL_DEV") == "1":
+        application.add_middleware(
+            CORSMiddleware,
+            allow_origins=_DEV_CORS_ORIGINS,
+            allow_methods=["GET", "POST", "PUT", "DELETE"],
+            allow_headers=["*"],
+            allow_credentials=False,
+        )
+
+    @application.get(
+        "/api/v1/health",
+        response_model=HealthResponse,
+        responses={500: {"model": ErrorResponse}},
+    )
+    async def health() -> Response:
+        """Return server health status."""
+        return Response(content=_HEALTH_BYTES, media_type="application/json")
+
+    application.include_router(filesystem_router)
+    application.include_router(jobs_router)
+    application.include_router(mappings_router)
+    application.include_router(scans_router)
+
+    if with_ui:
+        _mount_ui(application)
+
     return application
 
 
@@ -132,6 +217,7 @@ class ServerManager:
     def __init__(self) -> None:
         self._port: int | None = None
         self._server: uvicorn.Server | None = None
+        self._socket: socket.socket | None = None
 
     @property
     def port(self) -> int | None:
@@ -165,6 +251,59 @@ class ServerManager:
         logger.info("Found available port", extra={"port": port})
         return port
 
+    @staticmethod
+    def _bind_socket(port: int) -> socket.socket:
+        """Bind a TCP socket on the loopback interface for uvicorn to serve on.
+
+        On POSIX ``SO_REUSEADDR`` is set so a port left in ``TIME_WAIT``
+        by a previous run can be reused immediately.  On Windows that
+        option would let another process bind the same port, so the
+        socket claims it with ``SO_EXCLUSIVEADDRUSE`` instead.
+
+        Args:
+            port: The port to bind, or ``0`` to let the OS pick one.
+
+        Returns:
+            The bound (not yet listening) socket.
+
+        Raises:
+            ServerStartupError: If the port cannot be bound.
+        """
+        sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        if sys.platform == "win32":
+            sock.setsockopt(socket.SOL_SOCKET, socket.SO_EXCLUSIVEADDRUSE, 1)
+        else:
+            sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        try:
+            sock.bind(("127.0.0.1", port))
+        except OSError as err:
+            sock.close()
+            raise ServerStartupError(f"Could not bind to 127.0.0.1:{port}: {err}") from err
+        return sock
+
+    def bind(self) -> int:
+        """Bind the server socket ahead of :meth:`start`.
+
+        Binds the port set via :meth:`set_port`, or an OS-assigned free
+        port when none was set, and keeps the socket open for
+        :meth:`start` to serve on.  Callers that need the port before
+        the server runs (e.g. to poll it from another thread) use this
+        instead of :meth:`find_available_port`, so the port is never
+        released and re-bound in between.  Calling it again returns the
+        already-bound port.
+
+        Returns:
+            The bound port number.
+
+        Raises:
+            ServerStartupError: If the port cannot be bound.
+        """
+        if self._socket is None:
+            self._socket = self._bind_socket(self._port if self._port is not None else 0)
+        port: int = self._socket.getsockname()[1]
+        self._port = port
+        return port
+
     def start(self) -> int:
         """Start the Uvicorn server on an available port.
 
@@ -172,20 +311,29 @@ class ServerManager:
         handlers for ``SIGTERM`` and ``SIGINT`` are installed to enable
         graceful shutdown when the CLI process is killed.
 
-        If ``self._port`` has already been set (e.g. via ``--port``),
-        that port is used instead of auto-selecting one.
+        If :meth:`bind` has already been called, its socket is served
+        on.  Otherwise the socket is bound here: on ``self._port`` if it
+        has been set (e.g. via ``--port``), or on a port the OS assigns
+        at bind time.  The bound socket is handed to uvicorn directly so
+        no other process can claim the port in between.
 
         Returns:
             The port number the server started on.
+
+        Raises:
+            ServerStartupError: If the port cannot be bound.
         """
-        if self._port is None:
-            self._port = self.find_available_port()
+        sock = self._socket or self._bind_socket(self._port if self._port is not None else 0)
+        self._socket = None
+        self._port = sock.getsockname()[1]
 
         config = uvicorn.Config(
-            app="cecil.api.server:app",
+            app=app,
             host="127.0.0.1",
             port=self._port,
             log_level="warning",
+            loop=_UVICORN_LOOP,
+            http=_UVICORN_HTTP,
         )
         self._server = uvicorn.Server(config)
 
@@ -203,7 +351,7 @@ class ServerManager:
             "Starting IPC server",
             extra={"host": "127.0.0.1", "port": self._port},
         )
-        self._server.run()
+        self._server.run(sockets=[sock])
         return self._port
 
     def shutdown(self) -> None:
@@ -236,11 +384,28 @@ class ServerManager:
 # ── Health-check client ───────────────────────────────────────────────
 
 
+def _port_is_open(port: int) -> bool:
+    """Check whether something is accepting TCP connections on a local port.
+
+    Args:
+        port: The loopback port to probe.
+
+    Returns:
+        ``True`` if a TCP connection to ``127.0.0.1:port`` succeeds.
+    """
+    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
+        sock.settimeout(_PROBE_INTERVAL)
+        return sock.connect_ex(("127.0.0.1", port)) == 0
+
+
 def wait_for_server(port: int, timeout: float = 10.0) -> None:
     """Poll the health endpoint until the server responds.
 
     Used by the CLI to verify the IPC server is ready before opening
-    the browser to the mapping UI.
+    the browser to the mapping UI.  The port is first polled with a
+    cheap TCP connect probe; the HTTP health check is only issued once
+    the server is accepting connections, over the shared IPC client.
+    Probes back off exponentially from 10ms to 100ms.
 
     Args:
         port: The port the server is expected to be listening on.
@@ -251,16 +416,21 @@ def wait_for_server(port: int, timeout: float = 10.0) -> None:
             the timeout period.
     """
     deadline = time.monotonic() + timeout
-    url = f"http://127.0.0.1:{port}/api/v1/health"
+    delay = _PROBE_INTERVAL
     logger.info("Waiting for server", extra={"port": port, "timeout": timeout})
 
+    client = get_ipc_client()
+    health_url = f"http://127.0.0.1:{port}/api/v1/health"
     while time.monotonic() < deadline:
-        try:
-            resp = httpx.get(url, timeout=1.0)
-            if resp.status_code == 200:
-                logger.info("Server is ready", extra={"port": port})
-                return
-        except httpx.ConnectError:
-            time.sleep(0.2)
+        if _port_is_open(port):
+            try:
+                resp = client.get(health_url)
+                if resp.status_code == 200:
+                    logger.info("Server is ready", extra={"port": port})
+                    return
+            except (httpx.ConnectError, httpx.ConnectTimeout, httpx.ReadError):
+                pass
+        time.sleep(delay)
+        delay = min(delay * 2, _MAX_PROBE_INTERVAL)
 
     raise ServerStartupError(f"Server did not start within {timeout}s on port {port}")
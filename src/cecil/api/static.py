@@ -0,0 +1,197 @@
+"""Static file serving for the built React UI.
+
+Provides ``HashedAssetFiles``, the ``StaticFiles`` variant mounted at
+``/assets`` for Vite's content-hashed bundles, and
+``precompress_assets()``, which ``scripts/build.py`` runs to write
+``.br``/``.gz`` siblings for those bundles so they can be served
+precompressed on every request.  The server never compresses assets
+itself: the onefile binary unpacks ``ui_dist`` to a fresh temporary
+directory on each launch, so work done at startup would be repeated
+every time.
+"""
+
+from __future__ import annotations
+
+import gzip
+import logging
+import os
+import stat
+import tempfile
+from collections.abc import Callable
+from pathlib import Path
+
+import anyio.to_thread
+from fastapi import Response
+from fastapi.staticfiles import StaticFiles
+from starlette.datastructures import Headers
+from starlette.staticfiles import PathLike
+from starlette.types import Scope
+
+
+try:
+    import brotli
+except ImportError:  # pragma: no cover - optional dependency
+    brotli = None
+
+
+logger = logging.getLogger(__name__)
+
+# Vite embeds a content hash in every ``assets/`` filename, so a given URL
+# always maps to the same bytes and browsers may cache it indefinitely.
+_IMMUTABLE_CACHE_CONTROL = "public, max-age=31536000, immutable"
+
+# Text bundle types worth compressing; images and fonts are already
+# compressed formats and gain nothing.
+_COMPRESSIBLE_SUFFIXES: frozenset[str] = frozenset(
+    {".js", ".mjs", ".css", ".html", ".svg", ".json", ".map", ".txt"},
+)
+
+# Files smaller than this fit in a single packet either way.
+_MIN_COMPRESS_SIZE = 1024
+
+
+# Content-codings served from precompressed siblings, in preference order.
+_PRECOMPRESSED_CODINGS: tuple[tuple[str, str], ...] = (("br", ".br"), ("gzip", ".gz"))
+
+
+def _compress_gzip(data: bytes) -> bytes:
+    """Compress *data* with gzip at maximum level and a fixed mtime."""
+    return gzip.compress(data, compresslevel=9, mtime=0)
+
+
+def _compress_brotli(data: bytes) -> bytes:
+    """Compress *data* with brotli at maximum quality."""
+    compressed: bytes = brotli.compress(data, quality=11)
+    return compressed
+
+
+def _sibling_compressors() -> dict[str, Callable[[bytes], bytes]]:
+    """Return the compressor for each sibling suffix that can be generated.
+
+    Brotli siblings are only generated when the optional ``brotli``
+    package is installed; existing ``.br`` files are served regardless.
+    """
+    compressors: dict[str, Callable[[bytes], bytes]] = {".gz": _compress_gzip}
+    if brotli is not None:
+        compressors[".br"] = _compress_brotli
+    return compressors
+
+
+def _write_atomic(target: Path, payload: bytes) -> None:
+    """Write *payload* to *target* via a temporary file and rename.
+
+    Args:
+        target: Destination path.
+        payload: Bytes to write.
+
+    Raises:
+        OSError: If the temporary file cannot be created or renamed.
+    """
+    fd, tmp_name = tempfile.mkstemp(dir=target.parent, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as tmp:
+            tmp.write(payload)
+        os.replace(tmp_name, target)
+    except OSError:
+        Path(tmp_name).unlink(missing_ok=True)
+        raise
+
+
+def precompress_assets(assets_dir: Path) -> None:
+    """Write compressed siblings for the compressible files in *assets_dir*.
+
+    Called by the build script after the frontend build, so the
+    compression cost is paid once per build rather than on every server
+    start.  Existing siblings are kept, and siblings are written
+    atomically so a crash never leaves a truncated file behind.  I/O
+    failures (e.g. a read-only directory) are ignored; the uncompressed
+    files are then served as before.
+
+    Args:
+        assets_dir: The Vite ``assets/`` output directory.
+    """
+    compressors = _sibling_compressors()
+    for path in assets_dir.rglob("*"):
+        if path.suffix not in _COMPRESSIBLE_SUFFIXES or not path.is_file():
+            continue
+        try:
+            if path.stat().st_size < _MIN_COMPRESS_SIZE:
+                continue
+            data: bytes | None = None
+            for suffix, compress in compressors.items():
+                sibling = path.with_name(path.name + suffix)
+                if sibling.exists():
+                    continue
+                if data is None:
+                    data = path.read_bytes()
+                _write_atomic(sibling, compress(data))
+        except OSError as err:
+            logger.debug(
+                "Skipping asset precompression",
+                extra={"asset": path.name, "error": str(err)},
+            )
+
+
+def _accepted_codings(accept_encoding: str) -> set[str]:
+    """Parse an ``Accept-Encoding`` header into the acceptable codings.
+
+    Args:
+        accept_encoding: The raw header value.
+
+    Returns:
+        Lower-cased content-coding names not refused with ``q=0``.
+    """
+    accepted: set[str] = set()
+    for item in accept_encoding.split(","):
+        coding, _, params = item.partition(";")
+        coding = coding.strip().lower()
+        if not coding:
+            continue
+        quality = params.strip()
+        if quality.startswith("q="):
+            try:
+                if float(quality[2:]) == 0:
+                    continue
+            except ValueError:
+                continue
+        accepted.add(coding)
+    return accepted
+
+
+class HashedAssetFiles(StaticFiles):
+    """``StaticFiles`` for content-hashed bundles.
+
+    Every response is marked immutable, and when the client accepts
+    ``br`` or ``gzip`` and a precompressed sibling exists, the sibling
+    is served with the matching ``Content-Encoding``.
+    """
+
+    async def get_response(self, path: str, scope: Scope) -> Response:
+        """Serve *path*, preferring a precompressed sibling when acceptable."""
+        accepted = _accepted_codings(Headers(scope=scope).get("accept-encoding", ""))
+        for coding, suffix in _PRECOMPRESSED_CODINGS:
+            if coding not in accepted:
+                continue
+            full_path, stat_result = await anyio.to_thread.run_sync(
+                self.lookup_path, path + suffix
+            )
+            if stat_result is not None and stat.S_ISREG(stat_result.st_mode):
+                response = self.file_response(full_path, stat_result, scope)
+                # FileResponse derives the media type from the original
+                # extension (``a.js.gz`` -> text/javascript).
+                response.headers["Content-Encoding"] = coding
+                return response
+        return await super().get_response(path, scope)
+
+    def file_response(
+        self,
+        full_path: PathLike,
+        stat_result: os.stat_result,
+        scope: Scope,
+        status_code: int = 200,
+    ) -> Response:
+        """Build the file response with far-future caching headers."""
+        response = super().file_response(full_path, stat_result, scope, status_code)
+        response.headers["Cache-Control"] = _IMMUTABLE_CACHE_CONTROL
+        response.headers["Vary"] = "Accept-Encoding"
+        return response
@@ -0,0 +1,19 @@
+"""Terminal output helpers shared by the CLI subcommands."""
+
+from __future__ import annotations
+
+import sys
+
+
+def emit_error(message: object) -> None:
+    """Write an ``Error:`` line to stderr and flush it.
+
+    The line is written with a single call so it is never interleaved
+    with other output, and flushed so it appears before the process
+    exits even when stderr is redirected to a file or pipe.
+
+    Args:
+        message: The error message or exception to report.
+    """
+    sys.stderr.write(f"Error: {message}\n")
+    sys.stderr.flush()
@@ -15,7 +15,7 @@ import sys
 import threading
 import webbrowser
 
-from cecil.api.server import ServerManager, wait_for_server
+from cecil.cli._console import emit_error
 from cecil.utils.errors import CecilError
 
 
@@ -53,9 +53,11 @@ def register_app_parser(
 def run_app(args: argparse.Namespace) -> int:
     """Execute the app subcommand.
 
-    Starts the IPC server in a background thread, waits for it to
-    become ready, opens the browser, and blocks until the user
-    presses Ctrl+C.
+    Binds the server port, runs the IPC server on the calling (main)
+    thread, and blocks until the user presses Ctrl+C.  A helper thread
+    waits for the server to become ready, then prints its URL and opens
+    the browser; if the server never becomes ready it shuts the server
+    down and the command fails.
 
     Args:
         args: Parsed CLI arguments from :mod:`argparse`.
@@ -63,43 +65,54 @@ def run_app(args: argparse.Namespace) -> int:
     Returns:
         Exit code (0 for success, 1 for error).
     """
+    # Imported here so other subcommands (e.g. ``cecil scan``) never build
+    # the FastAPI app or load the UI bundle.
+    from cecil.api.server import ServerManager, wait_for_server
+
     manager = ServerManager()
 
     if args.port is not None:
         manager.set_port(args.port)
-    else:
-        manager.set_port(manager.find_available_port())
-
-    port = manager.port
-    assert port is not None  # noqa: S101
-
-    server_thread = threading.Thread(
-        target=manager.start,
-        daemon=True,
-        name="cecil-ipc-server",
-    )
-    server_thread.start()
 
+    # Bind now so the port is known up front and held until uvicorn serves on it.
     try:
-        wait_for_server(port)
+        port = manager.bind()
     except CecilError as err:
-        sys.stderr.write(f"Error: {err}\n")
-        manager.shutdown()
-        server_thread.join(timeout=5.0)
+        emit_error(err)
         return 1
 
     url = f"http://127.0.0.1:{port}"
-    sys.stdout.write(f"Cecil is running at {url}\n")
-    sys.stdout.write("Press Ctrl+C to stop.\n")
-
-    if not args.no_browser:
-        webbrowser.open(url)
+    startup_failed = threading.Event()
+
+    def announce_when_ready() -> None:
+        try:
+            wait_for_server(port)
+        except CecilError as err:
+            emit_error(err)
+            startup_failed.set()
+            manager.shutdown()
+            return
+        sys.stdout.write(f"Cecil is running at {url}\nPress Ctrl+C to stop.\n")
+        sys.stdout.flush()
+        if not args.no_browser:
+            webbrowser.open(url)
+
+    threading.Thread(
+        target=announce_when_ready,
+        daemon=True,
+        name="cecil-browser-launcher",
+    ).start()
 
+    # Serve on the main thread so uvicorn's own SIGINT/SIGTERM handling
+    # performs the graceful shutdown on Ctrl+C.
     try:
-        server_thread.join()
-    except KeyboardInterrupt:
-        sys.stdout.write("\nShutting down...\n")
-        manager.shutdown()
-        server_thread.join(timeout=5.0)
+        manager.start()
+    except CecilError as err:
+        emit_error(err)
+        return 1
+
+    if startup_failed.is_set():
+        return 1
 
+    sys.stdout.write("\nCecil stopped.\n")
     return 0
@@ -12,13 +12,18 @@ will be streamed without sanitization.
 from __future__ import annotations
 
 import argparse
+import contextlib
 import csv
-import json
 import logging
+import queue
 import sys
+import threading
+from collections.abc import Generator, Iterable
 from pathlib import Path
 from typing import Any
 
+from cecil.cli._console import emit_error
+from cecil.core.output.writer import encode_jsonl_line
 from cecil.core.providers.local_file import LocalFileProvider
 from cecil.utils.errors import CecilError
 
@@ -28,6 +33,16 @@ logger = logging.getLogger(__name__)
 # Formats that support output writing.
 _WRITABLE_FORMATS = {"jsonl", "csv"}
 
+# Rows handed to csv.writerows() per call, and the CSV file buffer size.
+_CSV_BATCH_SIZE = 1024
+_CSV_BUFFER_SIZE = 1 << 20
+
+# Records per batch handed from the reader thread to the writer, and the
+# number of batches allowed in flight (4096 records at most).
+_PREFETCH_BATCH_SIZE = 256
+_PREFETCH_MAX_BATCHES = 16
+_PREFETCH_PUT_TIMEOUT = 0.1
+
 
 def register_scan_parser(subparsers: argparse._SubParsersAction[argparse.ArgumentParser]) -> None:
     """Register the ``scan`` subcommand with the CLI argument parser.
@@ -112,6 +127,10 @@ def _resolve_output_path(source_path: Path, output_dir: str, fmt: str) -> Path:
 def _write_jsonl(records: Any, output_path: Path) -> int:
     """Write records to a JSONL file incrementally.
 
+    Lines are encoded with ``encode_jsonl_line``, so values ``orjson``
+    cannot represent exactly (NaN, integers wider than 64 bits) are
+    written as the stdlib ``json`` module would.
+
     Args:
         records: An iterable of dictionaries to write.
         output_path: Path for the output file.
@@ -120,9 +139,9 @@ def _write_jsonl(records: Any, output_path: Path) -> int:
         The number of records written.
     """
     count = 0
-    with open(output_path, "w", encoding="utf-8") as fh:
+    with open(output_path, "wb") as fh:
         for record in records:
-            fh.write(json.dumps(record) + "\n")
+            fh.write(encode_jsonl_line(record))
             count += 1
     return count
 
@@ -131,7 +150,10 @@ def _write_csv(records: Any, output_path: Path) -> int:
     """Write records to a CSV file incrementally.
 
     Peeks at the first record to determine column headers, then writes
-    all records including the first.
+    all records including the first.  Rows are passed to the CSV writer
+    in batches of ``_CSV_BATCH_SIZE`` through a 1 MiB file buffer, so
+    only one batch of records is held in memory at a time.  If a record
+    cannot be read or written, every row before it is still written.
 
     Args:
         records: An iterable of dictionaries to write.
@@ -142,20 +164,105 @@ def _write_csv(records: Any, output_path: Path) -> int:
     """
     count = 0
     writer: csv.DictWriter[str] | None = None
-    fh = open(output_path, "w", newline="", encoding="utf-8")  # noqa: SIM115
+    batch: list[dict[str, Any]] = []
+    fh = open(  # noqa: SIM115
+        output_path,
+        "w",
+        newline="",
+        encoding="utf-8",
+        buffering=_CSV_BUFFER_SIZE,
+    )
     try:
         for record in records:
             if writer is None:
                 fieldnames = list(record.keys())
                 writer = csv.DictWriter(fh, fieldnames=fieldnames)
                 writer.writeheader()
-            writer.writerow(record)
-            count += 1
+            batch.append(record)
+            if len(batch) >= _CSV_BATCH_SIZE:
+                # Detach the batch first so a row writerows() rejects is
+                # not written again by the flush below.
+                pending, batch = batch, []
+                writer.writerows(pending)
+                count += len(pending)
     finally:
-        fh.close()
+        # Also reached when reading a record fails, so the rows read
+        # before the failure still reach the file.
+        try:
+            if writer is not None and batch:
+                writer.writerows(batch)
+                count += len(batch)
+        finally:
+            fh.close()
     return count
 
 
+def _prefetch_records(
+    records: Iterable[dict[str, Any]],
+    batch_size: int = _PREFETCH_BATCH_SIZE,
+    max_batches: int = _PREFETCH_MAX_BATCHES,
+) -> Generator[dict[str, Any], None, None]:
+    """Read *records* on a background thread while the caller writes.
+
+    Records are pulled from *records* in batches of *batch_size* and
+    handed over through a bounded queue, so parsing in the provider
+    overlaps with serialization and file I/O in the caller.  At most
+    *max_batches* batches are buffered, which keeps memory bounded.
+    Exceptions raised while reading are re-raised in the consuming
+    thread, and closing the iterator early stops the reader.
+
+    Args:
+        records: The source record iterable (e.g. ``stream_records()``).
+        batch_size: Number of records per queued batch.
+        max_batches: Maximum number of batches buffered in the queue.
+
+    Yields:
+        The records of *records*, in order.
+    """
+    handoff: queue.Queue[list[dict[str, Any]] | BaseException | None] = queue.Queue(
+        maxsize=max_batches,
+    )
+    stop = threading.Event()
+
+    def put(item: list[dict[str, Any]] | BaseException | None) -> bool:
+        while not stop.is_set():
+            try:
+                handoff.put(item, timeout=_PREFETCH_PUT_TIMEOUT)
+            except queue.Full:
+                continue
+            return True
+        return False
+
+    def read() -> None:
+        try:
+            batch: list[dict[str, Any]] = []
+            for record in records:
+                batch.append(record)
+                if len(batch) >= batch_size:
+                    if not put(batch):
+                        return
+                    batch = []
+            if batch and not put(batch):
+                return
+            put(None)
+        except BaseException as err:  # re-raised by the consumer
+            put(err)
+
+    reader = threading.Thread(target=read, name="cecil-scan-reader", daemon=True)
+    reader.start()
+    try:
+        while True:
+            item = handoff.get()
+            if item is None:
+                return
+            if isinstance(item, BaseException):
+                raise item
+            yield from item
+    finally:
+        stop.set()
+        reader.join()
+
+
 def run_scan(args: argparse.Namespace) -> int:
     """Execute the scan subcommand.
 
@@ -167,9 +274,9 @@ def run_scan(args: argparse.Namespace) -> int:
     """
     # Gate behind --unsafe-passthrough until the sanitization engine is wired.
     if not args.unsafe_passthrough:
-        sys.stderr.write(
-            "Error: Sanitization engine not yet available. "
-            "Use --unsafe-passthrough to bypass (unsafe, for development only).\n",
+        emit_error(
+            "Sanitization engine not yet available. "
+            "Use --unsafe-passthrough to bypass (unsafe, for development only).",
         )
         return 1
 
@@ -180,7 +287,7 @@ def run_scan(args: argparse.Namespace) -> int:
     try:
         source_path = _parse_source_uri(args.source)
     except CecilError as err:
-        sys.stderr.write(f"Error: {err}\n")
+        emit_error(err)
         return 1
 
     # Build provider kwargs.
@@ -196,7 +303,7 @@ def run_scan(args: argparse.Namespace) -> int:
     try:
         provider = LocalFileProvider(**provider_kwargs)
     except CecilError as err:
-        sys.stderr.write(f"Error: {err}\n")
+        emit_error(err)
         return 1
 
     try:
@@ -204,26 +311,26 @@ def run_scan(args: argparse.Namespace) -> int:
             fmt = provider.format
 
             if fmt not in _WRITABLE_FORMATS:
-                sys.stderr.write(
-                    f"Error: Output writing for '{fmt}' format is not yet supported. "
-                    f"Supported: {', '.join(sorted(_WRITABLE_FORMATS))}.\n",
+                emit_error(
+                    f"Output writing for '{fmt}' format is not yet supported. "
+                    f"Supported: {', '.join(sorted(_WRITABLE_FORMATS))}.",
                 )
                 return 1
 
             output_path = _resolve_output_path(source_path, args.output, fmt)
 
             # TODO(#65): Wire sanitization engine -- pass-through mode is temporary
-            records = provider.stream_records()
-
-            if fmt == "jsonl":
-                count = _write_jsonl(records, output_path)
-            else:
-                count = _write_csv(records, output_path)
+            # Parse on a reader thread so it overlaps with encoding and writes.
+            with contextlib.closing(_prefetch_records(provider.stream_records())) as records:
+                if fmt == "jsonl":
+                    count = _write_jsonl(records, output_path)
+                else:
+                    count = _write_csv(records, output_path)
 
             metadata = provider.fetch_metadata()
 
     except CecilError as err:
-        sys.stderr.write(f"Error: {err}\n")
+        emit_error(err)
         return 1
 
     logger.info(
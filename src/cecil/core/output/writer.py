@@ -1,26 +1,81 @@
 """Streaming JSONL output writer.
 
-Writes sanitized records as JSON Lines to a file, flushing each
-record immediately to respect the 50 MB memory ceiling.
+Writes sanitized records as JSON Lines to a file descriptor through a
+fixed-size in-memory buffer, so memory stays bounded by the buffer size
+regardless of how many records are written.
 """
 
 from __future__ import annotations
 
 import json
 import logging
+import math
+import os
 from pathlib import Path
 from typing import Any
 
+import orjson
+
 
 logger = logging.getLogger(__name__)
 
+# Encoded records are collected in memory and written with a single
+# os.write() once this many bytes are pending.
+_WRITE_BUFFER_SIZE = 1 << 18
+
+_ORJSON_OPTIONS = orjson.OPT_APPEND_NEWLINE | orjson.OPT_NON_STR_KEYS
+
+
+def _has_non_finite_float(value: Any) -> bool:
+    """Return whether *value* contains a NaN or infinite float at any depth."""
+    if isinstance(value, float):
+        return not math.isfinite(value)
+    if isinstance(value, dict):
+        return any(_has_non_finite_float(item) for item in value.values())
+    if isinstance(value, list | tuple):
+        return any(_has_non_finite_float(item) for item in value)
+    return False
+
+
+def encode_jsonl_line(record: Any) -> bytes:
+    """Encode *record* as one UTF-8 JSON line, including the newline.
+
+    ``orjson`` is used when it represents the record exactly.  It cannot
+    encode integers wider than 64 bits (it raises) and writes ``NaN`` and
+    ``Infinity`` as ``null``, so such records are encoded with the stdlib
+    ``json`` module instead, which keeps the exact integer and emits the
+    ``NaN``/``Infinity`` literals the JSONL reader accepts.  Non-string
+    keys are stringified either way.
+
+    Args:
+        record: The value to encode, normally a ``dict`` record.
+
+    Returns:
+        The encoded line, terminated by ``\n``.
+
+    Raises:
+        TypeError: If the record contains a value neither encoder supports.
+    """
+    try:
+        line = orjson.dumps(record, option=_ORJSON_OPTIONS)
+    except orjson.JSONEncodeError:
+        pass
+    else:
+        # NaN/Infinity are written as null; a null in the output is the
+        # only case where the slower check is needed.
+        if b"null" not in line or not _has_non_finite_float(record):
+            return line
+    return (json.dumps(record, ensure_ascii=False) + "\n").encode("utf-8")
+
 
 class JsonlWriter:
     """Streaming JSONL output writer.
 
-    Writes sanitized records as JSON Lines to a file, flushing
-    each record immediately to respect the 50MB memory ceiling.
-    Supports the context manager protocol.
+    Writes sanitized records as JSON Lines to a file.  Encoded lines
+    are appended to a 256 KiB ``bytearray`` that is written straight to
+    the file descriptor when full and on ``close()``, bypassing the
+    ``io`` buffering layers.  Only the buffer is held in memory, well
+    within the 50MB ceiling.  Supports the context manager protocol.
 
     Args:
         output_path: The file path to write JSONL output to.
@@ -36,25 +91,58 @@ class JsonlWriter:
         self.output_path: Path = output_path.expanduser().resolve()
         self.records_written: int = 0
         self.output_path.parent.mkdir(parents=True, exist_ok=True)
-        self._file = open(self.output_path, "w", encoding="utf-8")  # noqa: SIM115
+        self._fd: int | None = os.open(
+            self.output_path,
+            # O_BINARY keeps Windows from translating "\n" to "\r\n".
+            os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_BINARY", 0),
+            0o644,
+        )
+        self._buffer = bytearray()
 
     def write_record(self, record: dict[str, Any]) -> None:
         """Write a single record as a JSON line.
 
-        Serializes the record to JSON, writes it as a single line,
-        and flushes the buffer immediately.
+        Serializes the record with ``encode_jsonl_line`` as a single
+        line into the write buffer, which is written to the file once it
+        reaches ``_WRITE_BUFFER_SIZE`` bytes.
 
         Args:
             record: The dictionary record to write.
+
+        Raises:
+            OSError: If the writer has been closed.
         """
-        self._file.write(json.dumps(record, ensure_ascii=False) + "\n")
-        self._file.flush()
+        if self._fd is None:
+            raise OSError(f"Write to closed JsonlWriter: {self.output_path}")
+        self._buffer += encode_jsonl_line(record)
         self.records_written += 1
+        if len(self._buffer) >= _WRITE_BUFFER_SIZE:
+            self._flush_buffer()
+
+    def _flush_buffer(self) -> None:
+        """Write the pending buffer to the file descriptor and clear it.
+
+        Raises:
+            OSError: If the write fails or the writer is closed.
+        """
+        if self._fd is None:
+            raise OSError(f"Write to closed JsonlWriter: {self.output_path}")
+        offset = 0
+        with memoryview(self._buffer) as view:
+            while offset < len(view):
+                offset += os.write(self._fd, view[offset:])
+        self._buffer.clear()
 
     def close(self) -> None:
-        """Close the underlying file handle."""
-        if self._file and not self._file.closed:
-            self._file.close()
+        """Write any buffered records and close the file descriptor."""
+        if self._fd is None:
+            return
+        try:
+            if self._buffer:
+                self._flush_buffer()
+        finally:
+            os.close(self._fd)
+            self._fd = None
 
     def __enter__(self) -> JsonlWriter:
         """Enter the context manager."""
@@ -7,6 +7,7 @@ implement to participate in the Safe-Pipe streaming pipeline.
 from __future__ import annotations
 
 import abc
+import itertools
 import logging
 from collections.abc import Generator
 from typing import Any
@@ -48,6 +49,30 @@ class BaseDataProvider(abc.ABC):
             ProviderReadError: If reading from the source fails.
         """
 
+    def stream_batches(self, size: int = 1024) -> Generator[list[dict[str, Any]], None, None]:
+        """Yield records in lists of up to *size* records.
+
+        Lets consumers work on many records per call instead of paying
+        per-record overhead.  The default implementation chunks
+        :meth:`stream_records`; providers whose source is already
+        batched (e.g. Parquet) override it to skip the per-record hop.
+
+        Args:
+            size: Maximum number of records per list.
+
+        Yields:
+            A non-empty list of records.
+
+        Raises:
+            ValueError: If *size* is less than 1.
+            ProviderReadError: If reading from the source fails.
+        """
+        if size < 1:
+            raise ValueError(f"Batch size must be at least 1, got {size}")
+        records = self.stream_records()
+        while batch := list(itertools.islice(records, size)):
+            yield batch
+
     @abc.abstractmethod
     def close(self) -> None:
         """Release resources and close the connection."""
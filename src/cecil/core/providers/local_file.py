@@ -5,15 +5,18 @@ records one at a time through a memory-efficient generator.
 
 Supported formats:
 
-- **JSONL**: Each line is a JSON object yielding ``dict[str, Any]``.
-- **CSV**: Uses ``csv.DictReader`` for streaming.  Note that all CSV
-  values are strings (``dict[str, str]``) because ``csv.DictReader``
-  does not perform type coercion.  Callers that need typed values
+- **JSONL**: Each line is a JSON object yielding ``dict[str, Any]``,
+  parsed with ``orjson``, or with the stdlib ``json`` module for lines
+  ``orjson`` rejects or would decode lossily (integers over 64 bits).
+- **CSV**: Uses ``csv.reader`` for streaming, yielding rows keyed by
+  the header like ``csv.DictReader``.  Note that all CSV values are
+  strings (``dict[str, str]``) because the ``csv`` module does not
+  perform type coercion.  Callers that need typed values
   should cast after receiving records.  Custom delimiter and quoting
   options can be passed to the constructor.
-- **Parquet**: Uses PyArrow (optional dependency) for row-group-based
-  streaming.  Values are converted to native Python types via
-  ``.as_py()``.
+- **Parquet**: Uses PyArrow (optional dependency) for batch-based
+  streaming.  Values are converted to native Python types in bulk via
+  ``RecordBatch.to_pylist()``.
 
 Malformed records are skipped rather than raising exceptions, and
 optionally logged to a quarantine file for later inspection.
@@ -21,16 +24,24 @@ optionally logged to a quarantine file for later inspection.
 
 from __future__ import annotations
 
+import codecs
+import concurrent.futures
 import contextlib
 import csv
 import datetime
+import io
+import itertools
 import json
 import logging
 import os
-from collections.abc import Generator, Iterable
+import re
+import stat
+from collections.abc import Callable, Generator, Iterable, Sequence
 from pathlib import Path
 from typing import IO, Any, Literal
 
+import orjson
+
 from cecil.core.providers.base import BaseDataProvider
 from cecil.utils.errors import (
     ProviderConnectionError,
@@ -51,12 +62,167 @@ _EXTENSION_FORMAT_MAP: dict[str, str] = {
 # Valid quoting constants for csv module.
 _QuotingType = Literal[0, 1, 2, 3]
 
-# I/O buffer size for open() calls (8 KB).
-_IO_BUFFER_SIZE = 8192
+# I/O buffer size for text-mode open() calls (256 KiB).  Large reads
+# keep syscall counts low when streaming multi-gigabyte files.
+_IO_BUFFER_SIZE = 1 << 18
+
+# Read buffer for JSONL files opened in binary mode (1 MiB).
+_JSONL_BUFFER_SIZE = 1 << 20
+
+# Write buffer for the quarantine log (64 KiB).  Entries are flushed
+# every ``_QUARANTINE_FLUSH_INTERVAL`` entries and on close rather than
+# after each one, so files with many malformed records do not cost a
+# write syscall per record.
+_QUARANTINE_BUFFER_SIZE = 1 << 16
+_QUARANTINE_FLUSH_INTERVAL = 1024
+
+# Bytes (or characters, for text-mode JSONL) read per chunk when
+# splitting a JSONL file into lines (1 MiB).
+_JSONL_CHUNK_SIZE = 1 << 20
+
+# Bytes per block parsed by the optional pyarrow CSV engine (1 MiB).
+_CSV_ARROW_BLOCK_SIZE = 1 << 20
+
+# orjson decodes integers beyond the 64-bit range as floats without
+# raising, so lines containing a run of 20+ ASCII digits are parsed with
+# the stdlib ``json`` module, which keeps them exact.  Bytes are scanned
+# by mapping every digit to "0" and searching for the run as a literal,
+# which is far cheaper than a regex over the same data.
+_LONG_DIGIT_RUN = b"0" * 20
+_DIGITS_TO_ZERO = bytes.maketrans(b"123456789", b"000000000")
+_LONG_DIGIT_RUN_TEXT = re.compile(r"[0-9]{20}")
 
 # Parquet magic bytes at the start of a valid file.
 _PARQUET_MAGIC = b"PAR1"
 
+# Default number of rows per record batch read from a Parquet file.
+_PARQUET_BATCH_SIZE = 8192
+
+# Read buffer for Parquet column chunks (1 MiB).  Together with
+# ``pre_buffer`` this coalesces small column-chunk reads into few large
+# ones.
+_PARQUET_BUFFER_SIZE = 1 << 20
+
+# Rows converted to Python dicts per ``to_pylist()`` call when streaming
+# Parquet, bounding how many materialised rows are alive at once.
+_PARQUET_SLICE_ROWS = 4096
+
+
+def _open_text(path: Path, encoding: str) -> IO[str]:
+    """Open *path* for buffered text reading with large decode chunks.
+
+    ``TextIOWrapper`` decodes only 8 KiB of the underlying buffer per
+    step regardless of ``buffering``; raising its chunk size to
+    ``_IO_BUFFER_SIZE`` cuts the number of decode calls accordingly.
+
+    Args:
+        path: The file to open.
+        encoding: Text encoding of the file.
+
+    Returns:
+        An open text-mode file object.
+
+    Raises:
+        OSError: If the file cannot be opened.
+    """
+    handle = open(path, encoding=encoding, buffering=_IO_BUFFER_SIZE)  # noqa: SIM115
+    if isinstance(handle, io.TextIOWrapper):
+        handle._CHUNK_SIZE = _IO_BUFFER_SIZE  # type: ignore[attr-defined]  # private, untyped
+    return handle
+
+
+def _iter_line_chunks(handle: IO[Any]) -> Generator[list[Any], None, None]:
+    """Yield the lines of *handle* in lists, one list per chunk read.
+
+    The file is read ``_JSONL_CHUNK_SIZE`` at a time and each chunk is
+    split on newlines in one call, so callers iterate plain lists rather
+    than paying the file object's per-line ``readline`` cost.  A line
+    that straddles a chunk boundary is carried over to the next list.
+    Lines are yielded without their trailing ``\n``.
+
+    Args:
+        handle: A file opened in binary or text mode.
+
+    Yields:
+        Lists of complete lines, as ``bytes`` or ``str`` to match the
+        handle's mode.
+    """
+    read: Callable[[int], Any] = handle.read
+    tail = read(0)
+    newline = b"\n" if isinstance(tail, bytes) else "\n"
+    while chunk := read(_JSONL_CHUNK_SIZE):
+        lines = chunk.split(newline)
+        lines[0] = tail + lines[0]
+        tail = lines.pop()
+        yield lines
+    if tail:
+        yield [tail]
+
+
+def _has_long_digit_run(data: str | bytes) -> bool:
+    """Return whether *data* contains a run of more than 19 ASCII digits.
+
+    Args:
+        data: A line, or several lines joined with newlines.
+
+    Returns:
+        ``True`` if an integer literal in *data* may exceed 64 bits.
+    """
+    if isinstance(data, bytes):
+        return _LONG_DIGIT_RUN in data.translate(_DIGITS_TO_ZERO)
+    return _LONG_DIGIT_RUN_TEXT.search(data) is not None
+
+
+def _parse_json_line(line: str | bytes, *, check_long_ints: bool = True) -> Any:
+    """Parse one JSONL line, preferring ``orjson`` for speed.
+
+    Lines ``orjson`` rejects are retried with the stdlib parser, which
+    also accepts the non-standard ``NaN``/``Infinity`` literals, so the
+    set of lines treated as malformed is unchanged.  Lines containing a
+    run of more than 19 digits go straight to the stdlib parser, because
+    ``orjson`` would silently turn an integer that wide into a float.
+    Byte lines that are not valid UTF-8 are reported as decode errors
+    too.
+
+    Args:
+        line: A single line of the file, as text or UTF-8 bytes, with or
+            without surrounding whitespace.
+        check_long_ints: Whether to scan *line* for long digit runs.
+            Pass ``False`` when the caller has already found none in a
+            block of lines containing this one.
+
+    Returns:
+        The decoded JSON value.
+
+    Raises:
+        json.JSONDecodeError: If the line is not valid JSON.
+    """
+    if not (check_long_ints and _has_long_digit_run(line)):
+        try:
+            return orjson.loads(line)
+        except orjson.JSONDecodeError:
+            pass
+    try:
+        return json.loads(line)
+    except UnicodeDecodeError as err:
+        raise json.JSONDecodeError("Line is not valid UTF-8", "", 0) from err
+
+
+def _advise_sequential(handle: IO[Any]) -> None:
+    """Hint the kernel that *handle* will be read sequentially.
+
+    Enables more aggressive read-ahead on platforms that support
+    ``posix_fadvise`` (Linux); a no-op elsewhere.  Failures are ignored
+    since the hint is purely advisory.
+
+    Args:
+        handle: An open file object backed by a real file descriptor.
+    """
+    if not hasattr(os, "posix_fadvise"):
+        return
+    with contextlib.suppress(OSError):
+        os.posix_fadvise(handle.fileno(), 0, 0, os.POSIX_FADV_SEQUENTIAL)
+
 
 class LocalFileProvider(BaseDataProvider):
     """Provider that streams records from a local file.
@@ -79,6 +245,28 @@ class LocalFileProvider(BaseDataProvider):
         quarantine_path: Optional path for writing quarantine log entries.
             When None, quarantine logging is disabled (malformed records
             are still skipped with a warning).
+        batch_size: Number of rows per record batch read from Parquet
+            files.  Larger batches amortise per-batch overhead at the
+            cost of memory.  Ignored for other formats.
+        csv_engine: Parser for CSV files.  ``"python"`` (the default)
+            uses the stdlib ``csv`` module; ``"pyarrow"`` uses PyArrow's
+            multithreaded block parser, which is much faster on large
+            standard-dialect files but quarantines ragged rows instead
+            of padding them.  ``QUOTE_NONNUMERIC`` always uses the
+            stdlib parser.
+        use_threads: Let PyArrow decode Parquet column chunks and parse
+            CSV blocks (``"pyarrow"`` engine) on multiple threads.  This
+            helps on decode-bound files with large row groups; files
+            with many small row groups may be faster single-threaded.
+        reuse_row: Yield the same dictionary for every CSV row, updated
+            in place, instead of allocating a new one per row.  Only
+            safe for consumers that finish with each row before asking
+            for the next and never keep a reference to it.  Ignored by
+            the ``"pyarrow"`` CSV engine and other formats.
+        columns: Names of the fields to keep in each record, in order.
+            Other fields are dropped as early as the format allows, so
+            downstream stages never see or copy them.  Names absent from
+            a record are skipped.  When None, every field is kept.
     """
 
     def __init__(
@@ -89,17 +277,31 @@ class LocalFileProvider(BaseDataProvider):
         delimiter: str = ",",
         quoting: _QuotingType = csv.QUOTE_MINIMAL,
         quarantine_path: Path | None = None,
+        batch_size: int = _PARQUET_BATCH_SIZE,
+        csv_engine: Literal["python", "pyarrow"] = "python",
+        use_threads: bool = True,
+        reuse_row: bool = False,
+        columns: Sequence[str] | None = None,
     ) -> None:
         self._file_path = Path(file_path)
+        # Cached for log extras, metadata, and quarantine entries.
+        self._path_str = str(self._file_path)
         self._format_hint = format_hint
         self._encoding = encoding
         self._delimiter = delimiter
         self._quoting: _QuotingType = quoting
         self._quarantine_path = quarantine_path
+        self._batch_size = batch_size
+        self._csv_engine = csv_engine
+        self._use_threads = use_threads
+        self._reuse_row = reuse_row
+        self._columns: tuple[str, ...] | None = tuple(columns) if columns is not None else None
         self._quarantine_handle: IO[str] | None = None
+        self._quarantine_suffix: str = ""
         self._file_handle: Any | None = None
         self._record_count: int = 0
         self._records_quarantined: int = 0
+        self._file_size: int | None = None
         self._format: str = self._detect_format()
 
     # -- Public interface ---------------------------------------------------
@@ -116,43 +318,58 @@ class LocalFileProvider(BaseDataProvider):
                 readable, is empty, or the content does not match the
                 expected format.
         """
-        if not self._file_path.exists():
-            raise ProviderConnectionError(f"File not found: {self._file_path}")
-        if not self._file_path.is_file():
-            raise ProviderConnectionError(f"Path is not a regular file: {self._file_path}")
-        if not os.access(self._file_path, os.R_OK):
-            raise ProviderConnectionError(f"File is not readable: {self._file_path}")
-
-        # Reject zero-byte files early.
+        # One stat() answers existence, file type, and size.
         try:
-            file_size = self._file_path.stat().st_size
+            stat_result = os.stat(self._file_path)
+        except FileNotFoundError as err:
+            raise ProviderConnectionError(f"File not found: {self._file_path}") from err
         except OSError as err:
             raise ProviderConnectionError(
                 f"Cannot stat file: {self._file_path}",
             ) from err
+        if not stat.S_ISREG(stat_result.st_mode):
+            raise ProviderConnectionError(f"Path is not a regular file: {self._file_path}")
+        if not os.access(self._file_path, os.R_OK):
+            raise ProviderConnectionError(f"File is not readable: {self._file_path}")
+
+        # Reject zero-byte files early.
+        file_size = stat_result.st_size
+        self._file_size = file_size
         if file_size == 0:
             raise ProviderConnectionError(f"File is empty (zero bytes): {self._file_path}")
 
-        # Validate content matches the expected format.
-        self._validate_format_content()
-
-        # Parquet files are opened by PyArrow directly, not by us.
-        if self._format != "parquet":
+        # Parquet files are opened by PyArrow directly, not by us, so only
+        # their magic bytes are checked here.
+        if self._format == "parquet":
+            self._validate_parquet_content()
+            # Pay PyArrow's cold import cost here rather than on the first
+            # record.  A missing install is still reported by the stream.
+            with contextlib.suppress(ImportError):
+                import pyarrow.parquet  # noqa: F401
+        else:
+            handle: IO[Any]
             try:
-                self._file_handle = open(  # noqa: SIM115
-                    self._file_path,
-                    encoding=self._encoding,
-                    buffering=_IO_BUFFER_SIZE,
-                )
+                if self._format == "jsonl":
+                    handle = self._open_jsonl()
+                else:
+                    handle = _open_text(self._file_path, self._encoding)
             except OSError as err:
                 raise ProviderConnectionError(
                     f"Cannot open file: {self._file_path}",
                 ) from err
+            try:
+                self._validate_format_content(handle)
+            except BaseException:
+                with contextlib.suppress(OSError):
+                    handle.close()
+                raise
+            _advise_sequential(handle)
+            self._file_handle = handle
 
         logger.info(
             "LocalFileProvider connected",
             extra={
-                "path": str(self._file_path),
+                "path": self._path_str,
                 "format": self._format,
             },
         )
@@ -162,7 +379,7 @@ class LocalFileProvider(BaseDataProvider):
 
         For JSONL files each line is parsed as a separate JSON object.
         For CSV files each row is yielded as a ``dict[str, str]``.
-        For Parquet files, row groups are read incrementally and
+        For Parquet files, record batches are read incrementally and
         individual rows are yielded as ``dict[str, Any]``.
         Blank lines are silently skipped in text-based formats.
         Malformed records are skipped and optionally quarantined.
@@ -173,18 +390,143 @@ class LocalFileProvider(BaseDataProvider):
         Raises:
             ProviderReadError: If the file handle is not open.
             ProviderDependencyError: If pyarrow is not installed for
-                Parquet files.
+                Parquet files or the ``"pyarrow"`` CSV engine.
             NotImplementedError: If the file format is not yet supported.
         """
         if self._format == "jsonl":
             yield from self._stream_jsonl()
         elif self._format == "csv":
-            yield from self._stream_csv()
+            if self._csv_engine == "pyarrow" and self._quoting != csv.QUOTE_NONNUMERIC:
+                yield from self._stream_csv_arrow()
+            else:
+                yield from self._stream_csv()
         elif self._format == "parquet":
             yield from self._stream_parquet()
         else:
             raise NotImplementedError(f"Format not yet supported: {self._format}")
 
+    def stream_batches(self, size: int = 1024) -> Generator[list[dict[str, Any]], None, None]:
+        """Yield records in lists of up to *size* records.
+
+        Parquet files convert each Arrow batch with a single
+        ``to_pylist()`` call instead of going through
+        :meth:`stream_records`; other formats use the base
+        implementation.  Batches may be shorter than *size* at Parquet
+        row-group boundaries.  With ``reuse_row`` set, CSV rows are
+        copied as they are batched so each list holds distinct rows.
+
+        Args:
+            size: Maximum number of records per list.
+
+        Yields:
+            A non-empty list of records.
+
+        Raises:
+            ValueError: If *size* is less than 1.
+            ProviderReadError: If reading from the source fails.
+            ProviderDependencyError: If pyarrow is not installed for
+                Parquet files.
+        """
+        if size < 1:
+            raise ValueError(f"Batch size must be at least 1, got {size}")
+        if self._format != "parquet":
+            if not self._reuse_row:
+                yield from super().stream_batches(size)
+                return
+            # A batch outlives the next row, so the shared dict is copied.
+            records = map(dict, self.stream_records())
+            while batch := list(itertools.islice(records, size)):
+                yield batch
+            return
+
+        self._record_count = 0
+        for batch in self.stream_arrow_batches(batch_size=size):
+            rows: list[dict[str, Any]] = batch.to_pylist()
+            if rows:
+                self._record_count += len(rows)
+                yield rows
+
+    def stream_arrow_batches(
+        self,
+        batch_size: int | None = None,
+    ) -> Generator[Any, None, None]:
+        """Yield the file's rows as PyArrow ``RecordBatch`` objects.
+
+        Batches come straight from ``ParquetFile.iter_batches()``, so no
+        row-group-sized table and no per-row Python dictionaries are
+        ever materialised.  Column chunks are pre-buffered with coalesced
+        reads and, unless ``use_threads=False`` was given, decoded in
+        parallel while the next batch is read ahead on a background
+        thread, so I/O and decoding overlap with the caller's work on
+        the current batch.  With a ``columns`` projection only those
+        column chunks are read and decoded.  Callers that aggregate or filter columnar
+        data should prefer this over :meth:`stream_records`.  Only
+        Parquet files are supported.
+
+        Args:
+            batch_size: Maximum rows per batch.  Defaults to the
+                ``batch_size`` given to the constructor.
+
+        Yields:
+            A ``pyarrow.RecordBatch`` of up to *batch_size* rows.
+
+        Raises:
+            NotImplementedError: If the file format is not Parquet.
+            ProviderDependencyError: If ``pyarrow`` is not installed.
+            ProviderReadError: If the Parquet file cannot be read.
+        """
+        if self._format != "parquet":
+            raise NotImplementedError(
+                f"Arrow batch streaming is only supported for Parquet, not {self._format}",
+            )
+
+        try:
+            import pyarrow.parquet as pq
+        except ImportError as err:
+            raise ProviderDependencyError(
+                "Parquet support requires pyarrow. Install with: pip install pyarrow",
+            ) from err
+
+        try:
+            pf = pq.ParquetFile(
+                self._file_path,
+                pre_buffer=True,
+                buffer_size=_PARQUET_BUFFER_SIZE,
+            )
+        except Exception as err:
+            raise ProviderReadError(
+                f"Cannot read Parquet file: {self._file_path}",
+            ) from err
+
+        columns: list[str] | None = None
+        if self._columns is not None:
+            present = set(pf.schema_arrow.names)
+            columns = [name for name in dict.fromkeys(self._columns) if name in present]
+        batches = pf.iter_batches(
+            batch_size=batch_size if batch_size is not None else self._batch_size,
+            columns=columns,
+            use_threads=self._use_threads,
+        )
+        if columns is not None:
+            # Parquet returns projected columns in file order; restore the
+            # requested order (a zero-copy reshuffle).
+            batches = (batch.select(columns) for batch in batches)
+        if not self._use_threads:
+            yield from batches
+            return
+
+        # PyArrow releases the GIL while reading and decoding, so one
+        # batch is decoded ahead while the current one is consumed.  At
+        # most two batches are in flight.
+        with concurrent.futures.ThreadPoolExecutor(
+            max_workers=1,
+            thread_name_prefix="cecil-parquet-prefetch",
+        ) as pool:
+            pending = pool.submit(next, batches, None)
+            while (batch := pending.result()) is not None:
+                pending = pool.submit(next, batches, None)
+                yield batch
+
     def close(self) -> None:
         """Close the file handle and release resources.
 
@@ -196,29 +538,35 @@ class LocalFileProvider(BaseDataProvider):
                 self._file_handle.close()
             self._file_handle = None
         if self._quarantine_handle is not None:
+            # close() flushes the buffered entries first.
             with contextlib.suppress(OSError):
                 self._quarantine_handle.close()
             self._quarantine_handle = None
         logger.info(
             "LocalFileProvider closed",
-            extra={"path": str(self._file_path)},
+            extra={"path": self._path_str},
         )
 
     def fetch_metadata(self) -> dict[str, Any]:
         """Return non-sensitive metadata about the file.
 
+        The file size is the one seen by :meth:`connect`; before the
+        first connect the file is stat'ed on demand.
+
         Returns:
             A dictionary with provider key, file path, size, format,
-            the number of records streamed so far, and the number of
-            records quarantined.
+            the number of records yielded by the most recent stream
+            (published when the stream finishes or is closed), and the
+            number of records quarantined.
         """
-        size: int | None = None
-        with contextlib.suppress(OSError):
-            size = self._file_path.stat().st_size
+        size = self._file_size
+        if size is None:
+            with contextlib.suppress(OSError):
+                size = self._file_path.stat().st_size
 
         return {
             "provider": "local_file",
-            "file_path": str(self._file_path),
+            "file_path": self._path_str,
             "file_size_bytes": size,
             "format": self._format,
             "record_count": self._record_count,
@@ -259,108 +607,119 @@ class LocalFileProvider(BaseDataProvider):
             )
         return fmt
 
-    def _validate_format_content(self) -> None:
-        """Validate that the file content matches the expected format.
+    def _validate_format_content(self, handle: Any) -> None:
+        """Validate that the opened text file matches the expected format.
+
+        Peeks at the first lines through the streaming handle itself, then
+        rewinds it, so validation costs no second open of the file.
 
-        Peeks at the first bytes or lines of the file and checks for
-        format-specific markers.  Uses separate file handles for
-        validation so the main file handle is not affected.
+        Args:
+            handle: The freshly opened JSONL or CSV handle.
 
         Raises:
             ProviderConnectionError: If the content does not match the
-                expected format.
+                expected format or cannot be read.
         """
-        if self._format == "jsonl":
-            self._validate_jsonl_content()
-        elif self._format == "csv":
-            self._validate_csv_content()
-        elif self._format == "parquet":
-            self._validate_parquet_content()
+        try:
+            if self._format == "jsonl":
+                self._validate_jsonl_content(handle)
+            elif self._format == "csv":
+                self._validate_csv_content(handle)
+            handle.seek(0)
+        except OSError as err:
+            raise ProviderConnectionError(
+                f"Cannot read file for validation: {self._file_path}",
+            ) from err
+
+    def _is_utf8(self) -> bool:
+        """Report whether the configured encoding is UTF-8."""
+        try:
+            return codecs.lookup(self._encoding).name == "utf-8"
+        except LookupError:
+            return False
+
+    def _open_jsonl(self) -> IO[Any]:
+        """Open the JSONL file for line iteration.
+
+        UTF-8 files (the default) are opened in binary mode so lines go
+        straight to ``orjson`` without a text-decoding pass.  Any other
+        encoding falls back to text mode.
 
-    def _validate_jsonl_content(self) -> None:
+        Returns:
+            An open file object yielding ``bytes`` or ``str`` lines.
+
+        Raises:
+            OSError: If the file cannot be opened.
+        """
+        if self._is_utf8():
+            return open(self._file_path, "rb", buffering=_JSONL_BUFFER_SIZE)
+        return _open_text(self._file_path, self._encoding)
+
+    def _validate_jsonl_content(self, handle: IO[Any]) -> None:
         """Validate that the file contains parseable JSONL content.
 
         Reads through lines until a non-blank line is found, then
         attempts to parse it as JSON.
 
+        Args:
+            handle: The open JSONL handle, positioned at the start.
+
         Raises:
             ProviderConnectionError: If the first non-blank line is not
                 valid JSON.
         """
-        try:
-            with open(
-                self._file_path,
-                encoding=self._encoding,
-                buffering=_IO_BUFFER_SIZE,
-            ) as fh:
-                for line in fh:
-                    stripped = line.strip()
-                    if not stripped:
-                        continue
-                    try:
-                        json.loads(stripped)
-                    except json.JSONDecodeError as err:
-                        raise ProviderConnectionError(
-                            "File content does not appear to be valid JSONL",
-                        ) from err
-                    return
-        except ProviderConnectionError:
-            raise
-        except OSError as err:
-            raise ProviderConnectionError(
-                f"Cannot read file for validation: {self._file_path}",
-            ) from err
+        while line := handle.readline():
+            if line.isspace():
+                continue
+            try:
+                _parse_json_line(line)
+            except json.JSONDecodeError as err:
+                raise ProviderConnectionError(
+                    "File content does not appear to be valid JSONL",
+                ) from err
+            return
 
-    def _validate_csv_content(self) -> None:
+    def _validate_csv_content(self, handle: IO[str]) -> None:
         """Validate that the file contains a parseable CSV header.
 
         Reads the first line and checks that it yields at least one
         non-empty field when parsed as CSV.  Also rejects binary
         content (null bytes).
 
+        Args:
+            handle: The open text-mode CSV handle, positioned at the start.
+
         Raises:
             ProviderConnectionError: If the first line cannot be parsed
                 as a valid CSV header.
         """
         try:
-            with open(
-                self._file_path,
-                encoding=self._encoding,
-                buffering=_IO_BUFFER_SIZE,
-            ) as fh:
-                try:
-                    first_line = fh.readline()
-                except UnicodeDecodeError as err:
-                    raise ProviderConnectionError(
-                        "File content does not appear to be valid CSV",
-                    ) from err
-                if not first_line.strip():
-                    raise ProviderConnectionError(
-                        "File content does not appear to be valid CSV",
-                    )
-                # Check for binary content (null bytes).
-                if "\x00" in first_line:
-                    raise ProviderConnectionError(
-                        "File content does not appear to be valid CSV",
-                    )
-                try:
-                    reader = csv.reader([first_line], delimiter=self._delimiter)
-                    fields = next(reader)
-                except (csv.Error, StopIteration) as err:
-                    raise ProviderConnectionError(
-                        "File content does not appear to be valid CSV",
-                    ) from err
-                # A single empty field means the header is effectively empty.
-                if len(fields) == 1 and fields[0].strip() == "":
-                    raise ProviderConnectionError(
-                        "File content does not appear to be valid CSV",
-                    )
-        except ProviderConnectionError:
-            raise
-        except OSError as err:
+            first_line = handle.readline()
+        except UnicodeDecodeError as err:
             raise ProviderConnectionError(
-                f"Cannot read file for validation: {self._file_path}",
+                "File content does not appear to be valid CSV",
             ) from err
+        if not first_line.strip():
+            raise ProviderConnectionError(
+                "File content does not appear to be valid CSV",
+            )
+        # Check for binary content (null bytes).
+        if "\x00" in first_line:
+            raise ProviderConnectionError(
+                "File content does not appear to be valid CSV",
+            )
+        try:
+            reader = csv.reader([first_line], delimiter=self._delimiter)
+            fields = next(reader)
+        except (csv.Error, StopIteration) as err:
+            raise ProviderConnectionError(
+                "File content does not appear to be valid CSV",
+            ) from err
+        # A single empty field means the header is effectively empty.
+        if len(fields) == 1 and fields[0].strip() == "":
+            raise ProviderConnectionError(
+                "File content does not appear to be valid CSV",
+            )
 
     def _validate_parquet_content(self) -> None:
         """Validate that the file starts with the PAR1 magic bytes.
@@ -393,6 +752,11 @@ class LocalFileProvider(BaseDataProvider):
         Opens the quarantine file lazily on first call.  Each entry is
         a single JSON line containing the line number, error type,
         timestamp, and source file path -- never raw data or PII.
+        Entries are buffered and flushed every
+        ``_QUARANTINE_FLUSH_INTERVAL`` entries and on :meth:`close`.
+        The constant ``source_file`` tail of the entry is encoded once
+        when the log is opened, and each entry is assembled directly
+        rather than by serialising a dict.
 
         Args:
             line_number: The 1-based line number of the malformed record.
@@ -407,22 +771,45 @@ class LocalFileProvider(BaseDataProvider):
                 self._quarantine_path,
                 "a",
                 encoding="utf-8",
+                buffering=_QUARANTINE_BUFFER_SIZE,
             )
+            self._quarantine_suffix = f',"source_file":{json.dumps(self._path_str)}}}\n'
 
-        entry = {
-            "line_number": line_number,
-            "error_type": error_type,
-            "timestamp": datetime.datetime.now(tz=datetime.UTC).isoformat(),
-            "source_file": str(self._file_path),
-        }
-        self._quarantine_handle.write(json.dumps(entry) + "\n")
-        self._quarantine_handle.flush()
+        timestamp = datetime.datetime.now(tz=datetime.UTC).isoformat()
+        self._quarantine_handle.write(
+            f'{{"line_number":{line_number},"error_type":{json.dumps(error_type)},'
+            f'"timestamp":"{timestamp}"{self._quarantine_suffix}',
+        )
+        if self._records_quarantined % _QUARANTINE_FLUSH_INTERVAL == 0:
+            self._quarantine_handle.flush()
+
+    def _quarantine_record(self, line_number: int, error_type: str) -> None:
+        """Log, count, and quarantine a malformed record.
+
+        Args:
+            line_number: The 1-based line number of the malformed record.
+            error_type: A short description of the error (e.g.
+                "JSONDecodeError", "csv.Error").
+        """
+        logger.warning(
+            "Skipping malformed record",
+            extra={
+                "line_number": line_number,
+                "error_type": error_type,
+            },
+        )
+        self._records_quarantined += 1
+        self._write_quarantine_entry(line_number, error_type)
 
     def _stream_jsonl(self) -> Generator[dict[str, Any], None, None]:
         """Stream records from a JSONL file.
 
-        Malformed lines are skipped with a warning and optionally
-        written to the quarantine log.
+        The file is read in large chunks that are split into lines in
+        bulk (see ``_iter_line_chunks``).  UTF-8 files are read as bytes
+        and each line is handed to the parser without stripping or
+        decoding.  Malformed lines
+        (including invalid UTF-8) are skipped with a warning and
+        optionally written to the quarantine log.
 
         Yields:
             Parsed JSON objects one at a time.
@@ -433,33 +820,44 @@ class LocalFileProvider(BaseDataProvider):
         if self._file_handle is None:
             raise ProviderReadError("File handle is not open. Call connect() first.")
 
-        self._record_count = 0
+        # Hot-loop state lives in locals; the count is published to
+        # ``self._record_count`` when the stream finishes or is closed.
+        handle = self._file_handle
+        parse = _parse_json_line
+        columns = self._columns
+        count = 0
         line_number = 0
-        for raw_line in self._file_handle:
-            line_number += 1
-            stripped = raw_line.strip()
-            if not stripped:
-                continue
-            try:
-                record: dict[str, Any] = json.loads(stripped)
-            except json.JSONDecodeError:
-                logger.warning(
-                    "Skipping malformed record",
-                    extra={
-                        "line_number": line_number,
-                        "error_type": "JSONDecodeError",
-                    },
-                )
-                self._records_quarantined += 1
-                self._write_quarantine_entry(line_number, "JSONDecodeError")
-                continue
-            self._record_count += 1
-            yield record
+        self._record_count = 0
+        try:
+            for lines in _iter_line_chunks(handle):
+                if not lines:
+                    continue
+                # One scan per chunk; lines are only checked one by one
+                # in the rare chunks that contain a long digit run.
+                newline = b"\n" if isinstance(lines[0], bytes) else "\n"
+                check_long_ints = _has_long_digit_run(newline.join(lines))
+                for raw_line in lines:
+                    line_number += 1
+                    # Both parsers accept surrounding whitespace, so only
+                    # blank lines need to be filtered out.
+                    if raw_line.isspace() or not raw_line:
+                        continue
+                    try:
+                        record: dict[str, Any] = parse(raw_line, check_long_ints=check_long_ints)
+                    except json.JSONDecodeError:
+                        self._quarantine_record(line_number, "JSONDecodeError")
+                        continue
+                    if columns is not None and isinstance(record, dict):
+                        record = {key: record[key] for key in columns if key in record}
+                    count += 1
+                    yield record
+        finally:
+            self._record_count = count
 
         logger.info(
             "JSONL stream complete",
             extra={
-                "path": str(self._file_path),
+                "path": self._path_str,
                 "records_yielded": self._record_count,
                 "records_quarantined": self._records_quarantined,
             },
@@ -468,11 +866,19 @@ class LocalFileProvider(BaseDataProvider):
     def _stream_csv(self) -> Generator[dict[str, Any], None, None]:
         """Stream records from a CSV file.
 
-        Uses ``csv.DictReader`` so each row is yielded as a
-        ``dict[str, str]`` (a subtype of ``dict[str, Any]``).
-        Empty rows (where all values are ``None`` or empty strings)
-        are silently skipped.  Malformed rows are skipped with a
-        warning and optionally written to the quarantine log.
+        Uses ``csv.reader`` with the header row cached as a tuple, and
+        builds each record with ``dict(zip(...))``, which avoids the
+        pure-Python per-row overhead of ``csv.DictReader`` while keeping
+        its semantics: each row is yielded as a ``dict[str, str]`` (a
+        subtype of ``dict[str, Any]``), short rows are padded with
+        ``None``, and surplus values of long rows are collected in a
+        list under the ``None`` key.  Blank lines and empty rows (where
+        all values are empty or whitespace-only) are silently skipped.
+        Malformed rows are skipped with a warning and optionally written
+        to the quarantine log.  With ``reuse_row`` set, one dictionary
+        is updated in place and yielded for every row.  With ``columns``
+        set, only those cells are copied out of each row (padded with
+        ``None`` when the row is short) and surplus values are dropped.
 
         Yields:
             A single CSV row as a dictionary mapping column names to
@@ -488,92 +894,204 @@ class LocalFileProvider(BaseDataProvider):
         # Cast file handle from Any to Iterable[str] for mypy overload
         # resolution; at runtime _file_handle is always a text-mode file.
         handle: Iterable[str] = self._file_handle
-        reader = csv.DictReader(
+        reader = csv.reader(
             handle,
             delimiter=self._delimiter,
             quoting=self._quoting,
         )
-        line_number = 1  # Header is line 1
-        for row in reader:
-            line_number += 1
-            try:
-                # Skip empty rows: all values are None or whitespace-only.
-                # Note: DictReader may store excess fields as a list
-                # under restkey, so we must handle non-string values.
-                if all(
-                    v is None or (isinstance(v, str) and v.strip() == "") for v in row.values()
-                ):
+        header = next(reader, None)
+        fieldnames: tuple[str, ...] = tuple(header) if header is not None else ()
+        width = len(fieldnames)
+        next_row = reader.__next__
+        # (name, index) pairs for a column projection; for duplicate
+        # header names the last column wins, as with DictReader.
+        projected: tuple[tuple[str, int], ...] | None = None
+        if self._columns is not None:
+            positions = {name: index for index, name in enumerate(fieldnames)}
+            projected = tuple(
+                (name, positions[name]) for name in self._columns if name in positions
+            )
+        shared: dict[Any, Any] | None = {} if self._reuse_row else None
+        count = 0
+        try:
+            while True:
+                try:
+                    row = next_row()
+                except StopIteration:
+                    break
+                except csv.Error:
+                    self._quarantine_record(reader.line_num, "csv.Error")
                     continue
-                self._record_count += 1
-                yield dict(row)
-            except (csv.Error, AttributeError):
-                logger.warning(
-                    "Skipping malformed record",
-                    extra={
-                        "line_number": line_number,
-                        "error_type": "csv.Error",
-                    },
-                )
-                self._records_quarantined += 1
-                self._write_quarantine_entry(line_number, "csv.Error")
-                continue
+                if not row:
+                    continue
+                # Skip empty rows: all values are whitespace-only.  Rows
+                # with surplus values are never treated as empty.
+                # ``isspace()`` avoids allocating a stripped copy per cell.
+                if len(row) <= width and not any(cell and not cell.isspace() for cell in row):
+                    continue
+                record: dict[Any, Any]
+                if projected is not None:
+                    record = {} if shared is None else shared
+                    row_width = len(row)
+                    for name, index in projected:
+                        record[name] = row[index] if index < row_width else None
+                else:
+                    if shared is None:
+                        record = dict(zip(fieldnames, row, strict=False))
+                    else:
+                        record = shared
+                        record.update(zip(fieldnames, row, strict=False))
+                        record.pop(None, None)
+                    if len(row) < width:
+                        for name in fieldnames[len(row) :]:
+                            record[name] = None
+                    elif len(row) > width:
+                        record[None] = row[width:]
+                count += 1
+                yield record
+        finally:
+            self._record_count = count
 
         logger.info(
             "CSV stream complete",
             extra={
-                "path": str(self._file_path),
+                "path": self._path_str,
                 "records_yielded": self._record_count,
                 "records_quarantined": self._records_quarantined,
             },
         )
 
-    def _stream_parquet(self) -> Generator[dict[str, Any], None, None]:
-        """Stream records from a Parquet file using PyArrow.
+    def _stream_csv_arrow(self) -> Generator[dict[str, Any], None, None]:
+        """Stream records from a CSV file using PyArrow's CSV reader.
 
-        Reads row groups incrementally via ``pyarrow.parquet.ParquetFile``
-        to keep memory usage bounded.  Each row is converted to a Python
-        dictionary with native Python types (via ``.as_py()``).
+        The header is read with the stdlib parser so every column can be
+        pinned to ``string``, matching the ``dict[str, str]`` rows of
+        :meth:`_stream_csv`.  PyArrow then parses the file in
+        ``_CSV_ARROW_BLOCK_SIZE`` blocks on its own threads and each
+        batch is converted with one ``to_pylist()`` call.  As with the
+        stdlib reader, quoted values may span lines.  Rows with the
+        wrong number of fields are skipped and quarantined; their line
+        numbers are PyArrow's row numbers, which do not count blank
+        lines.
 
         Yields:
-            A single row as a dictionary with Python-native values.
+            A single CSV row as a dictionary mapping column names to
+            string values.
 
         Raises:
+            ProviderReadError: If the file handle is not open or PyArrow
+                cannot parse the file.
             ProviderDependencyError: If ``pyarrow`` is not installed.
-            ProviderReadError: If the Parquet file cannot be read.
         """
+        if self._file_handle is None:
+            raise ProviderReadError("File handle is not open. Call connect() first.")
+
         try:
-            import pyarrow.parquet as pq  # type: ignore  # optional dep: untyped or absent
+            import pyarrow as pa
+            from pyarrow import csv as pacsv
         except ImportError as err:
             raise ProviderDependencyError(
-                "Parquet support requires pyarrow. Install with: pip install pyarrow",
+                "The pyarrow CSV engine requires pyarrow. Install with: pip install pyarrow",
             ) from err
 
+        self._record_count = 0
+        handle: Iterable[str] = self._file_handle
+        header = next(csv.reader(handle, delimiter=self._delimiter, quoting=self._quoting), None)
+        if header is None:
+            return
+
+        # The handler may run on PyArrow's threads, so it only records
+        # row numbers; quarantining happens here between batches.
+        invalid_rows: list[int] = []
+
+        def skip_invalid_row(row: Any) -> str:
+            invalid_rows.append(row.number)
+            return "skip"
+
+        def quarantine_invalid_rows() -> None:
+            for line_number in invalid_rows:
+                self._quarantine_record(line_number, "csv.Error")
+            invalid_rows.clear()
+
+        quote_char: str | bool = False if self._quoting == csv.QUOTE_NONE else '"'
+        columns = self._columns
+        count = 0
         try:
-            pf = pq.ParquetFile(self._file_path)
-        except Exception as err:
-            raise ProviderReadError(
-                f"Cannot read Parquet file: {self._file_path}",
-            ) from err
+            with pacsv.open_csv(
+                self._file_path,
+                read_options=pacsv.ReadOptions(
+                    encoding=self._encoding,
+                    block_size=_CSV_ARROW_BLOCK_SIZE,
+                    use_threads=self._use_threads,
+                ),
+                parse_options=pacsv.ParseOptions(
+                    delimiter=self._delimiter,
+                    quote_char=quote_char,
+                    newlines_in_values=quote_char is not False,
+                    invalid_row_handler=skip_invalid_row,
+                ),
+                convert_options=pacsv.ConvertOptions(
+                    column_types=dict.fromkeys(header, pa.string()),
+                    strings_can_be_null=False,
+                    quoted_strings_can_be_null=False,
+                ),
+            ) as reader:
+                for batch in reader:
+                    quarantine_invalid_rows()
+                    rows: list[dict[str, Any]] = batch.to_pylist()
+                    for record in rows:
+                        # Skip empty rows: all values are whitespace-only.
+                        if not any(cell and not cell.isspace() for cell in record.values()):
+                            continue
+                        if columns is not None:
+                            record = {name: record[name] for name in columns if name in record}
+                        count += 1
+                        yield record
+                quarantine_invalid_rows()
+        except pa.ArrowInvalid as err:
+            raise ProviderReadError(f"Cannot parse CSV file: {self._file_path}") from err
+        finally:
+            self._record_count = count
 
+        logger.info(
+            "CSV stream complete",
+            extra={
+                "path": self._path_str,
+                "engine": "pyarrow",
+                "records_yielded": self._record_count,
+                "records_quarantined": self._records_quarantined,
+            },
+        )
+
+    def _stream_parquet(self) -> Generator[dict[str, Any], None, None]:
+        """Stream records from a Parquet file using PyArrow.
+
+        Row-oriented wrapper around :meth:`stream_arrow_batches`.
+        Batches are converted to Python dictionaries with native Python
+        types in slices of ``_PARQUET_SLICE_ROWS`` rows via
+        ``to_pylist()``, so the columnar-to-row conversion happens in C++
+        once per slice rather than once per cell.
+
+        Yields:
+            A single row as a dictionary with Python-native values.
+
+        Raises:
+            ProviderDependencyError: If ``pyarrow`` is not installed.
+            ProviderReadError: If the Parquet file cannot be read.
+        """
         self._record_count = 0
-        column_names: list[str] = pf.schema_arrow.names
-
-        for row_group_idx in range(pf.metadata.num_row_groups):
-            table = pf.read_row_group(row_group_idx)
-            for batch in table.to_batches():
-                # Convert columnar batch to row-wise dicts efficiently.
-                columns: dict[str, Any] = {name: batch.column(name) for name in column_names}
-                for row_idx in range(batch.num_rows):
-                    record: dict[str, Any] = {
-                        name: columns[name][row_idx].as_py() for name in column_names
-                    }
+
+        for batch in self.stream_arrow_batches():
+            for offset in range(0, batch.num_rows, _PARQUET_SLICE_ROWS):
+                rows: list[dict[str, Any]] = batch.slice(offset, _PARQUET_SLICE_ROWS).to_pylist()
+                for record in rows:
                     self._record_count += 1
                     yield record
 
         logger.info(
             "Parquet stream complete",
             extra={
-                "path": str(self._file_path),
+                "path": self._path_str,
                 "records_yielded": self._record_count,
             },
         )
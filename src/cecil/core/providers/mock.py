@@ -57,11 +57,11 @@ class MockDataProvider(BaseDataProvider):
             "Starting mock record stream",
             extra={"record_count": len(self._records)},
         )
-        count = 0
-        for record in self._records:
-            count += 1
-            yield record
-        logger.info("Mock record stream complete", extra={"records_yielded": count})
+        yield from self._records
+        logger.info(
+            "Mock record stream complete",
+            extra={"records_yielded": len(self._records)},
+        )
 
     def close(self) -> None:
         """Mark the provider as disconnected."""
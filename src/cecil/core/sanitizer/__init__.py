@@ -1,33 +1,70 @@
-"""Sanitization engine and strategies for the Cecil Safe-Pipe."""
+"""Sanitization engine and strategies for the Cecil Safe-Pipe.
+
+The names below are re-exported lazily (PEP 562): each submodule is
+imported on first attribute access, so importing one submodule (e.g.
+``cecil.core.sanitizer.models``) does not load the engine, strategies,
+and mapping parser along with it.
+"""
 
 from __future__ import annotations
 
-from cecil.core.sanitizer.actions import (
-    apply_action,
-    apply_hash,
-    apply_keep,
-    apply_mask,
-    apply_redact,
-)
-from cecil.core.sanitizer.engine import SanitizationEngine
-from cecil.core.sanitizer.mapping import MappingParser, validate_mapping_against_record
-from cecil.core.sanitizer.models import (
-    Detection,
-    FieldMapping,
-    FieldMappingEntry,
-    FieldRedaction,
-    MappingConfig,
-    MappingValidationResult,
-    RedactionAction,
-    RedactionAudit,
-    SanitizedRecord,
-    StreamErrorPolicy,
-)
-from cecil.core.sanitizer.strategies import (
-    DeepInterceptorStrategy,
-    RedactionStrategy,
-    StrictStrategy,
-)
+import importlib
+from typing import TYPE_CHECKING, Any
+
+
+if TYPE_CHECKING:
+    from cecil.core.sanitizer.actions import (
+        apply_action,
+        apply_hash,
+        apply_keep,
+        apply_mask,
+        apply_redact,
+    )
+    from cecil.core.sanitizer.engine import SanitizationEngine
+    from cecil.core.sanitizer.mapping import MappingParser, validate_mapping_against_record
+    from cecil.core.sanitizer.models import (
+        Detection,
+        FieldMapping,
+        FieldMappingEntry,
+        FieldRedaction,
+        MappingConfig,
+        MappingValidationResult,
+        RedactionAction,
+        RedactionAudit,
+        SanitizedRecord,
+        StreamErrorPolicy,
+    )
+    from cecil.core.sanitizer.strategies import (
+        DeepInterceptorStrategy,
+        RedactionStrategy,
+        StrictStrategy,
+    )
+
+
+# Public name -> submodule that defines it.
+_LAZY_EXPORTS: dict[str, str] = {
+    "apply_action": "cecil.core.sanitizer.actions",
+    "apply_hash": "cecil.core.sanitizer.actions",
+    "apply_keep": "cecil.core.sanitizer.actions",
+    "apply_mask": "cecil.core.sanitizer.actions",
+    "apply_redact": "cecil.core.sanitizer.actions",
+    "SanitizationEngine": "cecil.core.sanitizer.engine",
+    "MappingParser": "cecil.core.sanitizer.mapping",
+    "validate_mapping_against_record": "cecil.core.sanitizer.mapping",
+    "Detection": "cecil.core.sanitizer.models",
+    "FieldMapping": "cecil.core.sanitizer.models",
+    "FieldMappingEntry": "cecil.core.sanitizer.models",
+    "FieldRedaction": "cecil.core.sanitizer.models",
+    "MappingConfig": "cecil.core.sanitizer.models",
+    "MappingValidationResult": "cecil.core.sanitizer.models",
+    "RedactionAction": "cecil.core.sanitizer.models",
+    "RedactionAudit": "cecil.core.sanitizer.models",
+    "SanitizedRecord": "cecil.core.sanitizer.models",
+    "StreamErrorPolicy": "cecil.core.sanitizer.models",
+    "DeepInterceptorStrategy": "cecil.core.sanitizer.strategies",
+    "RedactionStrategy": "cecil.core.sanitizer.strategies",
+    "StrictStrategy": "cecil.core.sanitizer.strategies",
+}
 
 
 __all__ = [
@@ -53,3 +90,29 @@ __all__ = [
     "apply_redact",
     "validate_mapping_against_record",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    """Import a re-exported name from its submodule on first access.
+
+    Args:
+        name: The attribute being looked up on the package.
+
+    Returns:
+        The requested class or function, cached in the package namespace
+        so later lookups bypass this hook.
+
+    Raises:
+        AttributeError: If *name* is not a re-exported name.
+    """
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    """List the package attributes, including not-yet-loaded exports."""
+    return sorted(set(globals()) | set(__all__))
@@ -7,8 +7,10 @@ based on the action enum value.
 
 from __future__ import annotations
 
+import functools
 import hashlib
 import logging
+from collections.abc import Callable
 from typing import Any
 
 from cecil.core.sanitizer.models import RedactionAction
@@ -17,6 +19,16 @@ from cecil.core.sanitizer.models import RedactionAction
 logger = logging.getLogger(__name__)
 
 
+@functools.lru_cache(maxsize=256)
+def _redact_placeholder(field_name: str) -> str:
+    """Return the redaction placeholder for *field_name*.
+
+    A mapping names only a handful of fields, so the placeholders are
+    built once and shared across every record in a stream.
+    """
+    return f"[{field_name.upper()}_REDACTED]"
+
+
 def apply_redact(value: str, field_name: str) -> str:
     """Replace a value with a field-specific redaction placeholder.
 
@@ -30,7 +42,7 @@ def apply_redact(value: str, field_name: str) -> str:
     Returns:
         A placeholder string such as ``[USER_EMAIL_REDACTED]``.
     """
-    return f"[{field_name.upper()}_REDACTED]"
+    return _redact_placeholder(field_name)
 
 
 def apply_mask(value: str, *, preserve_domain: bool = False) -> str:
@@ -59,10 +71,9 @@ def apply_mask(value: str, *, preserve_domain: bool = False) -> str:
     Returns:
         The masked string.
     """
-    if "@" in value:
-        local, domain = value.split("@", 1)
-        first_char = local[0] if local else ""
-        return f"{first_char}***@{domain}"
+    local, sep, domain = value.partition("@")
+    if sep:
+        return f"{local[:1]}***@{domain}"
 
     if len(value) > 4:
         return f"{value[0]}***{value[-1]}"
@@ -101,6 +112,39 @@ def apply_keep(value: str) -> str:
     return value
 
 
+def _dispatch_redact(value: str, field_name: str, options: dict[str, Any] | None) -> str:
+    """Adapt ``apply_redact`` to the dispatch signature."""
+    return apply_redact(value, field_name)
+
+
+def _dispatch_mask(value: str, field_name: str, options: dict[str, Any] | None) -> str:
+    """Adapt ``apply_mask`` to the dispatch signature."""
+    preserve_domain = False
+    if options is not None:
+        preserve_domain = bool(options.get("preserve_domain", False))
+    return apply_mask(value, preserve_domain=preserve_domain)
+
+
+def _dispatch_hash(value: str, field_name: str, options: dict[str, Any] | None) -> str:
+    """Adapt ``apply_hash`` to the dispatch signature."""
+    return apply_hash(value)
+
+
+def _dispatch_keep(value: str, field_name: str, options: dict[str, Any] | None) -> str:
+    """Adapt ``apply_keep`` to the dispatch signature."""
+    return apply_keep(value)
+
+
+# Action -> executor adapted to the common ``(value, field_name, options)``
+# signature, so ``apply_action`` dispatches with one dict lookup.
+_ACTION_DISPATCH: dict[RedactionAction, Callable[[str, str, dict[str, Any] | None], str]] = {
+    RedactionAction.REDACT: _dispatch_redact,
+    RedactionAction.MASK: _dispatch_mask,
+    RedactionAction.HASH: _dispatch_hash,
+    RedactionAction.KEEP: _dispatch_keep,
+}
+
+
 def apply_action(
     value: str,
     action: RedactionAction,
@@ -128,24 +172,12 @@ def apply_action(
     Returns:
         The transformed string produced by the selected executor.
     """
-    logger.debug(
-        "apply_action field=%s action=%s value_len=%d",
-        field_name,
-        action.name,
-        len(value),
-    )
-
-    if action is RedactionAction.REDACT:
-        return apply_redact(value, field_name)
-
-    if action is RedactionAction.MASK:
-        preserve_domain = False
-        if options is not None:
-            preserve_domain = bool(options.get("preserve_domain", False))
-        return apply_mask(value, preserve_domain=preserve_domain)
-
-    if action is RedactionAction.HASH:
-        return apply_hash(value)
-
-    # KEEP
-    return apply_keep(value)
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug(
+            "apply_action field=%s action=%s value_len=%d",
+            field_name,
+            action.name,
+            len(value),
+        )
+
+    return _ACTION_DISPATCH[action](value, field_name, options)
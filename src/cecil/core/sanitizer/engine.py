@@ -10,7 +10,9 @@ from __future__ import annotations
 
 import hashlib
 import logging
+import time
 from collections.abc import Generator
+from datetime import UTC, datetime
 from typing import Any
 
 from cecil.core.sanitizer.models import (
@@ -26,6 +28,10 @@ from cecil.utils.errors import RecordSanitizationError
 
 logger = logging.getLogger(__name__)
 
+# Action name -> action, for mapping StrictStrategy entity types without
+# going through ``RedactionAction[...]`` and its KeyError on PII types.
+_ACTIONS_BY_NAME: dict[str, RedactionAction] = {action.name: action for action in RedactionAction}
+
 
 class SanitizationEngine:
     """Composes a redaction strategy with provider record streams.
@@ -43,6 +49,12 @@ class SanitizationEngine:
         strategy: The redaction strategy to apply to each field.
         error_policy: How to handle per-record failures.
             Defaults to ``SKIP_RECORD``.
+        timestamp_granularity_s: How long, in seconds, one audit
+            timestamp is reused across records before the clock is
+            read again.  ``0`` stamps every record individually.
+
+    Raises:
+        ValueError: If *timestamp_granularity_s* is negative.
 
     Attributes:
         strategy: The active redaction strategy.
@@ -58,9 +70,18 @@ class SanitizationEngine:
         self,
         strategy: RedactionStrategy,
         error_policy: StreamErrorPolicy = StreamErrorPolicy.SKIP_RECORD,
+        *,
+        timestamp_granularity_s: float = 1.0,
     ) -> None:
+        if timestamp_granularity_s < 0:
+            raise ValueError(
+                f"timestamp_granularity_s must be non-negative, got {timestamp_granularity_s}",
+            )
         self.strategy: RedactionStrategy = strategy
         self.error_policy: StreamErrorPolicy = error_policy
+        self._timestamp_granularity_s = timestamp_granularity_s
+        self._cached_timestamp = datetime.now(UTC)
+        self._cached_ts_monotonic = float("-inf")
         self.records_processed: int = 0
         self.records_sanitized: int = 0
         self.records_failed: int = 0
@@ -128,25 +149,31 @@ class SanitizationEngine:
         Returns:
             A ``SanitizedRecord`` with cleaned data and audit.
         """
-        sanitized_data: dict[str, Any] = {}
+        # Copied on the first redaction; fields without detections keep
+        # their original values, so clean records are copied in one go.
+        sanitized_data: dict[str, Any] | None = None
         field_redactions: list[FieldRedaction] = []
+        scan_value = self.strategy.scan_value
+        redact = self.strategy.redact
+        entity_type_to_action = self._entity_type_to_action
 
         for key, value in record.items():
-            detections = self.strategy.scan_value(key, value)
+            detections = scan_value(key, value)
 
             if not detections:
-                # No sensitive data found — keep original value.
-                sanitized_data[key] = value
                 continue
 
+            if sanitized_data is None:
+                sanitized_data = dict(record)
+
             # Redact the value.
             str_value = str(value) if not isinstance(value, str) else value
-            redacted_value = self.strategy.redact(str_value, detections)
+            redacted_value = redact(str_value, detections)
             sanitized_data[key] = redacted_value
 
             # Build the audit entry for this field.
             detection = detections[0]
-            action = self._entity_type_to_action(detection.entity_type)
+            action = entity_type_to_action(detection.entity_type)
             field_redactions.append(
                 FieldRedaction(
                     field_name=key,
@@ -159,10 +186,31 @@ class SanitizationEngine:
         audit = RedactionAudit(
             record_id=str(index),
             fields_redacted=field_redactions,
+            timestamp=self._audit_timestamp(),
         )
 
+        if sanitized_data is None:
+            # Never alias *record*: providers may reuse the dict per row.
+            sanitized_data = dict(record)
+
         return SanitizedRecord(data=sanitized_data, audit=audit)
 
+    def _audit_timestamp(self) -> datetime:
+        """Return the UTC timestamp for the next audit entry.
+
+        ``datetime.now(UTC)`` costs several times a monotonic clock
+        read, so one timestamp is shared by all records processed
+        within ``timestamp_granularity_s`` of each other.
+
+        Returns:
+            A timezone-aware UTC ``datetime``.
+        """
+        now = time.monotonic()
+        if now - self._cached_ts_monotonic >= self._timestamp_granularity_s:
+            self._cached_timestamp = datetime.now(UTC)
+            self._cached_ts_monotonic = now
+        return self._cached_timestamp
+
     @staticmethod
     def _entity_type_to_action(entity_type: str) -> RedactionAction:
         """Map a detection entity type to a RedactionAction.
@@ -178,10 +226,7 @@ class SanitizationEngine:
         Returns:
             The corresponding ``RedactionAction``.
         """
-        try:
-            return RedactionAction[entity_type]
-        except KeyError:
-            return RedactionAction.REDACT
+        return _ACTIONS_BY_NAME.get(entity_type, RedactionAction.REDACT)
 
     def _compute_policy_hash(self) -> str:
         """Compute a SHA-256 hash identifying the strategy configuration.
@@ -157,12 +157,13 @@ class MappingParser:
             fields=fields,
         )
 
-        logger.debug(
-            "mapping_parsed version=%d field_count=%d default_action=%s",
-            config.version,
-            len(config.fields),
-            config.default_action.value,
-        )
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                "mapping_parsed version=%d field_count=%d default_action=%s",
+                config.version,
+                len(config.fields),
+                config.default_action.value,
+            )
 
         return config
 
@@ -230,12 +231,13 @@ def validate_mapping_against_record(
         missing_fields=missing,
     )
 
-    logger.debug(
-        "mapping_validation matched=%d unmapped=%d missing=%d is_valid=%s",
-        len(matched),
-        len(unmapped),
-        len(missing),
-        result.is_valid,
-    )
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug(
+            "mapping_validation matched=%d unmapped=%d missing=%d is_valid=%s",
+            len(matched),
+            len(unmapped),
+            len(missing),
+            result.is_valid,
+        )
 
     return result
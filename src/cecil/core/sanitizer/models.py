@@ -54,7 +54,7 @@ class StreamErrorPolicy(Enum):
     """Raise immediately and halt the pipeline."""
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Detection:
     """A single PII/PHI detection within a field value.
 
@@ -78,7 +78,7 @@ class Detection:
     score: float
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class FieldRedaction:
     """Audit record for a single field that was redacted.
 
@@ -96,7 +96,7 @@ class FieldRedaction:
     count: int
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class RedactionAudit:
     """Audit trail for the sanitization of a single record.
 
@@ -118,7 +118,7 @@ class RedactionAudit:
     )
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class SanitizedRecord:
     """A sanitized data record paired with its redaction audit.
 
@@ -218,7 +218,7 @@ class FieldMapping:
         return self._mappings == other._mappings
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class FieldMappingEntry:
     """Configuration for a single field in a mapping.
 
@@ -231,7 +231,7 @@ class FieldMappingEntry:
     options: dict[str, Any] = field(default_factory=dict)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class MappingConfig:
     """A fully parsed and validated mapping configuration.
 
@@ -268,7 +268,7 @@ class MappingConfig:
         return hashlib.sha256(payload.encode("utf-8")).hexdigest()
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class MappingValidationResult:
     """Result of validating a MappingConfig against a sample record.
 
@@ -15,7 +15,7 @@ import logging
 import re
 from typing import Any
 
-from cecil.core.sanitizer.actions import apply_action
+from cecil.core.sanitizer.actions import apply_action, apply_hash
 from cecil.core.sanitizer.models import (
     Detection,
     FieldMapping,
@@ -41,6 +41,11 @@ _AWS_ACCESS_KEY_PATTERN: re.Pattern[str] = re.compile(
     r"(?:AKIA|ASIA)[A-Z0-9]{16}",
 )
 
+# -- Hash memo ---------------------------------------------------------------
+
+# Upper bound on the hash tokens one StrictStrategy remembers.
+_HASH_MEMO_SIZE = 4096
+
 # -- Presidio entity types to detect ----------------------------------------
 
 _PRESIDIO_ENTITIES: list[str] = [
@@ -202,6 +207,10 @@ class StrictStrategy(RedactionStrategy):
             self._default_action = RedactionAction.REDACT
 
         self._last_key: str = ""
+        # Hashed fields repeat values across records (one email per
+        # user), so config-based HASH tokens are memoised.  The memo
+        # belongs to this strategy, and so to a single engine and scan.
+        self._hash_tokens: dict[str, str] = {}
 
     def scan_value(self, key: str, value: Any) -> list[Detection]:
         """Scan a field value and return detections based on the mapping.
@@ -234,12 +243,13 @@ class StrictStrategy(RedactionStrategy):
 
         str_value = str(value) if not isinstance(value, str) else value
 
-        logger.debug(
-            "strict_scan key=%s action=%s value_len=%d",
-            key,
-            action.name,
-            len(str_value),
-        )
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                "strict_scan key=%s action=%s value_len=%d",
+                key,
+                action.name,
+                len(str_value),
+            )
 
         return [
             Detection(
@@ -284,6 +294,8 @@ class StrictStrategy(RedactionStrategy):
         # When using MappingConfig, delegate to apply_action with options.
         if self._config is not None:
             action_enum = RedactionAction[action_name]
+            if action_enum is RedactionAction.HASH:
+                return self._hash_token(value)
             field_entry: FieldMappingEntry | None = self._config.fields.get(
                 self._last_key,
             )
@@ -307,6 +319,25 @@ class StrictStrategy(RedactionStrategy):
 
     # -- Private helpers -----------------------------------------------------
 
+    def _hash_token(self, value: str) -> str:
+        """Return the ``hash_`` token for *value*, memoised per strategy.
+
+        The memo is emptied once it holds ``_HASH_MEMO_SIZE`` values,
+        keeping its memory bounded on high-cardinality fields.
+
+        Args:
+            value: The string to hash.
+
+        Returns:
+            A string like ``hash_<first-16-hex-chars>``.
+        """
+        token = self._hash_tokens.get(value)
+        if token is None:
+            if len(self._hash_tokens) >= _HASH_MEMO_SIZE:
+                self._hash_tokens.clear()
+            token = self._hash_tokens[value] = apply_hash(value)
+        return token
+
     def _apply_redact(self, value: str) -> str:
         """Replace value with ``[KEY_REDACTED]`` placeholder.
 
@@ -446,11 +477,12 @@ class DeepInterceptorStrategy(RedactionStrategy):
                     score=1.0,
                 ),
             )
-            logger.debug(
-                "deep_scan sensitive_key=%s value_len=%d",
-                key,
-                len(str_value),
-            )
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(
+                    "deep_scan sensitive_key=%s value_len=%d",
+                    key,
+                    len(str_value),
+                )
             return detections
 
         # 2. Presidio detection.
@@ -463,7 +495,7 @@ class DeepInterceptorStrategy(RedactionStrategy):
         # 4. Deduplicate overlapping detections.
         detections = self._deduplicate(detections)
 
-        if detections:
+        if detections and logger.isEnabledFor(logging.DEBUG):
             logger.debug(
                 "deep_scan key=%s detection_count=%d value_len=%d",
                 key,
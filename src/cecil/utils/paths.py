@@ -7,6 +7,7 @@ PyInstaller single-binary distribution.
 
 from __future__ import annotations
 
+import functools
 import logging
 import sys
 from pathlib import Path
@@ -90,12 +91,15 @@ def get_resource_path(relative_path: str) -> Path:
     return resolved
 
 
+@functools.lru_cache(maxsize=1)
 def get_ui_dist_path() -> Path:
     """Return the path to the bundled React UI distribution directory.
 
     This is a convenience wrapper around ``get_resource_path()`` for the
     most common asset lookup: the ``ui_dist/`` directory containing the
-    built React frontend.
+    built React frontend.  The resolved path is cached for the lifetime
+    of the process; a missing directory is not cached, so a later build
+    is still picked up.
 
     Returns:
         The absolute path to the ``ui_dist/`` directory.
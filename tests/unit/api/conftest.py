@@ -11,8 +11,8 @@ from cecil.api.server import create_app
 
 @pytest.fixture
 def app() -> FastAPI:
-    """A fresh FastAPI application instance for each test."""
-    return create_app()
+    """A fresh API-only FastAPI application instance for each test."""
+    return create_app(with_ui=False)
 
 
 @pytest.fixture
@@ -0,0 +1,20 @@
+"""Tests for the shared IPC HTTP client."""
+
+from __future__ import annotations
+
+import httpx
+
+from cecil.api._client import get_ipc_client
+
+
+class TestGetIpcClient:
+    """Tests for get_ipc_client."""
+
+    def test_returns_the_same_client_every_call(self) -> None:
+        assert get_ipc_client() is get_ipc_client()
+
+    def test_client_uses_short_loopback_timeouts(self) -> None:
+        client = get_ipc_client()
+        assert isinstance(client, httpx.Client)
+        assert client.timeout.connect == 0.25
+        assert client.timeout.read == 1.0
@@ -0,0 +1,61 @@
+"""Tests for the ETag middleware on the IPC server.
+
+Covers: ETag headers on API GETs, 304 responses for matching
+If-None-Match values, and pass-through for non-GET, error, and
+non-API responses.
+"""
+
+from __future__ import annotations
+
+from fastapi.testclient import TestClient
+
+from cecil.api.middleware import _etag_matches
+
+
+class TestETagHeaders:
+    """Tests for ETag generation on successful API GETs."""
+
+    def test_get_health_includes_etag(self, client: TestClient) -> None:
+        resp = client.get("/api/v1/health")
+        assert resp.status_code == 200
+        assert resp.headers["etag"].startswith('"')
+
+    def test_etag_is_stable_for_unchanged_body(self, client: TestClient) -> None:
+        first = client.get("/api/v1/health")
+        second = client.get("/api/v1/health")
+        assert first.headers["etag"] == second.headers["etag"]
+
+    def test_etag_omitted_for_error_responses(self, client: TestClient) -> None:
+        resp = client.get("/api/v1/mappings/does-not-exist")
+        assert resp.status_code == 404
+        assert "etag" not in resp.headers
+
+    def test_etag_omitted_for_post_requests(self, client: TestClient) -> None:
+        resp = client.post(
+            "/api/v1/mappings/preview",
+            json={"fields": {}, "sample_record": {}},
+        )
+        assert resp.status_code == 200
+        assert "etag" not in resp.headers
+
+
+class TestConditionalRequests:
+    """Tests for If-None-Match handling."""
+
+    def test_matching_if_none_match_returns_304(self, client: TestClient) -> None:
+        etag = client.get("/api/v1/health").headers["etag"]
+        resp = client.get("/api/v1/health", headers={"If-None-Match": etag})
+        assert resp.status_code == 304
+        assert resp.content == b""
+        assert resp.headers["etag"] == etag
+
+    def test_stale_if_none_match_returns_full_body(self, client: TestClient) -> None:
+        resp = client.get("/api/v1/health", headers={"If-None-Match": '"stale"'})
+        assert resp.status_code == 200
+        assert resp.json()["status"] == "ok"
+
+    def test_etag_matches_weak_and_listed_values(self) -> None:
+        assert _etag_matches('"abc"', 'W/"abc"') is True
+        assert _etag_matches('"abc"', '"xyz", "abc"') is True
+        assert _etag_matches('"abc"', "*") is True
+        assert _etag_matches('"abc"', '"xyz"') is False
@@ -0,0 +1,125 @@
+"""Tests for msgpack content negotiation on API responses.
+
+Covers: the Accept-header dependency, the negotiate helper for single
+models and lists, and msgpack bodies from the browse, mapping list, and
+field preview endpoints.
+"""
+
+from __future__ import annotations
+
+from pathlib import Path
+from typing import Any
+
+import pytest
+from fastapi.testclient import TestClient
+from starlette.requests import Request
+
+from cecil.api.responses import (
+    MSGPACK_MEDIA_TYPE,
+    MsgpackResponse,
+    accepts_msgpack,
+    negotiate_response,
+)
+from cecil.api.schemas import HealthResponse
+
+
+msgpack = pytest.importorskip("msgpack")
+
+
+def _request_with_accept(accept: str | None) -> Request:
+    """Build a bare ASGI request carrying the given Accept header."""
+    headers = [] if accept is None else [(b"accept", accept.encode())]
+    return Request({"type": "http", "method": "GET", "path": "/", "headers": headers})
+
+
+def _unpack(body: bytes) -> Any:
+    """Decode a msgpack response body."""
+    return msgpack.unpackb(body)
+
+
+class TestAcceptsMsgpack:
+    """Tests for the accepts_msgpack dependency."""
+
+    def test_accepts_msgpack_with_msgpack_accept_header(self) -> None:
+        assert accepts_msgpack(_request_with_accept(MSGPACK_MEDIA_TYPE)) is True
+
+    def test_accepts_msgpack_false_for_json(self) -> None:
+        assert accepts_msgpack(_request_with_accept("application/json")) is False
+
+    def test_accepts_msgpack_false_without_header(self) -> None:
+        assert accepts_msgpack(_request_with_accept(None)) is False
+
+
+class TestNegotiateResponse:
+    """Tests for the negotiate_response helper."""
+
+    def test_returns_model_unchanged_for_json(self) -> None:
+        model = HealthResponse(status="ok", version="0.1.0")
+        assert negotiate_response(model, use_msgpack=False) is model
+
+    def test_wraps_model_in_msgpack_response(self) -> None:
+        model = HealthResponse(status="ok", version="0.1.0")
+        resp = negotiate_response(model, use_msgpack=True)
+        assert isinstance(resp, MsgpackResponse)
+        assert resp.media_type == MSGPACK_MEDIA_TYPE
+        assert _unpack(resp.body) == {"status": "ok", "version": "0.1.0"}
+
+    def test_wraps_model_list_in_msgpack_response(self) -> None:
+        models = [HealthResponse(status="ok", version=str(i)) for i in range(3)]
+        resp = negotiate_response(models, use_msgpack=True)
+        assert isinstance(resp, MsgpackResponse)
+        assert [item["version"] for item in _unpack(resp.body)] == ["0", "1", "2"]
+
+
+class TestMsgpackEndpoints:
+    """Tests for endpoints that honour Accept: application/x-msgpack."""
+
+    def test_browse_returns_msgpack_when_requested(
+        self,
+        client: TestClient,
+        tmp_path: Path,
+    ) -> None:
+        (tmp_path / "data.jsonl").write_text("{}\n")
+        resp = client.get(
+            "/api/v1/filesystem/browse",
+            params={"path": str(tmp_path)},
+            headers={"Accept": MSGPACK_MEDIA_TYPE},
+        )
+        assert resp.status_code == 200
+        assert resp.headers["content-type"] == MSGPACK_MEDIA_TYPE
+        json_resp = client.get("/api/v1/filesystem/browse", params={"path": str(tmp_path)})
+        assert _unpack(resp.content) == json_resp.json()
+
+    def test_browse_defaults_to_json(
+        self,
+        client: TestClient,
+        tmp_path: Path,
+    ) -> None:
+        resp = client.get("/api/v1/filesystem/browse", params={"path": str(tmp_path)})
+        assert resp.headers["content-type"] == "application/json"
+
+    def test_list_mappings_returns_msgpack_when_requested(
+        self,
+        client: TestClient,
+    ) -> None:
+        resp = client.get("/api/v1/mappings/", headers={"Accept": MSGPACK_MEDIA_TYPE})
+        assert resp.status_code == 200
+        assert isinstance(_unpack(resp.content), list)
+
+    def test_preview_returns_msgpack_when_requested(
+        self,
+        client: TestClient,
+    ) -> None:
+        resp = client.post(
+            "/api/v1/mappings/preview",
+            json={
+                "fields": {"email": {"action": "redact"}},
+                "sample_record": {"email": "alice@example.com"},
+            },
+            headers={"Accept": MSGPACK_MEDIA_TYPE},
+        )
+        assert resp.status_code == 200
+        entries = _unpack(resp.content)["entries"]
+        assert entries[0]["field_name"] == "email"
+        assert entries[0]["action"] == "redact"
+        assert "alice@example.com" not in entries[0]["transformed"]
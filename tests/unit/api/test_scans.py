@@ -6,6 +6,7 @@ import json
 import uuid
 from collections.abc import Generator
 from pathlib import Path
+from typing import Any
 
 import pytest
 from fastapi.testclient import TestClient
@@ -180,7 +181,7 @@ class TestPostScans:
         client: TestClient,
         tmp_path: Path,
     ):
-        """The returned scan_id is a valid UUID4."""
+        """The returned scan_id is a UUID4 in 32-character hex form."""
         jsonl_file = _create_jsonl_file(tmp_path)
         response = client.post(
             "/api/v1/scans/",
@@ -189,8 +190,8 @@ class TestPostScans:
 
         assert response.status_code == 201
         scan_id = response.json()["scan_id"]
-        parsed = uuid.UUID(scan_id, version=4)
-        assert str(parsed) == scan_id
+        parsed = uuid.UUID(hex=scan_id, version=4)
+        assert parsed.hex == scan_id
 
     def test_post_scans_processes_records(
         self,
@@ -351,6 +352,31 @@ class TestScanWebSocket:
         assert last["status"] == "completed"
         assert last["records_processed"] == 3
 
+    def test_websocket_msgpack_subprotocol(
+        self,
+        client: TestClient,
+        tmp_path: Path,
+    ) -> None:
+        """Offering the msgpack subprotocol yields binary msgpack frames."""
+        msgpack = pytest.importorskip("msgpack")
+        jsonl_file = _create_jsonl_file(tmp_path, records=3)
+        resp = client.post(
+            "/api/v1/scans/",
+            json={"source": str(jsonl_file)},
+        )
+        scan_id = resp.json()["scan_id"]
+
+        with client.websocket_connect(
+            f"/api/v1/scans/{scan_id}/ws",
+            subprotocols=["msgpack"],
+        ) as ws:
+            assert ws.accepted_subprotocol == "msgpack"
+            data = msgpack.unpackb(ws.receive_bytes())
+
+        assert data["scan_id"] == scan_id
+        assert data["status"] == "completed"
+        assert data["records_processed"] == 3
+
 
 @pytest.fixture(autouse=True)
 def _clear_scan_store() -> Generator[None, None, None]:
@@ -757,3 +783,79 @@ class TestCancelScan:
 
         assert cancel_resp.status_code == 422
         assert cancel_resp.json()["error"] == "scan_not_cancellable"
+
+
+class TestSanitizeCounters:
+    """Tests for the counters persisted by _execute_sanitize."""
+
+    def _run(
+        self,
+        tmp_path: Path,
+        monkeypatch: pytest.MonkeyPatch,
+        *,
+        cancel: bool = False,
+    ) -> tuple[dict[str, Any], Path]:
+        """Run _execute_sanitize on three records and capture the job record."""
+        from datetime import UTC, datetime
+
+        from cecil.api.routes import scans
+        from cecil.api.schemas import FileFormat, ScanStatus
+        from cecil.core.sanitizer.mapping import MappingParser
+
+        jobs: list[dict[str, Any]] = []
+        monkeypatch.setattr(scans, "_persist_job", jobs.append)
+        jsonl_file = _create_jsonl_file(tmp_path, records=3)
+        output_path = tmp_path / "out.jsonl"
+        state = scans.ScanState(
+            scan_id="scan-1",
+            status=ScanStatus.PENDING,
+            source=str(jsonl_file),
+            file_format=FileFormat.JSONL,
+            created_at=datetime.now(UTC),
+        )
+        if cancel:
+            state._cancel_event.set()
+        scans._scan_store["scan-1"] = state
+        scans._execute_sanitize(
+            "scan-1",
+            str(jsonl_file),
+            FileFormat.JSONL,
+            MappingParser().parse_file(_create_mapping_yaml(tmp_path)),
+            str(output_path),
+        )
+        return jobs[0], output_path
+
+    def test_cancelled_job_counts_only_written_records(
+        self,
+        tmp_path: Path,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        job, output_path = self._run(tmp_path, monkeypatch, cancel=True)
+        assert job["status"] == "cancelled"
+        assert output_path.read_text(encoding="utf-8") == ""
+        assert job["records_sanitized"] == 0
+        assert job["records_processed"] == 0
+
+    def test_write_failure_counts_only_written_records(
+        self,
+        tmp_path: Path,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        from cecil.core.output.writer import JsonlWriter
+
+        original = JsonlWriter.write_record
+        calls = 0
+
+        def fail_second(self: JsonlWriter, record: dict[str, Any]) -> None:
+            nonlocal calls
+            calls += 1
+            if calls == 2:
+                raise OSError("disk full")
+            original(self, record)
+
+        monkeypatch.setattr(JsonlWriter, "write_record", fail_second)
+        job, output_path = self._run(tmp_path, monkeypatch)
+        assert job["status"] == "failed"
+        assert len(output_path.read_text(encoding="utf-8").splitlines()) == 1
+        assert job["records_sanitized"] == 1
+        assert job["records_processed"] == 1
@@ -7,16 +7,19 @@ and serialization behavior.
 from __future__ import annotations
 
 from datetime import UTC, datetime
+from typing import get_args
 
 import pytest
 from pydantic import ValidationError
 
 from cecil.api.schemas import (
     FileFormat,
+    FileFormatValue,
     ScanProgress,
     ScanRequest,
     ScanResponse,
     ScanStatus,
+    ScanStatusValue,
 )
 
 
@@ -217,6 +220,22 @@ class TestScanResponse:
         assert data["errors"] == ["Warning: skipped malformed line"]
         assert data["created_at"] == created_at
 
+    def test_scan_response_rejects_unknown_status(self) -> None:
+        """ScanResponse rejects status strings outside ScanStatus."""
+        with pytest.raises(ValidationError):
+            ScanResponse(
+                scan_id="550e8400-e29b-41d4-a716-446655440000",
+                status="paused",  # type: ignore[arg-type]
+                source="/path/to/file.jsonl",
+                file_format=FileFormat.JSONL,
+                created_at=datetime.now(UTC),
+            )
+
+    def test_scan_response_literal_fields_cover_enum_values(self) -> None:
+        """The Literal field types stay in sync with the StrEnum values."""
+        assert set(get_args(ScanStatusValue)) == {s.value for s in ScanStatus}
+        assert set(get_args(FileFormatValue)) == {f.value for f in FileFormat}
+
 
 class TestScanProgress:
     """Tests for ScanProgress schema."""
@@ -2,15 +2,22 @@
 
 from __future__ import annotations
 
+import importlib.util
+import socket
+import threading
+from pathlib import Path
 from unittest.mock import MagicMock
 
 import httpx
 import pytest
+import uvicorn
 from fastapi import FastAPI
+from fastapi.responses import ORJSONResponse
 from fastapi.testclient import TestClient
 
+from cecil.api import server as server_module
 from cecil.api.schemas import ErrorResponse, HealthResponse
-from cecil.api.server import ServerManager, create_app, wait_for_server
+from cecil.api.server import ServerManager, _port_is_open, create_app, wait_for_server
 from cecil.utils.errors import CecilError, ServerError, ServerStartupError
 
 
@@ -45,14 +52,20 @@ class TestHealthEndpoint:
 
 
 class TestCorsConfiguration:
-    """Tests for CORS middleware configuration."""
+    """Tests for CORS middleware configuration in development mode."""
+
+    @pytest.fixture
+    def client(self, monkeypatch: pytest.MonkeyPatch) -> TestClient:
+        """A TestClient for an app created with ``CECIL_DEV=1``."""
+        monkeypatch.setenv("CECIL_DEV", "1")
+        return TestClient(create_app())
 
     def test_cors_allows_localhost_origin(self, client: TestClient):
         resp = client.get(
             "/api/v1/health",
-            headers={"Origin": "http://localhost:3000"},
+            headers={"Origin": "http://localhost:5173"},
         )
-        assert resp.headers.get("access-control-allow-origin") == "http://localhost:3000"
+        assert resp.headers.get("access-control-allow-origin") == "http://localhost:5173"
 
     def test_cors_allows_127_0_0_1_origin(self, client: TestClient):
         resp = client.get(
@@ -68,6 +81,13 @@ class TestCorsConfiguration:
         )
         assert resp.headers.get("access-control-allow-origin") == "http://localhost"
 
+    def test_cors_rejects_unlisted_local_port(self, client: TestClient):
+        resp = client.get(
+            "/api/v1/health",
+            headers={"Origin": "http://localhost:3000"},
+        )
+        assert "access-control-allow-origin" not in resp.headers
+
     def test_cors_rejects_external_origin(self, client: TestClient):
         resp = client.get(
             "/api/v1/health",
@@ -79,7 +99,7 @@ class TestCorsConfiguration:
         resp = client.options(
             "/api/v1/health",
             headers={
-                "Origin": "http://localhost:3000",
+                "Origin": "http://localhost:5173",
                 "Access-Control-Request-Method": "POST",
             },
         )
@@ -91,12 +111,21 @@ class TestCorsConfiguration:
         resp = client.options(
             "/api/v1/health",
             headers={
-                "Origin": "http://localhost:3000",
+                "Origin": "http://localhost:5173",
                 "Access-Control-Request-Method": "GET",
             },
         )
         assert resp.headers.get("access-control-allow-credentials") != "true"
 
+    def test_cors_disabled_outside_dev_mode(self, monkeypatch: pytest.MonkeyPatch):
+        monkeypatch.delenv("CECIL_DEV", raising=False)
+        resp = TestClient(create_app()).get(
+            "/api/v1/health",
+            headers={"Origin": "http://localhost:5173"},
+        )
+        assert resp.status_code == 200
+        assert "access-control-allow-origin" not in resp.headers
+
 
 # ── create_app factory tests ──────────────────────────────────────────
 
@@ -118,12 +147,83 @@ class TestCreateApp:
         assert application.docs_url is None
         assert application.redoc_url is None
 
+    def test_create_app_uses_orjson_responses(self):
+        application = create_app()
+        assert application.router.default_response_class is ORJSONResponse
+
     def test_create_app_produces_independent_instances(self):
         app1 = create_app()
         app2 = create_app()
         assert app1 is not app2
 
 
+# ── UI serving tests ──────────────────────────────────────────────────
+
+
+@pytest.fixture
+def ui_client(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> TestClient:
+    """A TestClient for an app serving a minimal built UI from tmp_path."""
+    (tmp_path / "index.html").write_text("<html>cecil</html>")
+    (tmp_path / "vite.svg").write_text("<svg/>")
+    (tmp_path / "assets").mkdir()
+    (tmp_path / "assets" / "index-abc123.js").write_text("console.log(1)")
+    monkeypatch.setattr(server_module, "get_ui_dist_path", lambda: tmp_path)
+    return TestClient(create_app())
+
+
+class TestUiServing:
+    """Tests for the SPA fallback and static asset routes."""
+
+    def test_unknown_path_returns_index_html(self, ui_client: TestClient):
+        resp = ui_client.get("/ingest")
+        assert resp.status_code == 200
+        assert resp.headers["content-type"].startswith("text/html")
+        assert resp.text == "<html>cecil</html>"
+
+    def test_top_level_file_is_served_with_its_media_type(self, ui_client: TestClient):
+        resp = ui_client.get("/vite.svg")
+        assert resp.status_code == 200
+        assert resp.headers["content-type"] == "image/svg+xml"
+        assert resp.text == "<svg/>"
+
+    def test_ui_files_are_served_from_memory(self, ui_client: TestClient, tmp_path: Path):
+        (tmp_path / "index.html").unlink()
+        resp = ui_client.get("/")
+        assert resp.text == "<html>cecil</html>"
+
+    def test_assets_are_served_by_static_mount(self, ui_client: TestClient):
+        resp = ui_client.get("/assets/index-abc123.js")
+        assert resp.status_code == 200
+        assert resp.text == "console.log(1)"
+
+    def test_assets_are_marked_immutable(self, ui_client: TestClient):
+        resp = ui_client.get("/assets/index-abc123.js")
+        assert resp.headers["cache-control"] == "public, max-age=31536000, immutable"
+
+    def test_index_html_is_not_marked_immutable(self, ui_client: TestClient):
+        resp = ui_client.get("/")
+        assert "immutable" not in resp.headers.get("cache-control", "")
+
+    def test_startup_does_not_compress_assets(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ):
+        (tmp_path / "index.html").write_text("<html>cecil</html>")
+        (tmp_path / "assets").mkdir()
+        (tmp_path / "assets" / "index-abc123.js").write_text("console.log(1);\n" * 500)
+        monkeypatch.setattr(server_module, "get_ui_dist_path", lambda: tmp_path)
+        create_app()
+        assert sorted(p.name for p in (tmp_path / "assets").iterdir()) == ["index-abc123.js"]
+
+    def test_api_only_app_skips_ui(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
+        def fail() -> Path:
+            raise AssertionError("UI should not be located")
+
+        monkeypatch.setattr(server_module, "get_ui_dist_path", fail)
+        client = TestClient(create_app(with_ui=False))
+        assert client.get("/ingest").status_code == 404
+        assert client.get("/api/v1/health").status_code == 200
+
+
 # ── ServerManager tests ───────────────────────────────────────────────
 
 
@@ -170,17 +270,135 @@ class TestServerManagerInit:
         assert mock_server.should_exit is True
 
 
+class TestServerManagerStart:
+    """Tests for ServerManager.start socket handling."""
+
+    @staticmethod
+    def _start_in_thread(manager: ServerManager) -> int:
+        """Run start() off the main thread so no signal handlers are installed."""
+        result: list[int] = []
+        thread = threading.Thread(target=lambda: result.append(manager.start()))
+        thread.start()
+        thread.join(timeout=5.0)
+        return result[0]
+
+    def test_start_hands_bound_socket_to_uvicorn(self, monkeypatch):
+        served: list[socket.socket] = []
+
+        def fake_run(self, sockets=None):
+            served.extend(sockets)
+
+        monkeypatch.setattr(uvicorn.Server, "run", fake_run)
+        manager = ServerManager()
+        port = self._start_in_thread(manager)
+
+        assert manager.port == port
+        assert len(served) == 1
+        assert served[0].getsockname() == ("127.0.0.1", port)
+        served[0].close()
+
+    def test_start_configures_fast_loop_and_http_parser(self, monkeypatch):
+        configs: list[uvicorn.Config] = []
+
+        def fake_run(self, sockets=None):
+            configs.append(self.config)
+            for sock in sockets or []:
+                sock.close()
+
+        monkeypatch.setattr(uvicorn.Server, "run", fake_run)
+        self._start_in_thread(ServerManager())
+
+        expected_loop = "uvloop" if importlib.util.find_spec("uvloop") else "asyncio"
+        expected_http = "httptools" if importlib.util.find_spec("httptools") else "h11"
+        assert configs[0].loop == expected_loop
+        assert configs[0].http == expected_http
+
+    def test_start_passes_app_object_to_uvicorn(self, monkeypatch):
+        configs: list[uvicorn.Config] = []
+
+        def fake_run(self, sockets=None):
+            configs.append(self.config)
+            for sock in sockets or []:
+                sock.close()
+
+        monkeypatch.setattr(uvicorn.Server, "run", fake_run)
+        self._start_in_thread(ServerManager())
+
+        assert configs[0].app is server_module.app
+        assert configs[0].reload is False
+
+    def test_start_raises_when_port_in_use(self, monkeypatch):
+        monkeypatch.setattr(uvicorn.Server, "run", lambda self, sockets=None: None)
+        with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as taken:
+            taken.bind(("127.0.0.1", 0))
+            taken.listen(1)
+            manager = ServerManager()
+            manager.set_port(taken.getsockname()[1])
+            with pytest.raises(ServerStartupError, match="Could not bind"):
+                manager.start()
+
+    def test_bind_holds_port_for_start(self, monkeypatch):
+        served: list[socket.socket] = []
+
+        def fake_run(self, sockets=None):
+            served.extend(sockets)
+
+        monkeypatch.setattr(uvicorn.Server, "run", fake_run)
+        manager = ServerManager()
+        port = manager.bind()
+
+        assert manager.port == port
+        assert manager.bind() == port
+        assert self._start_in_thread(manager) == port
+        assert served[0].getsockname() == ("127.0.0.1", port)
+        served[0].close()
+
+    def test_bind_sets_reuseaddr(self):
+        manager = ServerManager()
+        manager.bind()
+        sock = manager._socket
+        assert sock is not None
+        assert sock.getsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR)
+        sock.close()
+
+    def test_bind_uses_exclusive_addr_on_windows(self, monkeypatch):
+        options: list[tuple[int, int, int]] = []
+
+        class FakeSocket:
+            def __init__(self, *args: object) -> None:
+                pass
+
+            def setsockopt(self, level: int, option: int, value: int) -> None:
+                options.append((level, option, value))
+
+            def bind(self, address: tuple[str, int]) -> None:
+                pass
+
+        monkeypatch.setattr(server_module.sys, "platform", "win32")
+        monkeypatch.setattr(server_module.socket, "SO_EXCLUSIVEADDRUSE", -5, raising=False)
+        monkeypatch.setattr(server_module.socket, "socket", FakeSocket)
+
+        ServerManager._bind_socket(0)
+
+        assert options == [(socket.SOL_SOCKET, -5, 1)]
+
+
 # ── wait_for_server tests ─────────────────────────────────────────────
 
 
 class TestWaitForServer:
     """Tests for the wait_for_server health check poller."""
 
+    @pytest.fixture(autouse=True)
+    def _port_open(self, monkeypatch):
+        """Report the probed port as open so polling reaches the health check."""
+        monkeypatch.setattr(server_module, "_port_is_open", lambda port: True)
+
     def test_wait_for_server_raises_on_timeout(self, monkeypatch):
         def mock_get(*args: object, **kwargs: object) -> None:
             raise httpx.ConnectError("connection refused")
 
-        monkeypatch.setattr(httpx, "get", mock_get)
+        monkeypatch.setattr(httpx.Client, "get", mock_get)
 
         with pytest.raises(ServerStartupError, match="did not start within"):
             wait_for_server(port=99999, timeout=0.5)
@@ -198,10 +416,26 @@ class TestWaitForServer:
                 json={"status": "ok", "version": "0.1.0"},
             )
 
-        monkeypatch.setattr(httpx, "get", mock_get)
+        monkeypatch.setattr(httpx.Client, "get", mock_get)
         wait_for_server(port=12345, timeout=10.0)
         assert call_count == 3
 
+    def test_wait_for_server_retries_on_read_error(self, monkeypatch):
+        responses: list[Exception | httpx.Response] = [
+            httpx.ReadError("connection reset"),
+            httpx.Response(200, json={"status": "ok", "version": "0.1.0"}),
+        ]
+
+        def mock_get(*args: object, **kwargs: object) -> httpx.Response:
+            result = responses.pop(0)
+            if isinstance(result, Exception):
+                raise result
+            return result
+
+        monkeypatch.setattr(httpx.Client, "get", mock_get)
+        wait_for_server(port=12345, timeout=5.0)
+        assert responses == []
+
     def test_wait_for_server_succeeds_immediately_on_200(self, monkeypatch):
         def mock_get(*args: object, **kwargs: object) -> httpx.Response:
             return httpx.Response(
@@ -209,9 +443,31 @@ class TestWaitForServer:
                 json={"status": "ok", "version": "0.1.0"},
             )
 
-        monkeypatch.setattr(httpx, "get", mock_get)
+        monkeypatch.setattr(httpx.Client, "get", mock_get)
         wait_for_server(port=12345, timeout=5.0)  # Should not raise
 
+    def test_wait_for_server_skips_health_check_until_port_opens(self, monkeypatch):
+        probes = iter([False, False, True])
+        get_calls = 0
+
+        def mock_get(*args: object, **kwargs: object) -> httpx.Response:
+            nonlocal get_calls
+            get_calls += 1
+            return httpx.Response(200, json={"status": "ok", "version": "0.1.0"})
+
+        monkeypatch.setattr(server_module, "_port_is_open", lambda port: next(probes))
+        monkeypatch.setattr(httpx.Client, "get", mock_get)
+        wait_for_server(port=12345, timeout=5.0)
+        assert get_calls == 1
+
+    def test_port_is_open_detects_listening_socket(self):
+        with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as listener:
+            listener.bind(("127.0.0.1", 0))
+            listener.listen(1)
+            port = listener.getsockname()[1]
+            assert _port_is_open(port) is True
+        assert _port_is_open(port) is False
+
 
 # ── Schema tests ──────────────────────────────────────────────────────
 
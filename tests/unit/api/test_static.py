@@ -0,0 +1,111 @@
+"""Tests for precompressed static asset serving.
+
+Covers: sibling generation in precompress_assets, Accept-Encoding
+parsing, and content negotiation in the HashedAssetFiles mount.
+"""
+
+from __future__ import annotations
+
+import gzip
+from pathlib import Path
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from cecil.api.static import HashedAssetFiles, _accepted_codings, precompress_assets
+
+
+_BUNDLE = "console.log('cecil');\n" * 200
+
+
+@pytest.fixture
+def assets_dir(tmp_path: Path) -> Path:
+    """An assets directory with one large bundle, one tiny file, and an image."""
+    assets = tmp_path / "assets"
+    assets.mkdir()
+    (assets / "index-abc123.js").write_text(_BUNDLE)
+    (assets / "tiny-def456.css").write_text("a{}")
+    (assets / "logo-789.png").write_bytes(b"\x89PNG" + b"\x00" * 4096)
+    return assets
+
+
+@pytest.fixture
+def assets_client(assets_dir: Path) -> TestClient:
+    """A TestClient with HashedAssetFiles mounted at /assets."""
+    precompress_assets(assets_dir)
+    application = FastAPI()
+    application.mount("/assets", HashedAssetFiles(directory=str(assets_dir)))
+    return TestClient(application)
+
+
+class TestPrecompressAssets:
+    """Tests for precompress_assets sibling generation."""
+
+    def test_writes_gzip_sibling_for_large_bundle(self, assets_dir: Path) -> None:
+        precompress_assets(assets_dir)
+        sibling = assets_dir / "index-abc123.js.gz"
+        assert gzip.decompress(sibling.read_bytes()).decode() == _BUNDLE
+
+    def test_skips_small_and_binary_files(self, assets_dir: Path) -> None:
+        precompress_assets(assets_dir)
+        assert not (assets_dir / "tiny-def456.css.gz").exists()
+        assert not (assets_dir / "logo-789.png.gz").exists()
+
+    def test_keeps_existing_sibling(self, assets_dir: Path) -> None:
+        sibling = assets_dir / "index-abc123.js.gz"
+        sibling.write_bytes(b"existing")
+        precompress_assets(assets_dir)
+        assert sibling.read_bytes() == b"existing"
+
+    def test_leaves_no_temporary_files(self, assets_dir: Path) -> None:
+        precompress_assets(assets_dir)
+        assert not list(assets_dir.glob("*.tmp"))
+
+
+class TestAcceptedCodings:
+    """Tests for Accept-Encoding parsing."""
+
+    def test_parses_listed_codings(self) -> None:
+        assert _accepted_codings("gzip, deflate, br") == {"gzip", "deflate", "br"}
+
+    def test_excludes_codings_refused_with_zero_quality(self) -> None:
+        assert _accepted_codings("br;q=0, gzip;q=0.8") == {"gzip"}
+
+    def test_empty_header_accepts_nothing(self) -> None:
+        assert _accepted_codings("") == set()
+
+
+class TestHashedAssetFiles:
+    """Tests for serving assets through HashedAssetFiles."""
+
+    def test_serves_gzip_sibling_when_accepted(self, assets_client: TestClient) -> None:
+        resp = assets_client.get("/assets/index-abc123.js", headers={"Accept-Encoding": "gzip"})
+        assert resp.status_code == 200
+        assert resp.headers["content-encoding"] == "gzip"
+        assert resp.headers["content-type"].startswith("text/javascript")
+        assert resp.headers["vary"] == "Accept-Encoding"
+        assert resp.text == _BUNDLE
+
+    def test_serves_raw_file_without_accepted_coding(self, assets_client: TestClient) -> None:
+        resp = assets_client.get(
+            "/assets/index-abc123.js",
+            headers={"Accept-Encoding": "identity"},
+        )
+        assert resp.status_code == 200
+        assert "content-encoding" not in resp.headers
+        assert resp.text == _BUNDLE
+
+    def test_serves_raw_file_without_sibling(self, assets_client: TestClient) -> None:
+        resp = assets_client.get("/assets/tiny-def456.css", headers={"Accept-Encoding": "gzip"})
+        assert resp.status_code == 200
+        assert "content-encoding" not in resp.headers
+        assert resp.text == "a{}"
+
+    def test_responses_are_immutable(self, assets_client: TestClient) -> None:
+        resp = assets_client.get("/assets/index-abc123.js")
+        assert resp.headers["cache-control"] == "public, max-age=31536000, immutable"
+
+    def test_missing_asset_returns_404(self, assets_client: TestClient) -> None:
+        resp = assets_client.get("/assets/missing.js", headers={"Accept-Encoding": "gzip"})
+        assert resp.status_code == 404
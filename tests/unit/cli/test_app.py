@@ -0,0 +1,70 @@
+"""Tests for the ``cecil app`` CLI subcommand."""
+
+from __future__ import annotations
+
+import argparse
+import threading
+
+import pytest
+
+from cecil.api import server as server_module
+from cecil.api.server import ServerManager
+from cecil.cli.app import run_app
+from cecil.utils.errors import ServerStartupError
+
+
+def _args() -> argparse.Namespace:
+    return argparse.Namespace(port=None, no_browser=True)
+
+
+@pytest.fixture
+def served_threads(monkeypatch: pytest.MonkeyPatch) -> list[threading.Thread]:
+    """Replace ServerManager.start with a stub that returns once the launcher is done.
+
+    Returns:
+        The threads the stub was called on.
+    """
+    threads: list[threading.Thread] = []
+
+    def fake_start(self: ServerManager) -> int:
+        threads.append(threading.current_thread())
+        for thread in threading.enumerate():
+            if thread.name == "cecil-browser-launcher":
+                thread.join(timeout=5.0)
+        assert self._socket is not None
+        self._socket.close()
+        assert self._port is not None
+        return self._port
+
+    monkeypatch.setattr(ServerManager, "start", fake_start)
+    return threads
+
+
+class TestRunApp:
+    """Tests for run_app."""
+
+    def test_run_app_serves_on_calling_thread(
+        self,
+        served_threads: list[threading.Thread],
+        monkeypatch: pytest.MonkeyPatch,
+        capsys: pytest.CaptureFixture[str],
+    ) -> None:
+        monkeypatch.setattr(server_module, "wait_for_server", lambda port: None)
+
+        assert run_app(_args()) == 0
+        assert served_threads == [threading.main_thread()]
+        assert "Cecil is running at http://127.0.0.1:" in capsys.readouterr().out
+
+    def test_run_app_fails_when_server_never_ready(
+        self,
+        served_threads: list[threading.Thread],
+        monkeypatch: pytest.MonkeyPatch,
+        capsys: pytest.CaptureFixture[str],
+    ) -> None:
+        def fake_wait(port: int) -> None:
+            raise ServerStartupError("Server did not start")
+
+        monkeypatch.setattr(server_module, "wait_for_server", fake_wait)
+
+        assert run_app(_args()) == 1
+        assert "Error: Server did not start" in capsys.readouterr().err
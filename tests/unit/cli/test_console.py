@@ -0,0 +1,21 @@
+"""Tests for the CLI terminal output helpers."""
+
+from __future__ import annotations
+
+import pytest
+
+from cecil.cli._console import emit_error
+from cecil.utils.errors import CecilError
+
+
+class TestEmitError:
+    """Tests for emit_error."""
+
+    def test_emit_error_writes_prefixed_line_to_stderr(
+        self,
+        capsys: pytest.CaptureFixture[str],
+    ) -> None:
+        emit_error(CecilError("file not found"))
+        captured = capsys.readouterr()
+        assert captured.err == "Error: file not found\n"
+        assert captured.out == ""
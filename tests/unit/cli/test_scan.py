@@ -3,16 +3,23 @@
 from __future__ import annotations
 
 import json
+from collections.abc import Iterator
 from pathlib import Path
+from typing import Any
 
 import pytest
 
 from cecil.cli import build_parser, main
 from cecil.cli.scan import (
+    _CSV_BATCH_SIZE,
     _parse_source_uri,
+    _prefetch_records,
     _resolve_output_path,
+    _write_csv,
+    _write_jsonl,
     run_scan,
 )
+from cecil.utils.errors import CecilError
 from tests.fixtures.pii_samples import generate_sample_csv
 
 
@@ -119,6 +126,14 @@ class TestScanJsonlPassthrough:
         for line in lines:
             json.loads(line)
 
+    def test_write_jsonl_keeps_values_orjson_cannot_encode(self, tmp_path: Path) -> None:
+        out = tmp_path / "out.jsonl"
+        record = {"big": 123456789012345678901234567890, "nan": float("nan")}
+        assert _write_jsonl([record], out) == 1
+        assert out.read_text(encoding="utf-8") == (
+            '{"big": 123456789012345678901234567890, "nan": NaN}\n'
+        )
+
     def test_scan_jsonl_record_count_matches(
         self,
         sample_jsonl_path: Path,
@@ -219,6 +234,74 @@ class TestScanCsvPassthrough:
         output_data_rows = len(output_file.read_text().strip().splitlines()) - 1
         assert input_data_rows == output_data_rows
 
+    def test_write_csv_flushes_partial_final_batch(self, tmp_path: Path) -> None:
+        total = _CSV_BATCH_SIZE * 2 + 3
+        records = ({"id": str(i), "name": f"user{i}"} for i in range(total))
+        output_file = tmp_path / "out.csv"
+
+        assert _write_csv(records, output_file) == total
+        lines = output_file.read_text().splitlines()
+        assert lines[0] == "id,name"
+        assert len(lines) == total + 1
+        assert lines[-1] == f"{total - 1},user{total - 1}"
+
+    def test_write_csv_keeps_rows_before_invalid_record(self, tmp_path: Path) -> None:
+        records = [{"id": str(i)} for i in range(5)] + [{"id": "5", "extra": "x"}]
+        output_file = tmp_path / "out.csv"
+
+        with pytest.raises(ValueError, match="extra"):
+            _write_csv(iter(records), output_file)
+        assert output_file.read_text().splitlines() == ["id", "0", "1", "2", "3", "4"]
+
+    def test_write_csv_keeps_rows_read_before_source_error(self, tmp_path: Path) -> None:
+        def failing_records() -> Iterator[dict[str, Any]]:
+            for i in range(3):
+                yield {"id": str(i)}
+            raise CecilError("read failed")
+
+        output_file = tmp_path / "out.csv"
+
+        with pytest.raises(CecilError, match="read failed"):
+            _write_csv(failing_records(), output_file)
+        assert output_file.read_text().splitlines() == ["id", "0", "1", "2"]
+
+
+# ── Reader thread ────────────────────────────────────────────────────
+
+
+class TestPrefetchRecords:
+    """Tests for _prefetch_records."""
+
+    def test_prefetch_preserves_order(self) -> None:
+        records = [{"id": i} for i in range(50)]
+        result = list(_prefetch_records(iter(records), batch_size=7, max_batches=2))
+        assert result == records
+
+    def test_prefetch_reraises_reader_errors(self) -> None:
+        def failing() -> Iterator[dict[str, Any]]:
+            yield {"id": 0}
+            raise CecilError("boom")
+
+        with pytest.raises(CecilError, match="boom"):
+            list(_prefetch_records(failing(), batch_size=1))
+
+    def test_prefetch_close_stops_reader(self) -> None:
+        produced: list[int] = []
+
+        def endless() -> Iterator[dict[str, Any]]:
+            i = 0
+            while True:
+                produced.append(i)
+                yield {"id": i}
+                i += 1
+
+        records = _prefetch_records(endless(), batch_size=1, max_batches=1)
+        assert next(records) == {"id": 0}
+        records.close()
+        stopped_at = len(produced)
+        assert stopped_at < 10
+        assert len(produced) == stopped_at
+
 
 # ── Quarantine directory ─────────────────────────────────────────────
 
@@ -3,8 +3,11 @@
 from __future__ import annotations
 
 import json
+import math
 from pathlib import Path
 
+import pytest
+
 from cecil.core.output.writer import JsonlWriter
 
 
@@ -63,3 +66,78 @@ class TestJsonlWriter:
         parsed = json.loads(lines[0])
         assert parsed["name"] == "日本語テスト"
         assert parsed["emoji"] == "🎉"
+
+    def test_writer_stringifies_non_string_keys(self, tmp_path: Path) -> None:
+        """Writer converts non-string keys to strings like stdlib json."""
+        out = tmp_path / "output.jsonl"
+        with JsonlWriter(out) as writer:
+            writer.write_record({1: "one", "nested": {2: "two"}})
+
+        parsed = json.loads(out.read_text(encoding="utf-8"))
+        assert parsed == {"1": "one", "nested": {"2": "two"}}
+
+    def test_writer_flushes_full_buffer_before_close(self, tmp_path: Path) -> None:
+        """Writer writes to disk once the buffer fills, and the rest on close."""
+        out = tmp_path / "output.jsonl"
+        record = {"payload": "x" * 1000}
+        with JsonlWriter(out) as writer:
+            for _ in range(300):
+                writer.write_record(record)
+            assert out.stat().st_size > 0
+
+        lines = out.read_text(encoding="utf-8").splitlines()
+        assert len(lines) == 300
+        assert all(json.loads(line) == record for line in lines)
+
+    def test_writer_close_is_idempotent(self, tmp_path: Path) -> None:
+        """Calling close() twice does not raise."""
+        writer = JsonlWriter(tmp_path / "output.jsonl")
+        writer.write_record({"id": 1})
+        writer.close()
+        writer.close()
+
+    def test_writer_keeps_integers_wider_than_64_bits(self, tmp_path: Path) -> None:
+        """Integers orjson cannot encode are written exactly via stdlib json."""
+        out = tmp_path / "output.jsonl"
+        with JsonlWriter(out) as writer:
+            writer.write_record({"id": 123456789012345678901234567890})
+
+        assert out.read_text(encoding="utf-8") == '{"id": 123456789012345678901234567890}\n'
+
+    def test_writer_keeps_non_finite_floats(self, tmp_path: Path) -> None:
+        """NaN and Infinity are written as literals rather than null."""
+        out = tmp_path / "output.jsonl"
+        with JsonlWriter(out) as writer:
+            writer.write_record({"a": float("nan"), "b": [float("inf")], "c": None})
+
+        parsed = json.loads(out.read_text(encoding="utf-8"))
+        assert math.isnan(parsed["a"])
+        assert parsed["b"] == [float("inf")]
+        assert parsed["c"] is None
+
+    def test_writer_keeps_null_values(self, tmp_path: Path) -> None:
+        """Real None values still go through orjson as null."""
+        out = tmp_path / "output.jsonl"
+        with JsonlWriter(out) as writer:
+            writer.write_record({"a": None, "b": 1.5})
+
+        assert out.read_text(encoding="utf-8") == '{"a":null,"b":1.5}\n'
+
+    def test_writer_rejects_write_after_close(self, tmp_path: Path) -> None:
+        """Writing to a closed writer raises instead of buffering silently."""
+        out = tmp_path / "output.jsonl"
+        writer = JsonlWriter(out)
+        writer.close()
+
+        with pytest.raises(OSError, match="closed"):
+            writer.write_record({"id": 1})
+        assert writer.records_written == 0
+
+    def test_writer_writes_bare_newlines(self, tmp_path: Path) -> None:
+        """Lines end in a bare LF on every platform."""
+        out = tmp_path / "output.jsonl"
+        with JsonlWriter(out) as writer:
+            writer.write_record({"id": 1})
+            writer.write_record({"id": 2})
+
+        assert out.read_bytes() == b'{"id":1}\n{"id":2}\n'
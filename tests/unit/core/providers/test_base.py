@@ -152,3 +152,13 @@ class TestMockDataProvider:
 
         second = next(gen)
         assert second == {"i": "1"}
+
+    def test_stream_batches_chunks_records(self):
+        records = [{"i": str(i)} for i in range(5)]
+        provider = MockDataProvider(records=records)
+        batches = list(provider.stream_batches(2))
+        assert batches == [records[0:2], records[2:4], records[4:5]]
+
+    def test_stream_batches_rejects_non_positive_size(self):
+        with pytest.raises(ValueError, match="at least 1"):
+            next(MockDataProvider().stream_batches(0))
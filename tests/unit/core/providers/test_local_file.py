@@ -4,14 +4,17 @@ from __future__ import annotations
 
 import csv
 import json
+import os
+import threading
 from collections.abc import Generator
 from pathlib import Path
-from typing import Any
+from typing import Any, Literal
 
 import pytest
 
+from cecil.core.providers import local_file
 from cecil.core.providers.base import BaseDataProvider
-from cecil.core.providers.local_file import LocalFileProvider
+from cecil.core.providers.local_file import _PARQUET_SLICE_ROWS, LocalFileProvider
 from cecil.utils.errors import (
     ProviderConnectionError,
     ProviderDependencyError,
@@ -73,6 +76,23 @@ class TestLocalFileProviderConnect:
         provider.connect()
         provider.close()
 
+    def test_connect_advises_sequential_reads(
+        self,
+        tmp_csv_path: Path,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        if not hasattr(os, "posix_fadvise"):
+            pytest.skip("posix_fadvise is not available on this platform")
+        advice: list[int] = []
+        monkeypatch.setattr(os, "posix_fadvise", lambda fd, off, length, adv: advice.append(adv))
+        with LocalFileProvider(file_path=tmp_csv_path):
+            pass
+        assert advice == [os.POSIX_FADV_SEQUENTIAL]
+
+    def test_connect_widens_text_decode_chunks(self, tmp_csv_path: Path) -> None:
+        with LocalFileProvider(file_path=tmp_csv_path) as provider:
+            assert provider._file_handle._CHUNK_SIZE == local_file._IO_BUFFER_SIZE
+
     def test_connect_raises_for_missing_file(self, tmp_path: Path) -> None:
         missing = tmp_path / "nonexistent.jsonl"
         provider = LocalFileProvider(file_path=missing)
@@ -121,6 +141,22 @@ class TestLocalFileProviderConnect:
         ):
             provider.connect()
 
+    def test_failed_validation_leaves_no_open_handle(self, tmp_path: Path) -> None:
+        """The handle opened for validation is closed when validation fails."""
+        path = tmp_path / "bad.jsonl"
+        path.write_text("not json\n", encoding="utf-8")
+        provider = LocalFileProvider(file_path=path)
+        with pytest.raises(ProviderConnectionError):
+            provider.connect()
+        assert provider._file_handle is None
+
+    def test_connect_rewinds_after_validation(self, tmp_path: Path) -> None:
+        """Lines read during validation are streamed again."""
+        path = tmp_path / "leading_blank.jsonl"
+        path.write_text('\n{"id": 1}\n{"id": 2}\n', encoding="utf-8")
+        with LocalFileProvider(file_path=path) as provider:
+            assert list(provider.stream_records()) == [{"id": 1}, {"id": 2}]
+
     def test_connect_validates_csv_content(self, tmp_path: Path) -> None:
         """A .csv file that is actually a binary blob is rejected."""
         path = tmp_path / "bad.csv"
@@ -273,6 +309,82 @@ class TestLocalFileProviderStreamJSONL:
             records = list(provider.stream_records())
         assert records == expected
 
+    def test_stream_records_accepts_non_standard_float_literals(self, tmp_path: Path) -> None:
+        path = tmp_path / "nan.jsonl"
+        path.write_text('{"score": NaN}\n{"score": 1.5}\n', encoding="utf-8")
+        with LocalFileProvider(file_path=path) as provider:
+            records = list(provider.stream_records())
+        assert len(records) == 2
+        assert records[0]["score"] != records[0]["score"]
+        assert records[1] == {"score": 1.5}
+
+    @pytest.mark.parametrize("encoding", ["utf-8", "latin-1"])
+    def test_stream_records_keeps_integers_wider_than_64_bits(
+        self,
+        tmp_path: Path,
+        encoding: str,
+    ) -> None:
+        path = tmp_path / "big.jsonl"
+        path.write_text(
+            '{"id": 1}\n'
+            '{"id": 123456789012345678901234567890, "neg": -98765432109876543210}\n'
+            '{"id": 18446744073709551615, "card": "12345678901234567890"}\n',
+            encoding=encoding,
+        )
+        with LocalFileProvider(file_path=path, encoding=encoding) as provider:
+            records = list(provider.stream_records())
+        assert records == [
+            {"id": 1},
+            {"id": 123456789012345678901234567890, "neg": -98765432109876543210},
+            {"id": 18446744073709551615, "card": "12345678901234567890"},
+        ]
+        assert type(records[1]["id"]) is int
+
+    def test_stream_records_skips_invalid_utf8_lines(self, tmp_path: Path) -> None:
+        path = tmp_path / "bad_bytes.jsonl"
+        path.write_bytes(b'{"id": 1}\n{"name": "\xff"}\n  {"id": 2}  \n')
+        with LocalFileProvider(file_path=path) as provider:
+            records = list(provider.stream_records())
+            meta = provider.fetch_metadata()
+        assert records == [{"id": 1}, {"id": 2}]
+        assert meta["records_quarantined"] == 1
+
+    def test_stream_jsonl_projects_columns(self, tmp_path: Path) -> None:
+        """Only the requested keys are kept, in the requested order."""
+        path = tmp_path / "wide.jsonl"
+        path.write_text('{"a": 1, "b": 2, "c": 3}\n{"c": 4}\n', encoding="utf-8")
+        with LocalFileProvider(file_path=path, columns=["c", "a"]) as provider:
+            records = list(provider.stream_records())
+        assert records == [{"c": 3, "a": 1}, {"c": 4}]
+        assert list(records[0]) == ["c", "a"]
+
+    def test_stream_records_honours_non_utf8_encoding(self, tmp_path: Path) -> None:
+        path = tmp_path / "latin1.jsonl"
+        path.write_bytes('{"name": "José"}\n'.encode("latin-1"))
+        with LocalFileProvider(file_path=path, encoding="latin-1") as provider:
+            records = list(provider.stream_records())
+        assert records == [{"name": "José"}]
+
+    @pytest.mark.parametrize("encoding", ["utf-8", "latin-1"])
+    def test_stream_jsonl_lines_spanning_read_chunks(
+        self,
+        tmp_path: Path,
+        monkeypatch: pytest.MonkeyPatch,
+        encoding: str,
+    ) -> None:
+        """Lines split across read chunks are reassembled with correct numbering."""
+        monkeypatch.setattr(local_file, "_JSONL_CHUNK_SIZE", 5)
+        path = tmp_path / "chunks.jsonl"
+        path.write_text(
+            '{"id": 1, "name": "Zoë"}\n\n{bad\n{"id": 2}',
+            encoding=encoding,
+        )
+        with LocalFileProvider(file_path=path, encoding=encoding) as provider:
+            records = list(provider.stream_records())
+            meta = provider.fetch_metadata()
+        assert records == [{"id": 1, "name": "Zoë"}, {"id": 2}]
+        assert meta["records_quarantined"] == 1
+
 
 # -- stream_records() CSV --------------------------------------------------
 
@@ -350,6 +462,14 @@ class TestLocalFileProviderStreamCSV:
         assert records[0]["name"] == "Alice"
         assert records[1]["name"] == "Bob"
 
+    def test_stream_records_csv_keeps_partially_empty_rows(self, tmp_path: Path) -> None:
+        """A row with any non-blank cell is yielded."""
+        path = tmp_path / "partial.csv"
+        path.write_text("name,age\n,30\n \t,\n", encoding="utf-8")
+        with LocalFileProvider(file_path=path) as provider:
+            records = list(provider.stream_records())
+        assert records == [{"name": "", "age": "30"}]
+
     def test_csv_format_no_longer_raises_not_implemented(
         self,
         tmp_csv_path: Path,
@@ -372,6 +492,119 @@ class TestLocalFileProviderStreamCSV:
         assert any(r.get("name") == "Alice" for r in records)
         assert any(r.get("name") == "Bob" for r in records)
 
+    def test_stream_csv_matches_dictreader_for_ragged_rows(self, tmp_path: Path) -> None:
+        """Short and long rows are keyed exactly as csv.DictReader keys them."""
+        path = tmp_path / "ragged.csv"
+        content = "name,age,city\nAlice,30\nBob,25,Chicago,extra\n"
+        path.write_text(content, encoding="utf-8")
+        with LocalFileProvider(file_path=path) as provider:
+            records = list(provider.stream_records())
+        with path.open(newline="", encoding="utf-8") as fh:
+            expected = [dict(row) for row in csv.DictReader(fh)]
+        assert records == expected
+
+    def test_stream_csv_quarantines_reader_errors(self, tmp_path: Path) -> None:
+        """Rows the csv module rejects are quarantined and streaming continues."""
+        path = tmp_path / "oversized.csv"
+        path.write_text("a,b\n1,2\n" + "x" * 50 + ",3\n4,5\n", encoding="utf-8")
+        previous_limit = csv.field_size_limit(20)
+        try:
+            with LocalFileProvider(file_path=path) as provider:
+                records = list(provider.stream_records())
+                meta = provider.fetch_metadata()
+        finally:
+            csv.field_size_limit(previous_limit)
+        assert records == [{"a": "1", "b": "2"}, {"a": "4", "b": "5"}]
+        assert meta["records_quarantined"] == 1
+
+    def test_reuse_row_yields_one_dict_updated_in_place(self, tmp_path: Path) -> None:
+        """reuse_row yields the same dict, with ragged-row keys kept correct."""
+        path = tmp_path / "reuse.csv"
+        path.write_text("name,age\nAlice,30\nBob,25,extra\nCarol\nDan,40\n", encoding="utf-8")
+        with LocalFileProvider(file_path=path, reuse_row=True) as provider:
+            seen = [(id(record), dict(record)) for record in provider.stream_records()]
+        assert len({record_id for record_id, _ in seen}) == 1
+        with LocalFileProvider(file_path=path) as provider:
+            expected = list(provider.stream_records())
+        assert [record for _, record in seen] == expected
+
+    def test_reuse_row_with_projection(self, tmp_path: Path) -> None:
+        path = tmp_path / "reuse.csv"
+        path.write_text("name,age\nAlice,30\nBob\n", encoding="utf-8")
+        with LocalFileProvider(file_path=path, reuse_row=True, columns=["age"]) as provider:
+            records = [dict(record) for record in provider.stream_records()]
+        assert records == [{"age": "30"}, {"age": None}]
+
+    @pytest.mark.parametrize("columns", [None, ["b"]])
+    def test_reuse_row_stream_batches_yields_distinct_rows(
+        self,
+        tmp_path: Path,
+        columns: list[str] | None,
+    ) -> None:
+        path = tmp_path / "reuse.csv"
+        path.write_text("a,b\n1,2\n3,4\n5,6\n", encoding="utf-8")
+        with LocalFileProvider(file_path=path, columns=columns) as provider:
+            expected = list(provider.stream_records())
+        with LocalFileProvider(file_path=path, reuse_row=True, columns=columns) as provider:
+            batches = list(provider.stream_batches(size=2))
+        assert batches == [expected[:2], expected[2:]]
+
+    @pytest.mark.parametrize("csv_engine", ["python", "pyarrow"])
+    def test_stream_csv_projects_columns(
+        self,
+        tmp_path: Path,
+        csv_engine: Literal["python", "pyarrow"],
+    ) -> None:
+        """Only requested, present columns are kept; blank-cell rows still count."""
+        if csv_engine == "pyarrow":
+            pytest.importorskip("pyarrow")
+        path = tmp_path / "wide.csv"
+        path.write_text("name,age,city\nAlice,30,Portland\n,,Chicago\n", encoding="utf-8")
+        with LocalFileProvider(
+            file_path=path,
+            csv_engine=csv_engine,
+            columns=["city", "name", "missing"],
+        ) as provider:
+            records = list(provider.stream_records())
+        assert records == [{"city": "Portland", "name": "Alice"}, {"city": "Chicago", "name": ""}]
+
+    def test_pyarrow_engine_matches_python_engine(self, tmp_csv_path: Path) -> None:
+        """The pyarrow engine yields the same string-valued rows."""
+        pytest.importorskip("pyarrow")
+        with LocalFileProvider(file_path=tmp_csv_path) as provider:
+            expected = list(provider.stream_records())
+        with LocalFileProvider(file_path=tmp_csv_path, csv_engine="pyarrow") as provider:
+            records = list(provider.stream_records())
+            meta = provider.fetch_metadata()
+        assert records == expected
+        assert meta["record_count"] == len(expected)
+
+    def test_pyarrow_engine_reads_multiline_quoted_values(self, tmp_path: Path) -> None:
+        """Quoted values spanning lines parse across block boundaries."""
+        pytest.importorskip("pyarrow")
+        path = tmp_path / "addresses.csv"
+        rows = [(str(i), f"{i} Main St\nApt {i}\nPortland, OR") for i in range(40_000)]
+        with path.open("w", newline="", encoding="utf-8") as fh:
+            writer = csv.writer(fh)
+            writer.writerow(["id", "address"])
+            writer.writerows(rows)
+        assert path.stat().st_size > local_file._CSV_ARROW_BLOCK_SIZE
+
+        with LocalFileProvider(file_path=path, csv_engine="pyarrow") as provider:
+            records = list(provider.stream_records())
+        assert records == [{"id": i, "address": address} for i, address in rows]
+
+    def test_pyarrow_engine_quarantines_ragged_rows(self, tmp_path: Path) -> None:
+        """Rows with the wrong field count are quarantined, blank rows skipped."""
+        pytest.importorskip("pyarrow")
+        path = tmp_path / "ragged.csv"
+        path.write_text('name,age\nAlice,30\n  ,  \nBob\n"Carol",""\n', encoding="utf-8")
+        with LocalFileProvider(file_path=path, csv_engine="pyarrow") as provider:
+            records = list(provider.stream_records())
+            meta = provider.fetch_metadata()
+        assert records == [{"name": "Alice", "age": "30"}, {"name": "Carol", "age": ""}]
+        assert meta["records_quarantined"] == 1
+
 
 # -- stream_records() unsupported formats ----------------------------------
 
@@ -477,6 +710,119 @@ class TestLocalFileProviderStreamParquet:
         assert meta["record_count"] == 5
         assert meta["format"] == "parquet"
 
+    def test_stream_records_parquet_spans_conversion_slices(
+        self,
+        tmp_path: Path,
+    ) -> None:
+        """Rows are yielded in order across to_pylist() slice boundaries."""
+        pa = pytest.importorskip("pyarrow")
+        pq = pytest.importorskip("pyarrow.parquet")
+        total = _PARQUET_SLICE_ROWS * 2 + 3
+        path = tmp_path / "many.parquet"
+        pq.write_table(pa.table({"id": list(range(total))}), path)
+
+        with LocalFileProvider(file_path=path) as provider:
+            ids = [record["id"] for record in provider.stream_records()]
+        assert ids == list(range(total))
+
+    def test_stream_records_parquet_honours_batch_size(
+        self,
+        tmp_path: Path,
+    ) -> None:
+        """A small batch_size still yields every row exactly once, in order."""
+        pa = pytest.importorskip("pyarrow")
+        pq = pytest.importorskip("pyarrow.parquet")
+        path = tmp_path / "small_batches.parquet"
+        pq.write_table(pa.table({"id": list(range(20))}), path, row_group_size=6)
+
+        with LocalFileProvider(file_path=path, batch_size=7) as provider:
+            ids = [record["id"] for record in provider.stream_records()]
+        assert ids == list(range(20))
+
+    def test_stream_arrow_batches_yields_record_batches(
+        self,
+        tmp_path: Path,
+    ) -> None:
+        """stream_arrow_batches() yields Arrow batches without building dicts."""
+        pa = pytest.importorskip("pyarrow")
+        pq = pytest.importorskip("pyarrow.parquet")
+        path = tmp_path / "columnar.parquet"
+        pq.write_table(pa.table({"id": list(range(10))}), path)
+
+        with LocalFileProvider(file_path=path) as provider:
+            batches = list(provider.stream_arrow_batches(batch_size=4))
+        assert all(isinstance(batch, pa.RecordBatch) for batch in batches)
+        assert [batch.num_rows for batch in batches] == [4, 4, 2]
+        assert pa.Table.from_batches(batches).column("id").to_pylist() == list(range(10))
+
+    def test_stream_records_parquet_single_threaded(self, tmp_path: Path) -> None:
+        """use_threads=False decodes the same rows."""
+        pa = pytest.importorskip("pyarrow")
+        pq = pytest.importorskip("pyarrow.parquet")
+        path = tmp_path / "single.parquet"
+        pq.write_table(pa.table({"id": list(range(50))}), path, row_group_size=10)
+
+        with LocalFileProvider(file_path=path, use_threads=False) as provider:
+            ids = [record["id"] for record in provider.stream_records()]
+        assert ids == list(range(50))
+
+    def test_stream_arrow_batches_closed_early_stops_prefetch(self, tmp_path: Path) -> None:
+        """Abandoning the batch stream shuts the read-ahead thread down."""
+        pa = pytest.importorskip("pyarrow")
+        pq = pytest.importorskip("pyarrow.parquet")
+        path = tmp_path / "prefetch.parquet"
+        pq.write_table(pa.table({"id": list(range(100))}), path)
+
+        with LocalFileProvider(file_path=path) as provider:
+            batches = provider.stream_arrow_batches(batch_size=10)
+            assert next(batches).num_rows == 10
+            batches.close()
+        assert not any(
+            thread.name.startswith("cecil-parquet-prefetch") for thread in threading.enumerate()
+        )
+
+    def test_stream_records_parquet_projects_columns(self, tmp_path: Path) -> None:
+        """Only requested columns are read, in the requested order."""
+        pa = pytest.importorskip("pyarrow")
+        pq = pytest.importorskip("pyarrow.parquet")
+        path = tmp_path / "wide.parquet"
+        pq.write_table(pa.table({"a": [1, 2], "b": ["x", "y"], "c": [True, False]}), path)
+
+        with LocalFileProvider(file_path=path, columns=["c", "a", "missing"]) as provider:
+            records = list(provider.stream_records())
+            batch = next(provider.stream_arrow_batches())
+        assert records == [{"c": True, "a": 1}, {"c": False, "a": 2}]
+        assert batch.schema.names == ["c", "a"]
+
+    def test_stream_batches_parquet_yields_row_lists(self, tmp_path: Path) -> None:
+        """stream_batches() yields lists of row dicts straight from Arrow batches."""
+        pa = pytest.importorskip("pyarrow")
+        pq = pytest.importorskip("pyarrow.parquet")
+        path = tmp_path / "batches.parquet"
+        pq.write_table(pa.table({"id": list(range(10))}), path)
+
+        with LocalFileProvider(file_path=path) as provider:
+            batches = list(provider.stream_batches(4))
+            meta = provider.fetch_metadata()
+        assert [len(batch) for batch in batches] == [4, 4, 2]
+        assert batches[2] == [{"id": 8}, {"id": 9}]
+        assert meta["record_count"] == 10
+
+    def test_stream_batches_jsonl_uses_record_stream(self, tmp_jsonl_path: Path) -> None:
+        with LocalFileProvider(file_path=tmp_jsonl_path) as provider:
+            batches = list(provider.stream_batches(2))
+        assert [len(batch) for batch in batches] == [2, 2, 1]
+
+    def test_stream_arrow_batches_rejects_text_formats(
+        self,
+        tmp_jsonl_path: Path,
+    ) -> None:
+        with (
+            LocalFileProvider(file_path=tmp_jsonl_path) as provider,
+            pytest.raises(NotImplementedError, match="Parquet"),
+        ):
+            next(provider.stream_arrow_batches())
+
 
 # -- Quarantine logging ----------------------------------------------------
 
@@ -509,6 +855,32 @@ class TestLocalFileProviderQuarantine:
         assert "timestamp" in entry
         assert entry["source_file"] == str(malformed_jsonl_path)
 
+    def test_quarantine_entries_flushed_on_close(self, tmp_path: Path) -> None:
+        """Buffered quarantine entries all reach the log once closed."""
+        path = tmp_path / "many_bad.jsonl"
+        path.write_text('{"id": 1}\n' + "{bad\n" * 1500, encoding="utf-8")
+        quarantine = tmp_path / "quarantine.jsonl"
+
+        with LocalFileProvider(file_path=path, quarantine_path=quarantine) as provider:
+            assert list(provider.stream_records()) == [{"id": 1}]
+
+        lines = quarantine.read_text(encoding="utf-8").splitlines()
+        assert len(lines) == 1500
+        assert json.loads(lines[-1])["line_number"] == 1501
+
+    def test_quarantine_entry_escapes_source_path(self, tmp_path: Path) -> None:
+        """Quote characters in the source path still yield valid JSON."""
+        path = tmp_path / 'odd "name".jsonl'
+        path.write_text('{"id": 1}\n{bad\n', encoding="utf-8")
+        quarantine = tmp_path / "quarantine.jsonl"
+
+        with LocalFileProvider(file_path=path, quarantine_path=quarantine) as provider:
+            list(provider.stream_records())
+
+        entry = json.loads(quarantine.read_text(encoding="utf-8"))
+        assert entry["source_file"] == str(path)
+        assert entry["line_number"] == 2
+
     def test_stream_jsonl_quarantine_no_pii(
         self,
         tmp_path: Path,
@@ -627,6 +999,28 @@ class TestLocalFileProviderFetchMetadata:
             meta = provider.fetch_metadata()
         assert meta["record_count"] == 5
 
+    def test_metadata_record_count_after_closing_stream_early(
+        self,
+        tmp_jsonl_path: Path,
+        tmp_csv_path: Path,
+    ) -> None:
+        for path in (tmp_jsonl_path, tmp_csv_path):
+            with LocalFileProvider(file_path=path) as provider:
+                stream = provider.stream_records()
+                next(stream)
+                next(stream)
+                stream.close()
+                meta = provider.fetch_metadata()
+            assert meta["record_count"] == 2
+
+    def test_metadata_reuses_size_from_connect(self, tmp_jsonl_path: Path) -> None:
+        """After connect() the size comes from its stat, not a new one."""
+        with LocalFileProvider(file_path=tmp_jsonl_path) as provider:
+            size = tmp_jsonl_path.stat().st_size
+            tmp_jsonl_path.unlink()
+            meta = provider.fetch_metadata()
+        assert meta["file_size_bytes"] == size
+
     def test_metadata_file_size_none_for_missing_file(
         self,
         tmp_path: Path,
@@ -9,6 +9,8 @@ from __future__ import annotations
 
 import hashlib
 
+import pytest
+
 from cecil.core.sanitizer.actions import (
     apply_action,
     apply_hash,
@@ -38,6 +40,11 @@ class TestApplyRedact:
         result = apply_redact("", "email")
         assert result == "[EMAIL_REDACTED]"
 
+    def test_apply_redact_reuses_placeholder_per_field(self) -> None:
+        first = apply_redact("alice@example.com", "contact_email")
+        second = apply_redact("bob@example.com", "contact_email")
+        assert first is second
+
 
 # -- apply_mask --------------------------------------------------------------
 
@@ -73,6 +80,14 @@ class TestApplyMask:
         result = apply_mask("abcde")
         assert result == "a***e"
 
+    def test_apply_mask_email_with_empty_local_part(self) -> None:
+        result = apply_mask("@example.com")
+        assert result == "***@example.com"
+
+    def test_apply_mask_email_splits_on_first_at_sign(self) -> None:
+        result = apply_mask("a@b@example.com")
+        assert result == "a***@b@example.com"
+
 
 # -- apply_hash --------------------------------------------------------------
 
@@ -107,6 +122,11 @@ class TestApplyHash:
         expected = hashlib.sha256(b"").hexdigest()[:16]
         assert result == f"hash_{expected}"
 
+    def test_apply_hash_repeated_value_matches_fresh_digest(self) -> None:
+        value = "repeat@example.com"
+        expected = hashlib.sha256(value.encode("utf-8")).hexdigest()[:16]
+        assert apply_hash(value) == apply_hash(value) == f"hash_{expected}"
+
 
 # -- apply_keep --------------------------------------------------------------
 
@@ -162,6 +182,10 @@ class TestApplyAction:
         )
         assert result == "gpt-4"
 
+    @pytest.mark.parametrize("action", list(RedactionAction))
+    def test_apply_action_handles_every_action(self, action: RedactionAction) -> None:
+        assert isinstance(apply_action("value", action, field_name="field"), str)
+
     def test_apply_action_mask_with_options(self) -> None:
         result = apply_action(
             "john@example.com",
@@ -9,6 +9,7 @@ from __future__ import annotations
 
 import logging
 from collections.abc import Generator
+from datetime import UTC
 from typing import Any
 
 import pytest
@@ -154,6 +155,19 @@ class TestProcessStreamBasic:
         results = list(engine.process_stream(records))
         assert results == []
 
+    def test_clean_record_data_is_a_copy(self, engine: SanitizationEngine) -> None:
+        record = {"model": "gpt-4"}
+        result = next(engine.process_stream(_make_records([record])))
+        assert result.data == record
+        assert result.data is not record
+
+    def test_redacted_record_keeps_field_order(self, engine: SanitizationEngine) -> None:
+        record = {"model": "gpt-4", "email": "a@b.com", "extra": 1}
+        result = next(engine.process_stream(_make_records([record])))
+        assert list(result.data) == ["model", "email", "extra"]
+        assert result.data["email"] == "[EMAIL_REDACTED]"
+        assert record["email"] == "a@b.com"
+
 
 # -- process_stream: field redaction -----------------------------------------
 
@@ -230,6 +244,29 @@ class TestProcessStreamAudit:
         result = next(engine.process_stream(records))
         assert result.audit.timestamp is not None
 
+    def test_audit_timestamp_shared_within_granularity(
+        self,
+        strict_strategy: StrictStrategy,
+    ) -> None:
+        engine = SanitizationEngine(strict_strategy, timestamp_granularity_s=3600.0)
+        records = _make_records([{"email": "a@b.com"}, {"email": "c@d.com"}])
+        results = list(engine.process_stream(records))
+        assert results[0].audit.timestamp is results[1].audit.timestamp
+        assert results[0].audit.timestamp.tzinfo is UTC
+
+    def test_zero_granularity_stamps_every_record(
+        self,
+        strict_strategy: StrictStrategy,
+    ) -> None:
+        engine = SanitizationEngine(strict_strategy, timestamp_granularity_s=0)
+        records = _make_records([{"email": "a@b.com"}, {"email": "c@d.com"}])
+        results = list(engine.process_stream(records))
+        assert results[0].audit.timestamp is not results[1].audit.timestamp
+
+    def test_negative_granularity_raises(self, strict_strategy: StrictStrategy) -> None:
+        with pytest.raises(ValueError, match="timestamp_granularity_s"):
+            SanitizationEngine(strict_strategy, timestamp_granularity_s=-1.0)
+
     def test_audit_tracks_redacted_fields(
         self,
         engine: SanitizationEngine,
@@ -512,6 +549,10 @@ class TestEntityTypeToAction:
         result = SanitizationEngine._entity_type_to_action("SENSITIVE_KEY")
         assert result is RedactionAction.REDACT
 
+    @pytest.mark.parametrize("action", list(RedactionAction))
+    def test_every_action_name_maps_to_itself(self, action: RedactionAction) -> None:
+        assert SanitizationEngine._entity_type_to_action(action.name) is action
+
 
 class TestResetCounters:
     """Tests for counter reset functionality."""
@@ -162,6 +162,16 @@ class TestFieldRedaction:
         with pytest.raises(AttributeError):
             fr.count = 5  # type: ignore[misc]
 
+    def test_field_redaction_has_no_instance_dict(self) -> None:
+        """FieldRedaction uses __slots__, so instances carry no __dict__."""
+        fr = FieldRedaction(
+            field_name="email",
+            action=RedactionAction.REDACT,
+            entity_type="EMAIL",
+            count=1,
+        )
+        assert not hasattr(fr, "__dict__")
+
 
 # -- RedactionAudit dataclass ------------------------------------------------
 
@@ -0,0 +1,44 @@
+"""Tests for the lazy re-exports in ``cecil.core.sanitizer``.
+
+Covers: resolution of every name in ``__all__``, identity with the
+defining submodule, unknown attributes, and that importing one submodule
+does not load the rest of the package.
+"""
+
+from __future__ import annotations
+
+import subprocess
+import sys
+
+import pytest
+
+import cecil.core.sanitizer as sanitizer
+from cecil.core.sanitizer import engine, models
+
+
+class TestLazyExports:
+    """Tests for the PEP 562 module ``__getattr__``."""
+
+    @pytest.mark.parametrize("name", sanitizer.__all__)
+    def test_every_exported_name_resolves(self, name: str) -> None:
+        assert getattr(sanitizer, name) is not None
+
+    def test_export_is_the_submodule_object(self) -> None:
+        assert sanitizer.SanitizationEngine is engine.SanitizationEngine
+        assert sanitizer.FieldMapping is models.FieldMapping
+
+    def test_unknown_attribute_raises_attribute_error(self) -> None:
+        with pytest.raises(AttributeError, match="no_such_name"):
+            _ = sanitizer.no_such_name
+
+    def test_dir_lists_exports(self) -> None:
+        assert set(sanitizer.__all__) <= set(dir(sanitizer))
+
+    def test_importing_models_does_not_load_engine(self) -> None:
+        code = (
+            "import sys\n"
+            "import cecil.core.sanitizer.models\n"
+            "assert 'cecil.core.sanitizer.engine' not in sys.modules\n"
+            "assert 'cecil.core.sanitizer.strategies' not in sys.modules\n"
+        )
+        subprocess.run([sys.executable, "-c", code], check=True)  # noqa: S603
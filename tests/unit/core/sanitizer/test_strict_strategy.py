@@ -11,6 +11,7 @@ import hashlib
 
 import pytest
 
+from cecil.core.sanitizer import strategies
 from cecil.core.sanitizer.models import (
     FieldMapping,
     FieldMappingEntry,
@@ -710,6 +711,32 @@ class TestStrictStrategyWithMappingConfig:
         expected = hashlib.sha256(value.encode("utf-8")).hexdigest()[:16]
         assert r1 == f"hash_{expected}"
 
+    def test_config_hash_memo_is_per_strategy(self) -> None:
+        """Each strategy keeps its own hash memo; others never see its values."""
+        config = self._make_config(
+            {"session_id": FieldMappingEntry(action=RedactionAction.HASH)},
+        )
+        first = StrictStrategy(config=config)
+        second = StrictStrategy(config=config)
+        value = "sess-abc-123"
+        first.redact(value, first.scan_value("session_id", value))
+        assert value in first._hash_tokens
+        assert second._hash_tokens == {}
+
+    def test_config_hash_memo_is_bounded(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """The memo never grows past _HASH_MEMO_SIZE and stays correct."""
+        monkeypatch.setattr(strategies, "_HASH_MEMO_SIZE", 2)
+        config = self._make_config(
+            {"session_id": FieldMappingEntry(action=RedactionAction.HASH)},
+        )
+        s = StrictStrategy(config=config)
+        for i in range(5):
+            value = f"sess-{i}"
+            result = s.redact(value, s.scan_value("session_id", value))
+            expected = hashlib.sha256(value.encode("utf-8")).hexdigest()[:16]
+            assert result == f"hash_{expected}"
+            assert len(s._hash_tokens) <= 2
+
     def test_config_unmapped_field_gets_default_action(self) -> None:
         """Unmapped fields use config.default_action (default: REDACT)."""
         config = self._make_config(
@@ -123,6 +123,13 @@ class TestGetResourcePath:
 class TestGetUiDistPath:
     """Tests for the get_ui_dist_path() convenience function."""
 
+    @pytest.fixture(autouse=True)
+    def _clear_cache(self):
+        """Isolate each test from paths cached by earlier calls."""
+        get_ui_dist_path.cache_clear()
+        yield
+        get_ui_dist_path.cache_clear()
+
     def test_raises_when_ui_dist_missing(self):
         """Should raise FileNotFoundError when ui_dist/ does not exist.
 
@@ -146,6 +153,16 @@ class TestGetUiDistPath:
         assert path == ui_dist
         assert path.is_dir()
 
+    def test_caches_resolved_path(self, monkeypatch, tmp_path):
+        """Should resolve ui_dist once and reuse the result."""
+        (tmp_path / "ui_dist").mkdir()
+        monkeypatch.setattr(sys, "frozen", True, raising=False)
+        monkeypatch.setattr(sys, "_MEIPASS", str(tmp_path), raising=False)
+
+        first = get_ui_dist_path()
+        monkeypatch.delattr(sys, "_MEIPASS")
+        assert get_ui_dist_path() is first
+
 
 # ── Import re-exports ───────────────────────────────────────────────────
 